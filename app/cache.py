@@ -0,0 +1,106 @@
+"""
+Process-local caching utilities for AI Legal Contract Analyst.
+
+This module provides a small thread-safe TTL cache used by the CRUD layer to
+skip repeated database lookups for data that rarely changes between requests
+(e.g., the latest stored analysis for a contract).
+
+Usage:
+    from app.cache import TTLCache
+
+    cache = TTLCache(maxsize=1024, ttl=60)
+    cache.set(("contract", 1), 42)
+    value = cache.get(("contract", 1))  # 42, or None once expired
+    cache.invalidate(("contract", 1))
+
+Scope:
+    - Entries live in the memory of a single process; each worker process has
+      its own cache, so TTLs should stay short enough that cross-process
+      staleness is acceptable
+    - FastAPI runs sync endpoints in a threadpool, so all operations take a lock
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    Expired entries are dropped lazily on access; when the cache is full the
+    least recently used entry is evicted.
+
+    Attributes:
+        maxsize: Maximum number of entries kept
+        ttl: Seconds an entry stays valid after it is set
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value under key, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache (None is not cacheable; it reads as a miss)
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove key from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Remove every entry whose key matches predicate.
+
+        Args:
+            predicate: Function called with each key; True removes the entry
+        """
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
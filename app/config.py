@@ -10,6 +10,13 @@ Usage:
     settings = get_settings()
     api_key = settings.openai_api_key
     db_url = settings.database_url
+
+Load cost:
+    Settings are parsed exactly once per process (get_settings is cached and
+    warmed when app.database is imported), so the .env read and pydantic
+    validation add a few milliseconds to startup and nothing to requests.
+    pydantic-settings is kept rather than a hand-rolled or msgspec-based
+    loader so env aliases, type coercion and validation errors stay uniform.
 """
 
 from functools import lru_cache
@@ -17,6 +24,12 @@ from functools import lru_cache
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Embedding vector length, fixed by the schema rather than the environment:
+# requested from the embeddings API (`dimensions`) and used for the
+# clauses.embedding / embedding_cache.embedding column types. Kept here so
+# app.db_init and app.models can read it without importing the OpenAI client.
+EMBEDDING_DIMENSIONS = 768
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -33,6 +46,37 @@ class Settings(BaseSettings):
         description="PostgreSQL connection string with pgvector support"
     )
 
+    # Database Connection Pool Configuration
+    db_pool_size: int = Field(
+        default=20,
+        description="Number of persistent connections kept in the SQLAlchemy pool"
+    )
+
+    db_max_overflow: int = Field(
+        default=30,
+        description="Additional connections allowed above db_pool_size under load"
+    )
+
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are recycled (-1 disables)"
+    )
+
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Verify pooled connections with a lightweight ping before use"
+    )
+
+    db_pool_timeout: int = Field(
+        default=10,
+        description="Seconds to wait for a free pooled connection before raising TimeoutError"
+    )
+
+    db_statement_timeout_ms: int = Field(
+        default=30000,
+        description="Server-side statement_timeout in milliseconds for app connections (0 disables)"
+    )
+
     # Application Configuration
     environment: str = Field(
         default="development",
@@ -57,7 +101,8 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
-        case_sensitive=False
+        case_sensitive=False,
+        frozen=True  # Immutable and hashable: safe to share across worker threads
     )
 
 
@@ -69,6 +114,10 @@ def get_settings() -> Settings:
     Uses lru_cache to ensure Settings is instantiated only once,
     preventing import-time failures and improving performance.
 
+    The cache is warmed when app.database builds the engine at import
+    time, so the .env read and pydantic validation never run on a
+    request path; handlers calling get_settings() get the cached instance.
+
     Returns:
         Settings: Cached application settings instance
     """
@@ -12,19 +12,127 @@ Error handling notes:
 - Callers should wrap CRUD operations in try/except blocks as needed
 """
 
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple, Union
+from sqlalchemy.orm import Session, defer, raiseload, selectinload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import func
-from app.models import Contract, Clause, Entity, Summary, RiskAssessment, QAHistory
+from sqlalchemy import Text, bindparam, cast, delete, event, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from app.cache import TTLCache
+from app.config import EMBEDDING_DIMENSIONS, get_settings
+from app.models import (
+    Contract, Clause, Entity, Summary, RiskAssessment, QAHistory, EmbeddingCache
+)
 from app.services.embeddings import generate_embeddings_batch
+from app.services.risk_analyzer import RISK_LEVELS, RISK_TYPES
+import functools
+import hashlib
+import io
 import json
 import logging
+import queue
+import threading
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Prebuilt Statements
+# ============================================================================
+# Hot read paths reuse these module-level select() constructs so each call
+# only binds parameters; statement construction and SQL compilation happen
+# once per process (the compiled form lives in the engine's statement cache).
+
+# In development, list getters whose rows are returned to API handlers refuse
+# lazy relationship loads (raiseload), so an accidental N+1 in a serializer
+# fails loudly instead of issuing one SELECT per row. Production keeps the
+# default lazy loading.
+_STRICT_LOADING = get_settings().environment == "development"
+
+
+def _strict(stmt):
+    """Apply raiseload('*') to a prebuilt select when strict loading is on."""
+    return stmt.options(raiseload('*')) if _STRICT_LOADING else stmt
+
+
+# Newest fully processed upload of the same text (ix_contracts_content_hash)
+_COMPLETED_CONTRACT_BY_HASH_STMT = select(Contract).where(
+    Contract.content_hash == bindparam("content_hash"),
+    Contract.status == 'completed'
+).order_by(Contract.id.desc()).limit(1)
+
+_CLAUSES_BY_CONTRACT_STMT = select(Clause).where(
+    Clause.contract_id == bindparam("contract_id")
+)
+
+_ENTITIES_BY_CONTRACT_STMT = select(Entity).where(
+    Entity.contract_id == bindparam("contract_id")
+)
+
+_ENTITIES_BY_TYPE_STMT = select(Entity).where(
+    Entity.contract_id == bindparam("contract_id"),
+    Entity.entity_type == bindparam("entity_type")
+)
+
+_SUMMARIES_BY_CONTRACT_STMT = _strict(select(Summary).where(
+    Summary.contract_id == bindparam("contract_id")
+).order_by(Summary.created_at.desc()))
+
+_SUMMARIES_BY_TYPE_STMT = _strict(select(Summary).where(
+    Summary.contract_id == bindparam("contract_id"),
+    Summary.summary_type == bindparam("summary_type")
+).order_by(Summary.created_at.desc()))
+
+_LATEST_SUMMARY_STMT = _SUMMARIES_BY_TYPE_STMT.limit(1)
+
+_LATEST_ROLE_SUMMARY_STMT = _SUMMARIES_BY_TYPE_STMT.where(
+    Summary.role == bindparam("role")
+).limit(1)
+
+_CONTRACT_SUMMARIES_STMT = _strict(select(Summary).where(
+    Summary.contract_id == bindparam("contract_id"),
+    Summary.summary_type.in_(['contract_overview', 'role_specific'])
+).order_by(Summary.created_at.desc()))
+
+# Severity first (generated rank: high=3, medium=2, low=1), newest first within
+# a level; matches ix_risk_assessments_contract_rank_assessed
+_RISK_ORDER = (RiskAssessment.risk_level_rank.desc(), RiskAssessment.assessed_at.desc())
+
+_RISKS_BY_CONTRACT_STMT = _strict(select(RiskAssessment).where(
+    RiskAssessment.contract_id == bindparam("contract_id")
+).order_by(*_RISK_ORDER))
+
+# Single level: the rank is constant, so only recency orders the rows; served
+# as a range scan of ix_risk_assessments_contract_risk_assessed
+_RISKS_BY_LEVEL_STMT = _strict(select(RiskAssessment).where(
+    RiskAssessment.contract_id == bindparam("contract_id"),
+    RiskAssessment.risk_level == bindparam("risk_level")
+).order_by(RiskAssessment.assessed_at.desc()))
+
+_RISKS_BY_CLAUSE_STMT = _strict(select(RiskAssessment).where(
+    RiskAssessment.clause_id == bindparam("clause_id")
+).order_by(RiskAssessment.risk_level_rank.desc()))
+
+_QA_HISTORY_STMT = _strict(select(QAHistory).where(
+    QAHistory.contract_id == bindparam("contract_id")
+).order_by(QAHistory.asked_at.desc()).limit(bindparam("limit")))
+
+# Rows fetched per DBAPI round-trip when list helpers are called with stream=True
+STREAM_BATCH_SIZE = 500
+
+# (contract_id, summary_type) -> primary key of the latest Summary of that type,
+# and (contract_id, summary_type, role) -> latest role-specific summary. Lets
+# get_latest_summary / get_contract_summary replace the ORDER BY ... LIMIT 1
+# lookup with a PK get; invalidated by the summary create/delete helpers below.
+_latest_summary_ids = TTLCache(maxsize=1024, ttl=60)
+
+
 # ============================================================================
 # Custom Exceptions
 # ============================================================================
@@ -41,16 +149,358 @@ class DuplicateClauseError(ValueError):
     pass
 
 
+def _violated_constraint(error: IntegrityError) -> Optional[str]:
+    """
+    Return the name of the constraint behind an IntegrityError, if known.
+
+    Reads the structured diagnostics psycopg exposes on the DBAPI exception
+    (`e.orig.diag.constraint_name`) instead of searching the rendered error
+    message, which also avoids serializing bind parameters via str(e).
+
+    Args:
+        error: IntegrityError raised by SQLAlchemy
+
+    Returns:
+        Constraint name, or None if the driver does not provide diagnostics
+    """
+    diag = getattr(error.orig, "diag", None)
+    return getattr(diag, "constraint_name", None)
+
+
+def _dumps_json(data: Any, indent: bool = False) -> str:
+    """
+    Serialize data to a JSON string for TEXT columns.
+
+    Uses orjson when installed (several times faster than the stdlib encoder)
+    and falls back to json otherwise. Output is valid JSON either way; without
+    indent it is compact (no whitespace between tokens, non-ASCII kept as-is).
+
+    Args:
+        data: JSON-serializable value
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as str
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _loads_json(content: str) -> Any:
+    """
+    Parse a JSON document stored in a TEXT column.
+
+    Uses orjson when installed, json otherwise. Both raise an exception
+    derived from json.JSONDecodeError on malformed input, so callers can
+    catch that type regardless of the backend.
+
+    Args:
+        content: JSON document
+
+    Returns:
+        Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_summary_content(summary_id: int, content: str) -> Any:
+    """
+    Parse a summary's JSON text, memoized per process.
+
+    Summary rows are never updated after insert, so (summary_id, content)
+    identifies a parsed document for the life of the process; repeat views of
+    the same cached summary skip the JSON decode. Parse errors propagate and
+    are not cached.
+
+    Args:
+        summary_id: Summary primary key
+        content: JSON text from Summary.content
+
+    Returns:
+        Parsed JSON value. The object is shared between callers and must be
+        treated as read-only.
+    """
+    return _loads_json(content)
+
+
+def _detach(db: Session, rows):
+    """
+    Expunge fetched objects from the session's identity map.
+
+    Long-lived sessions (background jobs, scripts) otherwise keep every row
+    they have ever loaded. Expunge cascades along relationships configured
+    with cascade="all", so eagerly loaded children are detached as well.
+    Unloaded lazy attributes cannot be accessed on detached objects.
+
+    Args:
+        db: Database session
+        rows: Sequence of ORM objects returned by a query
+
+    Returns:
+        The same rows, now detached
+    """
+    for row in rows:
+        db.expunge(row)
+    return rows
+
+
+# Canonical risk labels, keyed by the spellings callers usually send, so the
+# common case is one dict lookup instead of strip() + lower() allocations
+_RISK_LABELS: Dict[str, str] = {
+    variant: label
+    for label in (*RISK_LEVELS, *RISK_TYPES)
+    for variant in (label, label.upper(), label.capitalize())
+}
+
+
+def _normalize_risk_label(value: Optional[str]) -> Optional[str]:
+    """
+    Trim and lowercase a risk_type / risk_level value.
+
+    Known labels resolve through _RISK_LABELS; anything else falls back to
+    strip().lower(). Falsy values are returned unchanged.
+
+    Args:
+        value: Raw label from the caller or the risk analyzer
+
+    Returns:
+        Normalized label
+    """
+    if not value:
+        return value
+    normalized = _RISK_LABELS.get(value)
+    return normalized if normalized is not None else value.strip().lower()
+
+
+# ============================================================================
+# Session Helpers
+# ============================================================================
+
+
+def release_connection(db: Session) -> None:
+    """
+    End the session's current transaction so its pooled connection is returned.
+
+    A Session keeps its connection checked out from the first query until the
+    transaction ends. Endpoints that read from the database and then wait
+    seconds on an OpenAI call would otherwise hold a pool slot (and an
+    "idle in transaction" backend) for the whole call. Calling this before
+    slow non-database work frees the connection; the next query transparently
+    checks one out again.
+
+    The transaction is ended with COMMIT (a ROLLBACK would expire every
+    loaded object), so it must hold nothing but reads. Pending ORM changes
+    or writes already flushed or executed through this session raise
+    instead of being committed as a side effect; commit them explicitly
+    (flush_pending(db, True) or a helper's commit=True) first.
+
+    Args:
+        db: Database session
+
+    Raises:
+        RuntimeError: If the session has pending or uncommitted ORM writes
+
+    Note:
+        SessionLocal uses expire_on_commit=False, so loaded attributes stay
+        readable afterwards. Sessions configured to expire on commit will
+        reload them (and re-acquire a connection) on next access.
+    """
+    if not db.in_transaction():
+        return
+    if db.new or db.dirty or db.deleted or db.info.get(_UNCOMMITTED_WRITES):
+        raise RuntimeError(
+            "release_connection() called with uncommitted writes in the session; "
+            "commit them explicitly before releasing the connection"
+        )
+    db.commit()
+
+
+# Session.info flag set while the current transaction holds ORM writes that
+# are flushed or executed but not yet committed (checked by release_connection)
+_UNCOMMITTED_WRITES = "uncommitted_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed_writes(session: Session, flush_context) -> None:
+    """Record that the transaction now holds flushed, uncommitted changes."""
+    session.info[_UNCOMMITTED_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_executed_writes(orm_execute_state) -> None:
+    """Record ORM-enabled INSERT/UPDATE/DELETE statements run through Session.execute()."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_UNCOMMITTED_WRITES] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_write_marker(session: Session, transaction) -> None:
+    """Reset the write marker once the outermost transaction commits or rolls back."""
+    if transaction.parent is None:
+        session.info.pop(_UNCOMMITTED_WRITES, None)
+
+
+def flush_pending(db: Session, commit: bool = False) -> None:
+    """
+    Write the session's pending changes, rolling back if the write fails.
+
+    With commit=False the changes are only flushed: INSERT ... RETURNING
+    populates IDs and server defaults, but the transaction stays open so
+    several writes can share one COMMIT (one WAL flush) issued by the caller.
+    Every create/update/delete helper in this module ends with this call and
+    exposes the choice as its own `commit` argument.
+
+    Args:
+        db: Database session
+        commit: Commit the transaction instead of only flushing
+
+    Raises:
+        SQLAlchemyError: If the flush or commit fails (after rollback)
+    """
+    try:
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+    except Exception:
+        db.rollback()
+        raise
+
+
+# Session.info key holding latest-summary cache predicates to re-apply once the
+# session's transaction ends
+_PENDING_SUMMARY_INVALIDATIONS = "pending_latest_summary_invalidations"
+
+
+def _invalidate_latest_summaries(db: Session, predicate: Callable[[Tuple], bool]) -> None:
+    """
+    Drop latest-summary cache entries now and again when the transaction ends.
+
+    The immediate invalidation lets this session read its own uncommitted
+    write. Until the COMMIT, other sessions still see the previous latest row
+    and may cache its ID again, so the same entries are dropped once more
+    from the after_transaction_end hook below.
+
+    Args:
+        db: Database session the summary write was issued on
+        predicate: Function called with each cache key; True removes the entry
+    """
+    _latest_summary_ids.invalidate_where(predicate)
+    db.info.setdefault(_PENDING_SUMMARY_INVALIDATIONS, []).append(predicate)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _apply_pending_summary_invalidations(session: Session, transaction) -> None:
+    """Re-apply queued latest-summary invalidations once the outermost transaction ends."""
+    if transaction.parent is not None:
+        return  # SAVEPOINT; the enclosing transaction is still open
+    for predicate in session.info.pop(_PENDING_SUMMARY_INVALIDATIONS, ()):
+        _latest_summary_ids.invalidate_where(predicate)
+
+
+# ============================================================================
+# Corrupt Summary Purge
+# ============================================================================
+
+# (engine, summary_id) pairs found unparseable by a getter, deleted by a
+# background thread so read requests never write
+_corrupt_summaries: "queue.Queue[Tuple[Any, int]]" = queue.Queue()
+_purge_worker: Optional[threading.Thread] = None
+_purge_worker_lock = threading.Lock()
+
+
+def _schedule_summary_purge(db: Session, summary_id: int) -> None:
+    """
+    Queue a corrupt summary row for out-of-band deletion.
+
+    The getters that hit undecodable JSON call this and return (None, None)
+    straight away instead of deleting and committing inside a read request.
+    The worker thread is started on first use.
+
+    Args:
+        db: Session that found the row (its engine is used for the delete)
+        summary_id: Primary key of the corrupt summary
+    """
+    global _purge_worker
+    _corrupt_summaries.put((db.get_bind(), summary_id))
+    with _purge_worker_lock:
+        if _purge_worker is None or not _purge_worker.is_alive():
+            _purge_worker = threading.Thread(
+                target=_purge_corrupt_summaries, name="summary-purge", daemon=True
+            )
+            _purge_worker.start()
+
+
+def _purge_corrupt_summaries() -> None:
+    """
+    Worker loop: delete queued corrupt summaries in their own transactions.
+
+    Whatever has accumulated in the queue is deleted with one
+    `DELETE ... WHERE id IN (...)` per engine. Deleting a jurisdiction
+    analysis clears `contracts.latest_jurisdiction_summary_id` through the
+    foreign key's ON DELETE SET NULL. Failures are logged and the ids dropped;
+    a row that is still corrupt is queued again on its next read.
+    """
+    while True:
+        pending = [_corrupt_summaries.get()]
+        while True:
+            try:
+                pending.append(_corrupt_summaries.get_nowait())
+            except queue.Empty:
+                break
+
+        ids_by_bind: Dict[Any, set] = defaultdict(set)
+        for bind, summary_id in pending:
+            ids_by_bind[bind].add(summary_id)
+
+        for bind, summary_ids in ids_by_bind.items():
+            try:
+                with Session(bind=bind) as purge_db:
+                    purge_db.execute(
+                        delete(Summary)
+                        .where(Summary.id.in_(summary_ids))
+                        .execution_options(synchronize_session=False)
+                    )
+                    purge_db.commit()
+                logger.info(f"Purged {len(summary_ids)} corrupt summaries: {sorted(summary_ids)}")
+            except Exception as e:
+                logger.error(f"Failed to purge corrupt summaries {sorted(summary_ids)}: {str(e)}", exc_info=True)
+
+        for _ in pending:
+            _corrupt_summaries.task_done()
+
+
 # ============================================================================
 # Contract CRUD Operations
 # ============================================================================
 
 
+def contract_content_hash(text: str) -> bytes:
+    """
+    Return the contracts.content_hash key for a contract text (32-byte BLAKE2b digest).
+
+    Args:
+        text: Full contract text as uploaded
+
+    Returns:
+        Digest bytes
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=32).digest()
+
+
 def create_contract(
     db: Session,
     title: Optional[str],
     text: str,
-    jurisdiction: Optional[str] = None
+    jurisdiction: Optional[str] = None,
+    commit: bool = True
 ) -> Contract:
     """
     Create a new contract record in the database.
@@ -63,6 +513,9 @@ def create_contract(
         title: Optional contract name/title
         text: Full contract text content
         jurisdiction: Optional jurisdiction code (e.g., 'UK', 'US_NY')
+        commit: If True (default), commit the new row. If False, only flush
+            so the INSERT runs and the primary key is populated (via
+            RETURNING) while the caller owns the transaction boundary.
 
     Returns:
         Contract: Created contract object with auto-generated ID
@@ -74,15 +527,19 @@ def create_contract(
         title=title,
         text=text,
         jurisdiction=jurisdiction,
+        content_hash=contract_content_hash(text),
         status="pending"
     )
     db.add(contract)
-    db.commit()
-    db.refresh(contract)
+    flush_pending(db, commit)
     return contract
 
 
-def get_contract(db: Session, contract_id: int) -> Optional[Contract]:
+def get_contract(
+    db: Session,
+    contract_id: int,
+    load: Tuple[str, ...] = ()
+) -> Optional[Contract]:
     """
     Retrieve a contract by ID.
 
@@ -92,18 +549,92 @@ def get_contract(db: Session, contract_id: int) -> Optional[Contract]:
     Args:
         db: Database session
         contract_id: Contract primary key
+        load: Optional relationship names to eager load with selectinload
+              (e.g., ('clauses', 'entities')). When given, every other
+              relationship is configured with raiseload so an undeclared
+              lazy load fails loudly instead of issuing a hidden N+1 SELECT.
+
+    Returns:
+        Contract object if found, None otherwise
+
+    Note:
+        Without `load`, uses Session.get() so a contract already loaded in
+        this session is returned from the identity map without emitting
+        another SELECT. With `load`, a SELECT with populate_existing always
+        runs: Session.get() would return an identity-map hit as is, ignoring
+        the loader options.
+
+    Example:
+        >>> contract = get_contract(db, 1, load=('clauses',))
+        >>> texts = [clause.text for clause in contract.clauses]  # no extra queries
+    """
+    if not load:
+        return db.get(Contract, contract_id)
+
+    options = [selectinload(getattr(Contract, rel)) for rel in load]
+    options.append(raiseload('*'))
+    return db.scalars(
+        select(Contract)
+        .where(Contract.id == contract_id)
+        .options(*options)
+        .execution_options(populate_existing=True)
+    ).one_or_none()
+
+
+def get_completed_contract_by_hash(db: Session, content_hash: bytes) -> Optional[Contract]:
+    """
+    Find the newest completed contract whose text has the given hash.
+
+    Used by the /contracts/segment endpoint to answer a re-upload of identical
+    text from the stored clauses and entities instead of segmenting and
+    calling the extraction model again. Only status 'completed' matches:
+    failed and 'completed_with_warnings' uploads are reprocessed.
+
+    Args:
+        db: Database session
+        content_hash: Digest from contract_content_hash()
 
     Returns:
         Contract object if found, None otherwise
+
+    Note:
+        Contracts created before migration 016 have no content_hash and are
+        never matched.
+    """
+    return db.scalars(
+        _COMPLETED_CONTRACT_BY_HASH_STMT, {"content_hash": content_hash}
+    ).one_or_none()
+
+
+def get_contract_with_clauses(db: Session, contract_id: int) -> Optional[Contract]:
     """
-    return db.query(Contract).filter(Contract.id == contract_id).first()
+    Retrieve a contract with its clauses eager loaded.
+
+    Intended for full-contract analysis paths that need both the contract
+    text and every clause. The clauses arrive with one follow-up
+    `SELECT ... WHERE contract_id IN (...)` (selectinload), so iterating
+    `contract.clauses` issues no further queries.
+
+    Args:
+        db: Database session
+        contract_id: Contract primary key
+
+    Returns:
+        Contract object with `clauses` populated if found, None otherwise
+    """
+    return get_contract(db, contract_id, load=("clauses",))
 
 
 def get_contracts(
     db: Session,
     skip: int = 0,
-    limit: int = 100
-) -> List[Contract]:
+    limit: int = 100,
+    include_clauses: bool = False,
+    stream: bool = False,
+    expunge: bool = False,
+    uploaded_after: Optional[datetime] = None,
+    uploaded_before: Optional[datetime] = None
+) -> Iterable[Contract]:
     """
     Retrieve all contracts with pagination.
 
@@ -114,18 +645,49 @@ def get_contracts(
         db: Database session
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
+        include_clauses: Eager load each contract's clauses with one extra
+                         `WHERE contract_id IN (...)` SELECT for the whole page,
+                         instead of one lazy SELECT per contract
+        stream: If True, return a single-pass batched iterator (see
+                get_entities_by_contract); with include_clauses the clauses
+                are loaded per batch
+        expunge: Detach the returned contracts (and loaded clauses) from the
+                 session so long-lived sessions do not accumulate them
+                 (ignored when stream=True)
+        uploaded_after: Only contracts uploaded at or after this time
+        uploaded_before: Only contracts uploaded before this time
 
     Returns:
-        List of contract objects
+        List of contract objects (iterator if stream=True)
+
+    Note:
+        Upload time ranges are served by the BRIN index
+        ix_contracts_uploaded_at_brin, which skips heap ranges outside the
+        window instead of scanning the whole table.
     """
-    return db.query(Contract).offset(skip).limit(limit).all()
+    stmt = select(Contract)
+    if uploaded_after is not None:
+        stmt = stmt.where(Contract.uploaded_at >= uploaded_after)
+    if uploaded_before is not None:
+        stmt = stmt.where(Contract.uploaded_at < uploaded_before)
+    stmt = stmt.offset(skip).limit(limit)
+
+    if include_clauses:
+        stmt = stmt.options(selectinload(Contract.clauses))
+
+    if stream:
+        return db.scalars(stmt, execution_options={"yield_per": STREAM_BATCH_SIZE})
+
+    contracts = db.scalars(stmt).all()
+    return _detach(db, contracts) if expunge else contracts
 
 
 def update_contract_status(
     db: Session,
     contract_id: int,
     status: str,
-    processed_at: Optional[datetime] = None
+    processed_at: Optional[datetime] = None,
+    commit: bool = True
 ) -> Optional[Contract]:
     """
     Update contract processing status.
@@ -138,24 +700,36 @@ def update_contract_status(
         contract_id: Contract primary key
         status: New status value (pending/processing/completed/failed)
         processed_at: Optional timestamp when processing completed
+        commit: If True (default), commit immediately. If False, the UPDATE
+            runs inside the caller's transaction and is committed with it
 
     Returns:
         Updated contract object if found, None otherwise
-    """
-    contract = get_contract(db, contract_id)
-    if contract:
-        contract.status = status
-        if processed_at:
-            contract.processed_at = processed_at
-        db.commit()
-        db.refresh(contract)
+
+    Note:
+        Issues a single UPDATE ... RETURNING statement instead of a
+        SELECT + UPDATE + refresh round-trip sequence.
+    """
+    values = {"status": status}
+    if processed_at:
+        values["processed_at"] = processed_at
+
+    stmt = (
+        update(Contract)
+        .where(Contract.id == contract_id)
+        .values(**values)
+        .returning(Contract)
+    )
+    contract = db.execute(stmt).scalar_one_or_none()
+    flush_pending(db, commit)
     return contract
 
 
 def update_contract_jurisdiction(
     db: Session,
     contract_id: int,
-    jurisdiction: str
+    jurisdiction: str,
+    commit: bool = True
 ) -> Optional[Contract]:
     """
     Update contract jurisdiction after analysis.
@@ -167,19 +741,24 @@ def update_contract_jurisdiction(
         db: Database session
         contract_id: Contract primary key
         jurisdiction: Jurisdiction code (e.g., 'UK', 'US_NY')
+        commit: If True (default), commit immediately. If False, the UPDATE
+            runs inside the caller's transaction and is committed with it
 
     Returns:
         Updated contract object if found, None otherwise
     """
-    contract = get_contract(db, contract_id)
-    if contract:
-        contract.jurisdiction = jurisdiction
-        db.commit()
-        db.refresh(contract)
+    stmt = (
+        update(Contract)
+        .where(Contract.id == contract_id)
+        .values(jurisdiction=jurisdiction)
+        .returning(Contract)
+    )
+    contract = db.execute(stmt).scalar_one_or_none()
+    flush_pending(db, commit)
     return contract
 
 
-def delete_contract(db: Session, contract_id: int) -> bool:
+def delete_contract(db: Session, contract_id: int, commit: bool = True) -> bool:
     """
     Delete a contract and all related data.
 
@@ -189,16 +768,30 @@ def delete_contract(db: Session, contract_id: int) -> bool:
     Args:
         db: Database session
         contract_id: Contract primary key
+        commit: If True (default), commit immediately. If False, the DELETE
+            runs in the caller's transaction.
 
     Returns:
         True if deleted, False if contract not found
-    """
-    contract = get_contract(db, contract_id)
-    if contract:
-        db.delete(contract)
-        db.commit()
-        return True
-    return False
+
+    Note:
+        Issues a single `DELETE ... RETURNING id` and relies on the database
+        `ON DELETE CASCADE` foreign keys on every child table, rather than
+        SELECTing the contract and letting the ORM load and delete children.
+        ORM delete events do not fire, and child objects already loaded in
+        this session are not expired (contract objects are removed from the
+        session via synchronize_session).
+    """
+    stmt = (
+        delete(Contract)
+        .where(Contract.id == contract_id)
+        .returning(Contract.id)
+    )
+    deleted = db.execute(stmt).scalar_one_or_none() is not None
+    if deleted:
+        _invalidate_latest_summaries(db, lambda key: key[0] == contract_id)
+    flush_pending(db, commit)
+    return deleted
 
 
 # ============================================================================
@@ -212,7 +805,8 @@ def create_clause(
     clause_id: str,
     number: Optional[str],
     title: Optional[str],
-    text: str
+    text: str,
+    commit: bool = True
 ) -> Clause:
     """
     Create a new clause record.
@@ -232,6 +826,9 @@ def create_clause(
         number: Clause number (e.g., '2.1')
         title: Clause heading text
         text: Full clause body text
+        commit: If True (default), commit the new row. If False, only flush;
+            the caller is responsible for committing, which lets several
+            creates share one transaction
 
     Returns:
         Clause: Created clause object with auto-generated ID
@@ -250,13 +847,11 @@ def create_clause(
     )
     db.add(clause)
     try:
-        db.commit()
-        db.refresh(clause)
+        flush_pending(db, commit)
         return clause
     except IntegrityError as e:
-        db.rollback()
         # Raise custom exception with context while preserving original IntegrityError
-        if "uq_clauses_contract_clause" in str(e):
+        if _violated_constraint(e) == "uq_clauses_contract_clause":
             raise DuplicateClauseError(
                 f"Clause with clause_id '{clause_id}' already exists for contract {contract_id}. "
                 f"The (contract_id, clause_id) pair must be unique."
@@ -265,7 +860,12 @@ def create_clause(
         raise
 
 
-def get_clauses_by_contract(db: Session, contract_id: int) -> List[Clause]:
+def get_clauses_by_contract(
+    db: Session,
+    contract_id: int,
+    stream: bool = False,
+    expunge: bool = False
+) -> Iterable[Clause]:
     """
     Retrieve all clauses for a contract.
 
@@ -275,70 +875,339 @@ def get_clauses_by_contract(db: Session, contract_id: int) -> List[Clause]:
     Args:
         db: Database session
         contract_id: Parent contract ID
+        stream: If True, return a single-pass batched iterator (see
+                get_entities_by_contract). Useful for contracts with thousands
+                of clauses, where the full list would hold every clause text
+                and embedding in memory at once.
+        expunge: Detach the returned clauses from the session after loading
+                 (ignored when stream=True)
+
+    Returns:
+        List of clause objects for the specified contract (iterator if stream=True)
+    """
+    params = {"contract_id": contract_id}
+    if stream:
+        return db.scalars(
+            _CLAUSES_BY_CONTRACT_STMT,
+            params,
+            execution_options={"yield_per": STREAM_BATCH_SIZE}
+        )
+    clauses = db.scalars(_CLAUSES_BY_CONTRACT_STMT, params).all()
+    return _detach(db, clauses) if expunge else clauses
+
+
+def _clause_rows(clauses: List[Clause]) -> List[Dict[str, Any]]:
+    """Build INSERT parameter dicts for clause objects."""
+    return [
+        {
+            "contract_id": clause.contract_id,
+            "clause_id": clause.clause_id,
+            "number": clause.number,
+            "title": clause.title,
+            "text": clause.text,
+        }
+        for clause in clauses
+    ]
+
+
+# Session-local staging table for COPY-based embedding writes. ON COMMIT DELETE
+# ROWS keeps it empty between transactions, so a pooled connection can reuse it.
+_CREATE_EMBEDDING_STAGING_SQL = (
+    "CREATE TEMP TABLE IF NOT EXISTS clauses_embedding_staging "
+    f"(id integer PRIMARY KEY, embedding halfvec({EMBEDDING_DIMENSIONS})) ON COMMIT DELETE ROWS"
+)
+_COPY_EMBEDDING_STAGING_SQL = "COPY clauses_embedding_staging (id, embedding) FROM STDIN"
+_UPDATE_FROM_EMBEDDING_STAGING_SQL = (
+    "UPDATE clauses SET embedding = s.embedding "
+    "FROM clauses_embedding_staging s WHERE clauses.id = s.id"
+)
+
+
+def _write_clause_embeddings(db: Session, rows: List[Tuple[int, List[float]]]) -> None:
+    """
+    Write clause embeddings by primary key inside the session's transaction.
+
+    On psycopg2 the vectors are streamed with a single COPY into a temporary
+    staging table and applied with one UPDATE ... FROM, instead of one UPDATE
+    statement (and one EMBEDDING_DIMENSIONS-float parameter list) per clause. Other drivers
+    fall back to an executemany UPDATE by primary key.
+
+    Args:
+        db: Database session (caller commits)
+        rows: (clause primary key, embedding vector) pairs
+
+    Note:
+        COPY uses the text format: pgvector parses the JSON array text of a
+        vector ("[0.1, 0.2, ...]") directly, so no binary encoder is needed.
+    """
+    connection = db.connection()
+    if connection.dialect.driver != "psycopg2":
+        db.execute(
+            update(Clause),
+            [{"id": clause_pk, "embedding": vector} for clause_pk, vector in rows]
+        )
+        return
+
+    buffer = io.StringIO()
+    for clause_pk, vector in rows:
+        buffer.write(f"{clause_pk}\t{_dumps_json(vector)}\n")
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.execute(_CREATE_EMBEDDING_STAGING_SQL)
+        cursor.copy_expert(_COPY_EMBEDDING_STAGING_SQL, buffer)
+        cursor.execute(_UPDATE_FROM_EMBEDDING_STAGING_SQL)
+    finally:
+        cursor.close()
+
+
+def _embedding_text_hash(text: str) -> bytes:
+    """
+    Return the embedding_cache key for a clause text (32-byte BLAKE2b digest).
+
+    Args:
+        text: Clause text as stored on the clause
 
     Returns:
-        List of clause objects for the specified contract
+        Digest bytes
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=32).digest()
+
+
+def _lookup_cached_embeddings(db: Session, hashes: Iterable[bytes]) -> Dict[bytes, List[float]]:
     """
-    return db.query(Clause).filter(Clause.contract_id == contract_id).all()
+    Fetch cached embedding vectors for the given text hashes.
+
+    A failed lookup (e.g., migration 005 not yet applied) is logged and treated
+    as an empty cache so embedding generation still proceeds.
+
+    Args:
+        db: Database session
+        hashes: Text hashes to look up
+
+    Returns:
+        Dictionary mapping text hash to embedding vector for cache hits
+    """
+    try:
+        stmt = select(EmbeddingCache.text_hash, EmbeddingCache.embedding).where(
+            EmbeddingCache.text_hash.in_(list(hashes))
+        )
+        # pgvector may return numpy arrays; plain float lists JSON-encode for
+        # the COPY writer and bind as halfvec like freshly generated vectors
+        return {
+            text_hash: list(map(float, embedding))
+            for text_hash, embedding in db.execute(stmt)
+        }
+    except SQLAlchemyError as e:
+        logger.warning(f"Embedding cache lookup failed, embedding all clauses: {str(e)}")
+        db.rollback()
+        return {}
 
 
-def bulk_create_clauses(db: Session, clauses: List[Clause]) -> None:
+def _store_clause_embeddings(db: Session, clauses: List[Clause]) -> None:
+    """
+    Generate embeddings for inserted clauses and persist them.
+
+    Vectors are first looked up in embedding_cache by a hash of the clause
+    text; only texts that miss (deduplicated) are sent to the embeddings API,
+    and the new vectors are added to the cache afterwards.
+
+    Embedding failures are non-fatal: they are logged and the affected clauses
+    keep a NULL embedding (excluded from semantic search).
+
+    Args:
+        db: Database session
+        clauses: Clause objects whose `id` is already populated
+    """
+    text_hashes = [_embedding_text_hash(clause.text) for clause in clauses]
+    vectors_by_hash = _lookup_cached_embeddings(db, set(text_hashes))
+    cache_hits = sum(1 for text_hash in text_hashes if text_hash in vectors_by_hash)
+
+    # Texts still needing an embedding, one entry per distinct hash
+    miss_texts: Dict[bytes, str] = {}
+    for clause, text_hash in zip(clauses, text_hashes):
+        if text_hash not in vectors_by_hash:
+            miss_texts.setdefault(text_hash, clause.text)
+
+    # Don't hold a pooled connection open while waiting on OpenAI
+    release_connection(db)
+
+    errors_by_hash: Dict[bytes, str] = {}
+    new_vectors: Dict[bytes, List[float]] = {}
+    logger.info(
+        f"Generating embeddings for {len(clauses)} clauses "
+        f"({cache_hits} cached, {len(miss_texts)} distinct texts to embed)"
+    )
+    if miss_texts:
+        embeddings_list, errors_list = generate_embeddings_batch(list(miss_texts.values()))
+        for text_hash, embedding_vector, error in zip(miss_texts, embeddings_list, errors_list):
+            if error:
+                errors_by_hash[text_hash] = error
+            else:
+                new_vectors[text_hash] = embedding_vector
+        vectors_by_hash.update(new_vectors)
+
+    # Collect (id, vector) pairs for successful items; IDs were returned by the
+    # INSERT, so the rows are written by primary key without loading them first
+    embedding_rows: List[Tuple[int, List[float]]] = []
+    failed: List[Tuple[str, int, Optional[str]]] = []
+
+    for clause, text_hash in zip(clauses, text_hashes):
+        embedding_vector = vectors_by_hash.get(text_hash)
+        if embedding_vector is None:
+            failed.append((clause.clause_id, clause.contract_id, errors_by_hash.get(text_hash)))
+        else:
+            embedding_rows.append((clause.id, embedding_vector))
+
+    successful_embeddings = len(embedding_rows)
+    failed_embeddings = len(failed)
+    if failed:
+        # One summary line instead of a warning per clause - embeddings are
+        # optional, so failures are logged but don't fail the request
+        logger.warning(
+            f"Embedding failures: {failed_embeddings}/{len(clauses)} clauses "
+            f"(sample (clause_id, contract_id, error): {failed[:5]})"
+        )
+
+    # Write all embeddings and commit once
+    try:
+        if embedding_rows:
+            _write_clause_embeddings(db, embedding_rows)
+        db.commit()
+        logger.info(
+            f"Embedding generation complete: {successful_embeddings} successful, "
+            f"{failed_embeddings} failed out of {len(clauses)} total clauses"
+        )
+    except Exception as e:
+        # If embedding updates fail, log but don't raise - clauses are already created
+        logger.error(f"Failed to save embeddings to database: {str(e)}")
+        db.rollback()
+
+    # Remember freshly generated vectors; a concurrent writer may have cached
+    # the same text already, which ON CONFLICT DO NOTHING tolerates
+    if new_vectors:
+        try:
+            db.execute(
+                pg_insert(EmbeddingCache).on_conflict_do_nothing(index_elements=["text_hash"]),
+                [
+                    {"text_hash": text_hash, "embedding": embedding_vector}
+                    for text_hash, embedding_vector in new_vectors.items()
+                ]
+            )
+            db.commit()
+        except SQLAlchemyError as e:
+            logger.warning(f"Failed to update embedding cache: {str(e)}")
+            db.rollback()
+
+
+def bulk_create_clauses(
+    db: Session,
+    clauses: List[Clause],
+    ignore_duplicates: bool = False,
+    skip_existing: bool = False
+) -> None:
     """
     Efficiently insert multiple clauses in a single transaction and generate embeddings.
 
     This optimizes insertion of multiple clauses from segmentation,
     reducing database round-trips. After clause insertion, automatically generates
-    OpenAI text-embedding-3-small vectors (1536 dimensions) for each clause to enable
+    OpenAI text-embedding-3-small vectors (EMBEDDING_DIMENSIONS) for each clause to enable
     semantic search capabilities.
 
-    IMPORTANT LIMITATIONS:
-    - This function uses `bulk_save_objects()` which does NOT populate
-      auto-generated primary keys (IDs) on the clause objects after insert.
-    - SQLAlchemy events (e.g., before_insert, after_insert) will NOT fire.
-    - If you need access to the generated IDs immediately after insertion,
-      use `db.add_all(clauses); db.commit()` instead.
-    - This is a performance optimization for cases where IDs are not needed
-      immediately and events are not required.
+    INSERT STRATEGY:
+    - Rows are written with a single Core `INSERT ... RETURNING id` executed as
+      an executemany, which the PostgreSQL dialect batches into multi-row
+      VALUES statements (insertmanyvalues) instead of one INSERT per clause.
+    - The generated primary keys are assigned back onto the clause objects,
+      so `clause.id` is populated after this call.
+    - The clause objects are NOT added to the session; SQLAlchemy ORM events
+      (e.g., before_insert, after_insert) will NOT fire.
 
     UNIQUE CONSTRAINT ENFORCEMENT:
     - This function enforces the unique constraint on (contract_id, clause_id).
     - If any clause violates the constraint, the entire transaction is rolled back
       and a DuplicateClauseError is raised (chained from the original IntegrityError).
     - Callers should handle DuplicateClauseError to detect duplicate clauses.
+    - With ignore_duplicates=True, the INSERT uses PostgreSQL
+      `ON CONFLICT ON CONSTRAINT uq_clauses_contract_clause DO NOTHING` so
+      duplicates are skipped server-side in the same statement. Skipped clauses
+      keep `clause.id = None` and no embeddings are generated for them.
+    - With skip_existing=True, a pre-flight SELECT against the
+      uq_clauses_contract_clause index finds clauses already stored and drops
+      them before the INSERT, so re-submitted clauses never abort the batch.
+      Skipped clauses keep `clause.id = None`. Unlike ignore_duplicates this
+      does not guard against concurrent writers or duplicates within `clauses`.
 
     EMBEDDING GENERATION:
     - After clause insertion, embeddings are automatically generated for all clauses
-    - Uses OpenAI text-embedding-3-small (1536 dimensions) for semantic search
+    - Uses OpenAI text-embedding-3-small (EMBEDDING_DIMENSIONS) for semantic search
     - Embedding failures are non-fatal and logged as warnings
     - Clauses without embeddings can still be used but won't appear in semantic search
 
-    Alternative approach when IDs are needed:
-        for clause in clauses:
-            db.add(clause)
-        db.commit()
-        # Now clause.id is populated for each clause
-
     Args:
         db: Database session
         clauses: List of Clause objects to insert
+        ignore_duplicates: Skip clauses whose (contract_id, clause_id) already
+                           exists instead of rolling back the whole batch
+                           (useful for segmentation re-runs)
+        skip_existing: Filter out clauses that already exist with one indexed
+                       SELECT before inserting the remaining subset
 
     Raises:
         DuplicateClauseError: If any clause violates unique constraint (contract_id, clause_id)
+                              and neither ignore_duplicates nor skip_existing
+                              filtered it out
         IntegrityError: For other constraint violations
         SQLAlchemyError: On other database operation failures
 
     Note:
-        Callers should not expect clause.id to be populated after this call.
-        If IDs are needed, query the database again or use add_all() instead.
         Embedding generation is automatic and non-fatal (failures logged but don't raise exceptions).
     """
+    pending = clauses
+    if skip_existing and clauses:
+        # One index scan on uq_clauses_contract_clause finds already-stored keys
+        existing_stmt = select(Clause.contract_id, Clause.clause_id).where(
+            Clause.contract_id.in_({clause.contract_id for clause in clauses}),
+            Clause.clause_id.in_([clause.clause_id for clause in clauses])
+        )
+        existing = set(db.execute(existing_stmt).tuples())
+        pending = [
+            clause for clause in clauses
+            if (clause.contract_id, clause.clause_id) not in existing
+        ]
+        if not pending:
+            logger.info(f"Skipped {len(clauses)} existing clauses, nothing to insert")
+            return
+
+    rows = _clause_rows(pending)
+
     try:
-        db.bulk_save_objects(clauses)
+        if ignore_duplicates:
+            # Skipped rows produce no RETURNING row, so match IDs by natural key
+            stmt = (
+                pg_insert(Clause)
+                .on_conflict_do_nothing(constraint="uq_clauses_contract_clause")
+                .returning(Clause.id, Clause.contract_id, Clause.clause_id)
+            )
+            inserted_ids = {
+                (contract_id, clause_id): clause_pk
+                for clause_pk, contract_id, clause_id in db.execute(stmt, rows)
+            }
+            for clause in pending:
+                clause.id = inserted_ids.get((clause.contract_id, clause.clause_id))
+        else:
+            result = db.execute(
+                insert(Clause).returning(Clause.id, sort_by_parameter_order=True),
+                rows
+            )
+            for clause, clause_pk in zip(pending, result.scalars()):
+                clause.id = clause_pk
         db.commit()
     except IntegrityError as e:
         db.rollback()
         # Raise custom exception with context while preserving original IntegrityError
-        if "uq_clauses_contract_clause" in str(e):
+        if _violated_constraint(e) == "uq_clauses_contract_clause":
             raise DuplicateClauseError(
                 "One or more clauses violate the unique constraint on (contract_id, clause_id). "
                 "Ensure all clause_id values are unique within each contract. "
@@ -347,57 +1216,16 @@ def bulk_create_clauses(db: Session, clauses: List[Clause]) -> None:
         # Re-raise other integrity errors as-is to preserve DBAPI details
         raise
 
-    # Generate embeddings for all clauses after successful insertion
-    # Note: We need to query the clauses back to get their database IDs since bulk_save_objects
-    # doesn't populate IDs on the objects
-    logger.info(f"Generating embeddings for {len(clauses)} clauses")
-
-    # Build a single IN filter to query all inserted clauses in one DB call
-    clause_filters = [(clause.contract_id, clause.clause_id) for clause in clauses]
+    if ignore_duplicates or skip_existing:
+        skipped = len(clauses)
+        clauses = [clause for clause in pending if clause.id is not None]
+        skipped -= len(clauses)
+        if skipped:
+            logger.info(f"Skipped {skipped} duplicate clauses")
+        if not clauses:
+            return
 
-    # Query all inserted clauses using IN filter on (contract_id, clause_id)
-    from sqlalchemy import tuple_
-    db_clauses = db.query(Clause).filter(
-        tuple_(Clause.contract_id, Clause.clause_id).in_(clause_filters)
-    ).all()
-
-    if len(db_clauses) != len(clauses):
-        logger.warning(
-            f"Retrieved {len(db_clauses)} clauses from database but expected {len(clauses)}"
-        )
-
-    # Build list of texts in order and call batch embedding generation
-    clause_texts = [db_clause.text for db_clause in db_clauses]
-    embeddings_list, errors_list = generate_embeddings_batch(clause_texts)
-
-    # Iterate over results and set embeddings for successful items
-    successful_embeddings = 0
-    failed_embeddings = 0
-
-    for i, (db_clause, embedding_vector, error) in enumerate(zip(db_clauses, embeddings_list, errors_list)):
-        if error:
-            # Log warning but don't fail - embeddings are optional
-            logger.warning(
-                f"Failed to generate embedding for clause {db_clause.clause_id} "
-                f"(contract {db_clause.contract_id}): {error}"
-            )
-            failed_embeddings += 1
-        else:
-            # Update clause with embedding
-            db_clause.embedding = embedding_vector
-            successful_embeddings += 1
-
-    # Commit all embedding updates once after the loop
-    try:
-        db.commit()
-        logger.info(
-            f"Embedding generation complete: {successful_embeddings} successful, "
-            f"{failed_embeddings} failed out of {len(clauses)} total clauses"
-        )
-    except Exception as e:
-        # If embedding updates fail, log but don't raise - clauses are already created
-        logger.error(f"Failed to save embeddings to database: {str(e)}")
-        db.rollback()
+    _store_clause_embeddings(db, clauses)
 
 
 # ============================================================================
@@ -411,7 +1239,8 @@ def create_entity(
     entity_type: str,
     value: str,
     context: Optional[str] = None,
-    confidence: Optional[str] = None
+    confidence: Optional[str] = None,
+    commit: bool = True
 ) -> Entity:
     """
     Create a new entity record.
@@ -426,6 +1255,8 @@ def create_entity(
         value: Extracted entity value
         context: Optional surrounding text providing context
         confidence: Optional confidence level (high/medium/low)
+        commit: If True (default), commit the new row. If False, only flush;
+            the caller is responsible for committing
 
     Returns:
         Entity: Created entity object with auto-generated ID
@@ -439,32 +1270,34 @@ def create_entity(
 
     entity = Entity(
         contract_id=contract_id,
-        entity_type=entity_type.lower(),  # Normalize to lowercase for consistent querying
+        entity_type=entity_type,  # Lowercased by Entity's @validates hook
         value=value,
         context=context,
         confidence=confidence
     )
     db.add(entity)
-    try:
-        db.commit()
-        db.refresh(entity)
-    except SQLAlchemyError:
-        db.rollback()
-        raise
+    flush_pending(db, commit)
     return entity
 
 
-def bulk_create_entities(db: Session, entities: List[Entity]) -> None:
+def bulk_create_entities(db: Session, entities: List[Entity], commit: bool = True) -> None:
     """
     Efficiently insert multiple entities in a single transaction.
 
     This optimizes insertion of multiple entities from extraction results,
-    reducing database round-trips. Unlike bulk_save_objects, this uses
-    add_all() to populate auto-generated IDs on entity objects.
+    reducing database round-trips. Rows are written with one Core
+    `INSERT ... RETURNING id, extracted_at` executemany, which PostgreSQL
+    batches into multi-row VALUES statements without unit-of-work
+    bookkeeping per instance. The returned `id` and `extracted_at` are
+    assigned back onto the entity objects, so no refresh is needed.
+
+    The entity objects are NOT added to the session; ORM events will not fire.
 
     Args:
         db: Database session
         entities: List of Entity objects to insert
+        commit: If True (default), commit the rows. If False, the caller
+            commits.
 
     Raises:
         IntegrityError: For constraint violations (e.g., foreign key)
@@ -474,15 +1307,108 @@ def bulk_create_entities(db: Session, entities: List[Entity]) -> None:
         On failure, the entire transaction is rolled back. Handle exceptions
         appropriately in calling code.
     """
+    if not entities:
+        return
+
     try:
-        db.add_all(entities)
-        db.commit()
+        _insert_entities(db, entities)
     except IntegrityError:
         db.rollback()
         raise
+    flush_pending(db, commit)
+
+
+def _insert_entities(db: Session, entities: List[Entity]) -> None:
+    """
+    Insert entity rows with one executemany INSERT ... RETURNING (no commit).
+
+    Assigns the generated `id` and `extracted_at` back onto the objects;
+    sort_by_parameter_order guarantees RETURNING rows match input order.
+    """
+    rows = [
+        {
+            "contract_id": entity.contract_id,
+            "entity_type": entity.entity_type,
+            "value": entity.value,
+            "context": entity.context,
+            "confidence": entity.confidence,
+        }
+        for entity in entities
+    ]
+    stmt = insert(Entity).returning(
+        Entity.id, Entity.extracted_at, sort_by_parameter_order=True
+    )
+    for entity, (entity_pk, extracted_at) in zip(entities, db.execute(stmt, rows)):
+        entity.id = entity_pk
+        entity.extracted_at = extracted_at
+
+
+def bulk_create_clauses_and_entities(
+    db: Session,
+    clauses: List[Clause],
+    entities: List[Entity]
+) -> None:
+    """
+    Insert a contract's clauses and entities in one transaction, then embed clauses.
+
+    The segmentation endpoint used to persist clauses and entities with two
+    separate bulk helpers, each committing on its own. This writes both
+    batches inside a single transaction with one commit (one WAL flush),
+    then generates clause embeddings exactly as bulk_create_clauses does.
+
+    Both inserts are executemany INSERT ... RETURNING statements with
+    sort_by_parameter_order, so generated IDs (and extracted_at) are mapped
+    back onto the objects reliably. A single data-modifying CTE was
+    considered, but PostgreSQL does not guarantee RETURNING order for a CTE,
+    which would make mapping entity IDs back onto the objects unsafe.
+
+    Args:
+        db: Database session
+        clauses: Clause objects to insert (all fields except id set)
+        entities: Entity objects to insert (may be empty)
+
+    Raises:
+        DuplicateClauseError: If any clause violates the unique constraint on
+                              (contract_id, clause_id); nothing is persisted
+        IntegrityError: For other constraint violations
+        SQLAlchemyError: On other database operation failures
+
+    Example:
+        >>> bulk_create_clauses_and_entities(db, clause_models, entity_models)
+        >>> print(clause_models[0].id, entity_models[0].id)
+    """
+    try:
+        if clauses:
+            result = db.execute(
+                insert(Clause).returning(Clause.id, sort_by_parameter_order=True),
+                _clause_rows(clauses)
+            )
+            for clause, clause_pk in zip(clauses, result.scalars()):
+                clause.id = clause_pk
+
+        if entities:
+            _insert_entities(db, entities)
+
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if _violated_constraint(e) == "uq_clauses_contract_clause":
+            raise DuplicateClauseError(
+                "One or more clauses violate the unique constraint on (contract_id, clause_id). "
+                "The entire batch (clauses and entities) has been rolled back."
+            ) from e
+        raise
+
+    if clauses:
+        _store_clause_embeddings(db, clauses)
 
 
-def get_entities_by_contract(db: Session, contract_id: int) -> List[Entity]:
+def get_entities_by_contract(
+    db: Session,
+    contract_id: int,
+    stream: bool = False,
+    expunge: bool = False
+) -> Iterable[Entity]:
     """
     Retrieve all entities for a contract.
 
@@ -492,18 +1418,34 @@ def get_entities_by_contract(db: Session, contract_id: int) -> List[Entity]:
     Args:
         db: Database session
         contract_id: Parent contract ID
+        stream: If True, return a single-pass iterator that fetches rows in
+                batches of STREAM_BATCH_SIZE (yield_per, server-side cursor)
+                instead of materializing the full list. Consume it before
+                the session is closed.
+        expunge: Detach the returned entities from the session after loading
+                 (ignored when stream=True)
 
     Returns:
-        List of entity objects for the specified contract
-    """
-    return db.query(Entity).filter(Entity.contract_id == contract_id).all()
+        List of entity objects for the specified contract (iterator if stream=True)
+    """
+    params = {"contract_id": contract_id}
+    if stream:
+        return db.scalars(
+            _ENTITIES_BY_CONTRACT_STMT,
+            params,
+            execution_options={"yield_per": STREAM_BATCH_SIZE}
+        )
+    entities = db.scalars(_ENTITIES_BY_CONTRACT_STMT, params).all()
+    return _detach(db, entities) if expunge else entities
 
 
 def get_entities_by_type(
     db: Session,
     contract_id: int,
-    entity_type: str
-) -> List[Entity]:
+    entity_type: str,
+    stream: bool = False,
+    expunge: bool = False
+) -> Iterable[Entity]:
     """
     Retrieve entities filtered by type for a specific contract.
 
@@ -514,15 +1456,23 @@ def get_entities_by_type(
         db: Database session
         contract_id: Parent contract ID
         entity_type: Entity type to filter by (party/date/financial_term/governing_law/obligation)
+        stream: If True, return a single-pass batched iterator (see
+                get_entities_by_contract)
+        expunge: Detach the returned entities from the session after loading
+                 (ignored when stream=True)
 
     Returns:
         List of entity objects matching the type for the specified contract
+        (iterator if stream=True)
 
     Note:
         Compares normalized lowercase entity_type. Since all writes normalize to lowercase
-        (see create_entity), we can do direct comparison without SQL lower() for better performance.
+        (Entity's @validates hook), we can do direct comparison without SQL lower() for better
+        performance. The filter value itself is still lowercased here because it comes from
+        the caller (e.g. a query string), not from an Entity instance.
         After running migration 001_normalize_entity_type.sql, all existing data will be lowercase.
-        TODO: Migrate to DB Enum or CHECK constraint to enforce allowed entity types at schema level.
+        Allowed values are enforced by the ck_entities_entity_type CHECK constraint
+        (migration 003_entity_type_check.sql).
 
     Raises:
         ValueError: If entity_type is None or empty
@@ -531,10 +1481,15 @@ def get_entities_by_type(
         raise ValueError("entity_type is required and cannot be empty")
 
     # Direct comparison - data is normalized to lowercase on write
-    return db.query(Entity).filter(
-        Entity.contract_id == contract_id,
-        Entity.entity_type == entity_type.lower()
-    ).all()
+    params = {"contract_id": contract_id, "entity_type": entity_type.lower()}
+    if stream:
+        return db.scalars(
+            _ENTITIES_BY_TYPE_STMT,
+            params,
+            execution_options={"yield_per": STREAM_BATCH_SIZE}
+        )
+    entities = db.scalars(_ENTITIES_BY_TYPE_STMT, params).all()
+    return _detach(db, entities) if expunge else entities
 
 
 def count_entities_by_type(db: Session, contract_id: int) -> dict:
@@ -550,18 +1505,23 @@ def count_entities_by_type(db: Session, contract_id: int) -> dict:
 
     Returns:
         Dictionary mapping entity types to counts (e.g., {'party': 2, 'date': 5})
+
+    Note:
+        Uses COUNT(*) rather than COUNT(id) so every referenced column is part
+        of ix_entities_contract_id_type (contract_id, entity_type), which lets
+        PostgreSQL answer with an index-only scan instead of visiting the heap.
     """
-    results = db.query(
+    stmt = select(
         Entity.entity_type,
-        func.count(Entity.id)
-    ).filter(
+        func.count()
+    ).where(
         Entity.contract_id == contract_id
     ).group_by(
         Entity.entity_type
-    ).all()
+    )
 
-    # Convert list of tuples to dictionary
-    return {entity_type: count for entity_type, count in results}
+    # (entity_type, count) rows convert straight into a dictionary
+    return dict(db.execute(stmt).all())
 
 
 # ============================================================================
@@ -573,8 +1533,10 @@ def create_summary(
     db: Session,
     contract_id: int,
     summary_type: str,
-    content: str,
-    role: Optional[str] = None
+    content: Optional[str],
+    role: Optional[str] = None,
+    content_json: Optional[Dict[str, Any]] = None,
+    commit: bool = True
 ) -> Summary:
     """
     Create a new summary record.
@@ -585,7 +1547,8 @@ def create_summary(
     - Plain-language summaries (summary_type='plain_language', role=None)
 
     For jurisdiction analysis, use summary_type='jurisdiction_analysis' and role=None.
-    The content should be a string - use json.dumps() for structured data.
+    Text content goes in `content`; structured data can be passed as a dict via
+    `content_json` (stored as JSONB, no string encoding round-trip).
 
     Args:
         db: Database session
@@ -593,6 +1556,9 @@ def create_summary(
         summary_type: Type of summary (e.g., 'jurisdiction_analysis', 'role_specific', 'plain_language')
         content: Summary content as string (use json.dumps() for structured data)
         role: Optional role for role-specific summaries (e.g., 'cfo', 'legal')
+        content_json: Optional structured payload stored in the JSONB column
+        commit: If True (default), commit the new row. If False, only flush
+            (the ID is populated via RETURNING); the caller commits
 
     Returns:
         Summary: Created summary object with auto-generated ID and timestamp
@@ -605,15 +1571,14 @@ def create_summary(
         contract_id=contract_id,
         summary_type=summary_type,
         content=content,
+        content_json=content_json,
         role=role
     )
     db.add(summary)
-    try:
-        db.commit()
-        db.refresh(summary)
-    except Exception:
-        db.rollback()
-        raise
+    # Type key, plus the role key for role-specific summaries
+    cache_keys = {(contract_id, summary_type), (contract_id, summary_type, role)}
+    _invalidate_latest_summaries(db, lambda key: key in cache_keys)
+    flush_pending(db, commit)
     return summary
 
 
@@ -643,12 +1608,13 @@ def get_summaries_by_contract(
         >>> # Get only jurisdiction analysis summaries
         >>> jurisdiction_summaries = get_summaries_by_contract(db, contract_id=1, summary_type='jurisdiction_analysis')
     """
-    query = db.query(Summary).filter(Summary.contract_id == contract_id)
-
     if summary_type:
-        query = query.filter(Summary.summary_type == summary_type)
+        return db.scalars(
+            _SUMMARIES_BY_TYPE_STMT,
+            {"contract_id": contract_id, "summary_type": summary_type}
+        ).all()
 
-    return query.order_by(Summary.created_at.desc()).all()
+    return db.scalars(_SUMMARIES_BY_CONTRACT_STMT, {"contract_id": contract_id}).all()
 
 
 def get_latest_summary(
@@ -675,17 +1641,40 @@ def get_latest_summary(
         >>> latest = get_latest_summary(db, contract_id=1, summary_type='jurisdiction_analysis')
         >>> if latest:
         ...     print(f"Analysis from {latest.created_at}")
-    """
-    return db.query(Summary).filter(
-        Summary.contract_id == contract_id,
-        Summary.summary_type == summary_type
-    ).order_by(Summary.created_at.desc()).first()
+
+    Note:
+        Served by ix_summaries_contract_type_created (contract_id, summary_type,
+        created_at): PostgreSQL reads the newest matching index entry instead
+        of sorting every summary for the contract.
+
+        The resulting primary key is cached per process for 60 seconds, so
+        repeat reads become a primary-key lookup (or an identity-map hit).
+        Summaries written by other worker processes may take up to the TTL
+        to be picked up.
+    """
+    cache_key = (contract_id, summary_type)
+    cached_id = _latest_summary_ids.get(cache_key)
+    if cached_id is not None:
+        summary = db.get(Summary, cached_id)
+        if summary is not None:
+            return summary
+        # Row was deleted behind the cache's back (e.g., cascade); fall through
+        _latest_summary_ids.invalidate(cache_key)
+
+    summary = db.scalars(
+        _LATEST_SUMMARY_STMT,
+        {"contract_id": contract_id, "summary_type": summary_type}
+    ).one_or_none()
+    if summary is not None:
+        _latest_summary_ids.set(cache_key, summary.id)
+    return summary
 
 
 def delete_summaries_by_type(
     db: Session,
     contract_id: int,
-    summary_type: str
+    summary_type: str,
+    commit: bool = True
 ) -> int:
     """
     Delete all summaries of a specific type for a contract.
@@ -697,6 +1686,8 @@ def delete_summaries_by_type(
         db: Database session
         contract_id: Parent contract ID
         summary_type: Summary type to delete (e.g., 'jurisdiction_analysis')
+        commit: If True (default), commit immediately. If False, the DELETE
+            runs in the caller's transaction.
 
     Returns:
         int: Number of summaries deleted
@@ -705,32 +1696,56 @@ def delete_summaries_by_type(
         >>> # Clear all jurisdiction analysis summaries for a contract
         >>> deleted = delete_summaries_by_type(db, contract_id=1, summary_type='jurisdiction_analysis')
         >>> print(f"Deleted {deleted} summaries")
-    """
-    deleted_count = db.query(Summary).filter(
+
+    Note:
+        Runs as a single server-side DELETE. synchronize_session="fetch" uses
+        DELETE ... RETURNING on PostgreSQL (no extra SELECT) to drop matching
+        Summary objects from this session, so a Contract whose
+        latest_jurisdiction_summary_id pointed at a deleted row resolves to None
+        on the next lookup (the database clears the pointer via ON DELETE SET
+        NULL).
+    """
+    stmt = delete(Summary).where(
         Summary.contract_id == contract_id,
         Summary.summary_type == summary_type
-    ).delete()
-    db.commit()
+    ).execution_options(synchronize_session="fetch")
+    deleted_count = db.execute(stmt).rowcount
+    _invalidate_latest_summaries(db, lambda key: key[:2] == (contract_id, summary_type))
+    flush_pending(db, commit)
     return deleted_count
 
 
 def create_jurisdiction_analysis(
     db: Session,
     contract_id: int,
-    analysis_data: Dict[str, Any]
+    analysis_data: Union[Dict[str, Any], str, bytes],
+    commit: bool = True
 ) -> Summary:
     """
     Convenience function for creating jurisdiction analysis records.
 
     This function automatically sets summary_type to 'jurisdiction_analysis'
-    and serializes the analysis data to JSON for storage. This is the
+    and stores the analysis dict in the JSONB `content_json` column (the
+    driver encodes it once; no indented text copy is kept). This is the
     recommended way to store jurisdiction analysis results.
 
+    The new row is also recorded in `contracts.latest_jurisdiction_summary_id`
+    in the same transaction, so get_jurisdiction_analysis can fetch it by
+    primary key.
+
+    If the analysis is already serialized (a JSON str or UTF-8 bytes, e.g. a
+    raw model response or pydantic `model_dump_json()` output), it is sent
+    as text and cast to JSONB by PostgreSQL, skipping the Python-side
+    dict -> JSON encode. The database rejects malformed JSON with a DataError.
+
     Args:
         db: Database session
         contract_id: Parent contract ID
-        analysis_data: Dictionary containing jurisdiction analysis results
+        analysis_data: Jurisdiction analysis results, as a dict
                        (from app.services.jurisdiction_analyzer.analyze_jurisdiction)
+                       or as an already-encoded JSON str/bytes document
+        commit: If True (default), commit the new row. If False, only flush;
+            the caller commits.
 
     Returns:
         Summary: Created summary object with jurisdiction analysis data
@@ -745,15 +1760,37 @@ def create_jurisdiction_analysis(
         >>> if not error:
         ...     summary = create_jurisdiction_analysis(db, contract.id, analysis_data)
         ...     print(f"Jurisdiction analysis saved at {summary.created_at}")
+
+        >>> # Pre-serialized payload, stored without re-encoding
+        >>> summary = create_jurisdiction_analysis(db, contract.id, model.model_dump_json())
     """
-    json_content = json.dumps(analysis_data, indent=2)
-    return create_summary(
+    if isinstance(analysis_data, bytes):
+        analysis_data = analysis_data.decode("utf-8")
+    if isinstance(analysis_data, str):
+        # CAST(:text AS JSONB): the server parses the document, no json.dumps
+        analysis_data = cast(literal(analysis_data, Text), JSONB)
+
+    summary = create_summary(
         db=db,
         contract_id=contract_id,
         summary_type='jurisdiction_analysis',
-        content=json_content,
-        role=None
+        content=None,
+        role=None,
+        content_json=analysis_data,
+        commit=False
     )
+    try:
+        # ORM-enabled UPDATE also refreshes the Contract in the identity map
+        db.execute(
+            update(Contract)
+            .where(Contract.id == contract_id)
+            .values(latest_jurisdiction_summary_id=summary.id)
+        )
+    except Exception:
+        db.rollback()
+        raise
+    flush_pending(db, commit)
+    return summary
 
 
 def get_jurisdiction_analysis(
@@ -764,8 +1801,13 @@ def get_jurisdiction_analysis(
     Convenience function for retrieving jurisdiction analysis.
 
     This function retrieves the most recent jurisdiction analysis for a contract
-    and automatically parses the JSON content back into a dictionary.
-    Returns both the Summary ORM object and the parsed analysis data.
+    through `Contract.latest_jurisdiction_summary_id`: two primary-key lookups,
+    both served from the identity map when the rows are already loaded, instead
+    of sorting the contract's summaries. Rows written by create_jurisdiction_analysis carry the dict in the JSONB
+    `content_json` column and need no parsing; older rows stored as JSON text
+    in `content` are parsed as before.
+    Returns both the Summary ORM object and the parsed analysis data; callers
+    that only need the row's metadata should use get_jurisdiction_analysis_meta.
 
     Args:
         db: Database session
@@ -783,26 +1825,68 @@ def get_jurisdiction_analysis(
         >>> else:
         ...     print("No jurisdiction analysis found")
     """
-    summary = get_latest_summary(
-        db=db,
-        contract_id=contract_id,
-        summary_type='jurisdiction_analysis'
-    )
+    contract = db.get(Contract, contract_id)
+    summary_id = contract.latest_jurisdiction_summary_id if contract else None
+    summary = db.get(Summary, summary_id) if summary_id is not None else None
 
     if summary:
+        if summary.content_json is not None:
+            return summary, summary.content_json
+
+        # Legacy rows: JSON text in content
         try:
-            parsed_data = json.loads(summary.content)
+            parsed_data = _parse_summary_content(summary.id, summary.content)
             return summary, parsed_data
         except json.JSONDecodeError as e:
-            # Delete corrupt cached record and commit
+            # Report a miss now; the corrupt row is deleted in the background
             logger.error(f"Invalid JSON in jurisdiction analysis {summary.id} for contract {contract_id}, purging: {str(e)}")
-            db.delete(summary)
-            db.commit()
+            _latest_summary_ids.invalidate((contract_id, 'jurisdiction_analysis'))
+            _schedule_summary_purge(db, summary.id)
             return None, None
 
     return None, None
 
 
+def get_jurisdiction_analysis_meta(
+    db: Session,
+    contract_id: int
+) -> Optional[Summary]:
+    """
+    Retrieve the latest jurisdiction analysis row without its payload.
+
+    Use this when only metadata is needed (e.g., `created_at` for an
+    "analyzed at" label or an existence check). The `content` and
+    `content_json` columns are deferred, so the analysis document is neither
+    transferred nor decoded; accessing either attribute later loads it with
+    one extra SELECT.
+
+    Args:
+        db: Database session
+        contract_id: Parent contract ID
+
+    Returns:
+        Summary object (payload columns deferred) or None if no analysis exists
+
+    Example:
+        >>> summary = get_jurisdiction_analysis_meta(db, contract_id=1)
+        >>> if summary:
+        ...     print(f"Analyzed at: {summary.created_at}")
+
+    Note:
+        If the row is already in the session's identity map (e.g., loaded by
+        get_jurisdiction_analysis), that fully loaded object is returned.
+    """
+    contract = db.get(Contract, contract_id)
+    summary_id = contract.latest_jurisdiction_summary_id if contract else None
+    if summary_id is None:
+        return None
+    return db.get(
+        Summary,
+        summary_id,
+        options=[defer(Summary.content), defer(Summary.content_json)]
+    )
+
+
 # ============================================================================
 # Risk Assessment CRUD Operations
 # ============================================================================
@@ -816,7 +1900,8 @@ def create_risk_assessment(
     description: str,
     justification: str,
     clause_id: Optional[int] = None,
-    recommendation: Optional[str] = None
+    recommendation: Optional[str] = None,
+    commit: bool = True
 ) -> RiskAssessment:
     """
     Create a risk assessment record from the risk analyzer service.
@@ -834,6 +1919,8 @@ def create_risk_assessment(
         justification: Detailed reasoning for the risk level assessment
         clause_id: Optional clause database ID if risk is clause-specific
         recommendation: Optional specific actionable mitigation strategy
+        commit: If True (default), commit the new row. If False, only flush;
+            the caller commits.
 
     Returns:
         RiskAssessment: Created risk assessment object with auto-generated ID and timestamp
@@ -850,9 +1937,9 @@ def create_risk_assessment(
         ... )
     """
     # Normalize risk_type and risk_level: strip whitespace then lowercase
-    # Handle None safely by only normalizing if value is truthy
-    normalized_risk_type = risk_type.strip().lower() if risk_type else risk_type
-    normalized_risk_level = risk_level.strip().lower() if risk_level else risk_level
+    # (None and empty values pass through unchanged)
+    normalized_risk_type = _normalize_risk_label(risk_type)
+    normalized_risk_level = _normalize_risk_label(risk_level)
 
     risk = RiskAssessment(
         contract_id=contract_id,
@@ -864,26 +1951,34 @@ def create_risk_assessment(
         recommendation=recommendation
     )
     db.add(risk)
-    try:
-        db.commit()
-        db.refresh(risk)  # Refresh to get auto-generated ID and timestamp
-    except Exception:
-        db.rollback()
-        raise
+    flush_pending(db, commit)  # ID and assessed_at come back via INSERT ... RETURNING
     return risk
 
 
-def bulk_create_risk_assessments(db: Session, risk_assessments: List[RiskAssessment]) -> None:
+def bulk_create_risk_assessments(
+    db: Session,
+    risk_assessments: List[RiskAssessment],
+    commit: bool = True
+) -> None:
     """
     Efficiently insert multiple risk assessments from analysis results.
 
     This optimizes insertion of multiple risk assessments from the risk analyzer,
-    reducing database round-trips. Uses add_all() to populate auto-generated IDs
-    and timestamps. The entire transaction is rolled back on failure.
+    reducing database round-trips. Rows are written with a single Core
+    `INSERT ... RETURNING id, assessed_at` executemany, which the PostgreSQL
+    dialect batches into multi-row VALUES statements (insertmanyvalues, up to
+    the engine's page size per statement) without unit-of-work bookkeeping.
+    The generated IDs and timestamps are assigned back onto the objects, which
+    stay transient (not added to the session). risk_type and risk_level are
+    normalized like create_risk_assessment does, and the normalized values are
+    written back onto the objects. The entire transaction is rolled back on
+    failure.
 
     Args:
         db: Database session
         risk_assessments: List of RiskAssessment objects to insert
+        commit: If True (default), commit the rows. If False, the caller
+            commits.
 
     Raises:
         IntegrityError: For constraint violations (e.g., foreign key)
@@ -896,18 +1991,41 @@ def bulk_create_risk_assessments(db: Session, risk_assessments: List[RiskAssessm
         ... ]
         >>> bulk_create_risk_assessments(db, risks)
     """
+    if not risk_assessments:
+        return
+
+    rows = [
+        {
+            "contract_id": risk.contract_id,
+            "clause_id": risk.clause_id,
+            "risk_type": _normalize_risk_label(risk.risk_type),
+            "risk_level": _normalize_risk_label(risk.risk_level),
+            "description": risk.description,
+            "justification": risk.justification,
+            "recommendation": risk.recommendation,
+        }
+        for risk in risk_assessments
+    ]
+    stmt = insert(RiskAssessment).returning(
+        RiskAssessment.id, RiskAssessment.assessed_at, sort_by_parameter_order=True
+    )
     try:
-        db.add_all(risk_assessments)
-        db.commit()
+        for risk, row, (risk_pk, assessed_at) in zip(risk_assessments, rows, db.execute(stmt, rows)):
+            risk.id = risk_pk
+            risk.assessed_at = assessed_at
+            risk.risk_type = row["risk_type"]
+            risk.risk_level = row["risk_level"]
     except IntegrityError:
         db.rollback()
         raise
+    flush_pending(db, commit)
 
 
 def get_risk_assessments_by_contract(
     db: Session,
     contract_id: int,
-    risk_level: Optional[str] = None
+    risk_level: Optional[str] = None,
+    include_clause: bool = False
 ) -> List[RiskAssessment]:
     """
     Retrieve all risk assessments for a contract with optional filtering by risk level.
@@ -919,6 +2037,9 @@ def get_risk_assessments_by_contract(
         db: Database session
         contract_id: Parent contract ID
         risk_level: Optional filter by risk level (low/medium/high)
+        include_clause: Eager load each risk's clause with one extra
+                        `WHERE id IN (...)` SELECT (selectinload), for
+                        clause-level risk views that render clause details
 
     Returns:
         List of risk assessment objects ordered by severity and recency
@@ -929,25 +2050,20 @@ def get_risk_assessments_by_contract(
         >>> # Get only high-risk items
         >>> high_risks = get_risk_assessments_by_contract(db, contract_id=1, risk_level='high')
     """
-    query = db.query(RiskAssessment).filter(RiskAssessment.contract_id == contract_id)
-
+    # Ordered by the generated severity rank, then assessed_at descending;
+    # ix_risk_assessments_contract_rank_assessed serves this order directly.
+    # A level filter drops the (constant) rank and uses
+    # ix_risk_assessments_contract_risk_assessed instead.
+    params = {"contract_id": contract_id}
+    stmt = _RISKS_BY_CONTRACT_STMT
     if risk_level:
-        normalized_risk_level = risk_level.strip().lower()
-        query = query.filter(RiskAssessment.risk_level == normalized_risk_level)
-
-    # Order by risk level using CASE expression to map severity to numeric order
-    # (high=3, medium=2, low=1), then by assessed_at descending
-    from sqlalchemy import case
-    severity_order = case(
-        (RiskAssessment.risk_level == 'high', 3),
-        (RiskAssessment.risk_level == 'medium', 2),
-        (RiskAssessment.risk_level == 'low', 1),
-        else_=0
-    )
-    return query.order_by(
-        severity_order.desc(),
-        RiskAssessment.assessed_at.desc()
-    ).all()
+        params["risk_level"] = _normalize_risk_label(risk_level)
+        stmt = _RISKS_BY_LEVEL_STMT
+
+    if include_clause:
+        stmt = stmt.options(selectinload(RiskAssessment.clause))
+
+    return db.scalars(stmt, params).all()
 
 
 def get_risk_assessments_by_clause(db: Session, clause_id: int) -> List[RiskAssessment]:
@@ -968,16 +2084,7 @@ def get_risk_assessments_by_clause(db: Session, clause_id: int) -> List[RiskAsse
         >>> # Get all risks for a specific clause
         >>> clause_risks = get_risk_assessments_by_clause(db, clause_id=5)
     """
-    from sqlalchemy import case
-    severity_order = case(
-        (RiskAssessment.risk_level == 'high', 3),
-        (RiskAssessment.risk_level == 'medium', 2),
-        (RiskAssessment.risk_level == 'low', 1),
-        else_=0
-    )
-    return db.query(RiskAssessment).filter(
-        RiskAssessment.clause_id == clause_id
-    ).order_by(severity_order.desc()).all()
+    return db.scalars(_RISKS_BY_CLAUSE_STMT, {"clause_id": clause_id}).all()
 
 
 def count_risks_by_level(db: Session, contract_id: int) -> dict:
@@ -998,14 +2105,15 @@ def count_risks_by_level(db: Session, contract_id: int) -> dict:
         >>> summary = count_risks_by_level(db, contract_id=1)
         >>> print(f"Found {summary.get('high', 0)} high-risk items")
     """
-    results = db.query(
+    stmt = select(
         RiskAssessment.risk_level,
         func.count(RiskAssessment.id)
-    ).filter(
+    ).where(
         RiskAssessment.contract_id == contract_id
     ).group_by(
         RiskAssessment.risk_level
-    ).all()
+    )
+    results = db.execute(stmt).all()
 
     # Convert list of tuples to dictionary
     return {risk_level: count for risk_level, count in results}
@@ -1029,20 +2137,21 @@ def count_risks_by_type(db: Session, contract_id: int) -> dict:
         >>> type_breakdown = count_risks_by_type(db, contract_id=1)
         >>> print(f"Found {type_breakdown.get('indemnity', 0)} indemnity risks")
     """
-    results = db.query(
+    stmt = select(
         RiskAssessment.risk_type,
         func.count(RiskAssessment.id)
-    ).filter(
+    ).where(
         RiskAssessment.contract_id == contract_id
     ).group_by(
         RiskAssessment.risk_type
-    ).all()
+    )
+    results = db.execute(stmt).all()
 
     # Convert list of tuples to dictionary
     return {risk_type: count for risk_type, count in results}
 
 
-def delete_risk_assessments_by_contract(db: Session, contract_id: int) -> int:
+def delete_risk_assessments_by_contract(db: Session, contract_id: int, commit: bool = True) -> int:
     """
     Delete all risk assessments for a contract.
 
@@ -1052,6 +2161,8 @@ def delete_risk_assessments_by_contract(db: Session, contract_id: int) -> int:
     Args:
         db: Database session
         contract_id: Parent contract ID
+        commit: If True (default), commit immediately. If False, the DELETE
+            runs in the caller's transaction.
 
     Returns:
         int: Number of risk assessments deleted
@@ -1060,11 +2171,18 @@ def delete_risk_assessments_by_contract(db: Session, contract_id: int) -> int:
         >>> # Clear all risk assessments for a contract
         >>> deleted = delete_risk_assessments_by_contract(db, contract_id=1)
         >>> print(f"Deleted {deleted} risk assessments")
+
+    Note:
+        Runs as a pure server-side DELETE (synchronize_session=False): the
+        identity map is not scanned for matching objects. RiskAssessment rows
+        already loaded in this session are left in it and should not be
+        reused after the call.
     """
-    deleted_count = db.query(RiskAssessment).filter(
+    stmt = delete(RiskAssessment).where(
         RiskAssessment.contract_id == contract_id
-    ).delete()
-    db.commit()
+    ).execution_options(synchronize_session=False)
+    deleted_count = db.execute(stmt).rowcount
+    flush_pending(db, commit)
     return deleted_count
 
 
@@ -1073,7 +2191,11 @@ def get_high_risk_assessments(db: Session, contract_id: int) -> List[RiskAssessm
     Convenience function to get only high-risk items for a contract.
 
     This provides quick access to critical risks without filtering manually.
-    Equivalent to calling get_risk_assessments_by_contract with risk_level='high'.
+    Equivalent to calling get_risk_assessments_by_contract with risk_level='high',
+    but runs the level-filtered statement directly (the literal needs no
+    normalization): WHERE contract_id = ? AND risk_level = 'high'
+    ORDER BY assessed_at DESC, a range scan of
+    ix_risk_assessments_contract_risk_assessed with no sort step.
 
     Args:
         db: Database session
@@ -1088,7 +2210,7 @@ def get_high_risk_assessments(db: Session, contract_id: int) -> List[RiskAssessm
         >>> for risk in critical_risks:
         ...     print(f"HIGH RISK: {risk.description}")
     """
-    return get_risk_assessments_by_contract(db, contract_id, risk_level='high')
+    return db.scalars(_RISKS_BY_LEVEL_STMT, {"contract_id": contract_id, "risk_level": "high"}).all()
 
 
 # ============================================================================
@@ -1099,7 +2221,9 @@ def create_contract_summary(
     db: Session,
     contract_id: int,
     summary_data: Dict[str, Any],
-    role: Optional[str] = None
+    role: Optional[str] = None,
+    pretty: bool = False,
+    commit: bool = True
 ) -> Summary:
     """
     Convenience function for creating contract summary records.
@@ -1113,6 +2237,11 @@ def create_contract_summary(
         contract_id: Parent contract ID
         summary_data: Summary data dictionary from summarizer service
         role: Optional role perspective ('supplier', 'client', or None for neutral)
+        pretty: Store indented JSON (for inspecting rows by hand). Defaults to
+                compact JSON, since the content is only read back by code and
+                indentation roughly doubles the stored size.
+        commit: If True (default), commit the new row. If False, only flush;
+            the caller commits.
 
     Returns:
         Created Summary object with timestamp
@@ -1143,7 +2272,7 @@ def create_contract_summary(
             summary_type = 'role_specific'
 
         # Serialize summary data to JSON
-        json_content = json.dumps(summary_data, indent=2)
+        json_content = _dumps_json(summary_data, indent=pretty)
 
         # Create summary using generic function
         summary = create_summary(
@@ -1151,7 +2280,8 @@ def create_contract_summary(
             contract_id=contract_id,
             summary_type=summary_type,
             content=json_content,
-            role=role
+            role=role,
+            commit=commit
         )
 
         return summary
@@ -1206,31 +2336,35 @@ def get_contract_summary(
         else:
             summary_type = 'role_specific'
 
-        # Query for the latest summary with appropriate filters
-        query = db.query(Summary).filter(
-            Summary.contract_id == contract_id,
-            Summary.summary_type == summary_type
-        )
-
-        # Add role filter for role-specific summaries
-        if role is not None:
-            query = query.filter(Summary.role == role)
-
-        # Get the most recent summary
-        summary = query.order_by(Summary.created_at.desc()).first()
+        # Get the most recent summary, filtered by role for role-specific
+        # summaries; both paths go through the latest-summary id cache
+        if role is None:
+            cache_key = (contract_id, summary_type)
+            summary = get_latest_summary(db, contract_id, summary_type)
+        else:
+            cache_key = (contract_id, summary_type, role)
+            cached_id = _latest_summary_ids.get(cache_key)
+            summary = db.get(Summary, cached_id) if cached_id is not None else None
+            if summary is None:
+                summary = db.scalars(
+                    _LATEST_ROLE_SUMMARY_STMT,
+                    {"contract_id": contract_id, "summary_type": summary_type, "role": role}
+                ).one_or_none()
+                if summary is not None:
+                    _latest_summary_ids.set(cache_key, summary.id)
 
         if summary is None:
             return None, None
 
         # Parse JSON content back to dict
         try:
-            parsed_data = json.loads(summary.content)
+            parsed_data = _parse_summary_content(summary.id, summary.content)
             return summary, parsed_data
         except json.JSONDecodeError as e:
-            # Delete corrupt cached record and commit
+            # Report a miss now; the corrupt row is deleted in the background
             logger.error(f"Invalid JSON in contract summary {summary.id} for contract {contract_id}, purging: {str(e)}")
-            db.delete(summary)
-            db.commit()
+            _latest_summary_ids.invalidate(cache_key)
+            _schedule_summary_purge(db, summary.id)
             return None, None
 
     except Exception as e:
@@ -1238,10 +2372,39 @@ def get_contract_summary(
         return None, None
 
 
-def get_all_contract_summaries(
+def _iter_contract_summaries(
     db: Session,
     contract_id: int
-) -> List[Tuple[Summary, Dict[str, Any]]]:
+) -> Iterator[Tuple[Summary, Dict[str, Any]]]:
+    """
+    Yield (summary, parsed data) pairs, fetching STREAM_BATCH_SIZE rows at a time.
+
+    Parses with _loads_json directly rather than the memoized parser, so each
+    dict can be freed as soon as the consumer moves on. Errors are logged and
+    end the iteration, mirroring get_all_contract_summaries.
+    """
+    try:
+        summaries = db.scalars(
+            _CONTRACT_SUMMARIES_STMT,
+            {"contract_id": contract_id},
+            execution_options={"yield_per": STREAM_BATCH_SIZE}
+        )
+        for summary in summaries:
+            try:
+                parsed_data = _loads_json(summary.content)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse summary {summary.id}: {str(e)}")
+                continue
+            yield summary, parsed_data
+    except Exception as e:
+        logger.error(f"Failed to retrieve all summaries for contract {contract_id}: {str(e)}")
+
+
+def get_all_contract_summaries(
+    db: Session,
+    contract_id: int,
+    stream: bool = False
+) -> Iterable[Tuple[Summary, Dict[str, Any]]]:
     """
     Retrieve all summaries for a contract (both contract_overview and role_specific).
 
@@ -1251,9 +2414,14 @@ def get_all_contract_summaries(
     Args:
         db: Database session
         contract_id: Parent contract ID
+        stream: If True, return a single-pass generator that fetches rows in
+                batches of STREAM_BATCH_SIZE and parses each summary only when
+                it is reached, instead of holding every row and parsed dict
+                at once. Consume it before the session is closed.
 
     Returns:
         List of tuples: [(Summary object, parsed data dict), ...]
+        (generator of the same tuples if stream=True)
 
     Example:
         >>> summaries = get_all_contract_summaries(db, contract_id=1)
@@ -1262,18 +2430,20 @@ def get_all_contract_summaries(
         ...     print(f"Created: {summary.created_at}")
         ...     print(f"Summary: {data['summary'][:100]}...")
     """
+    if stream:
+        return _iter_contract_summaries(db, contract_id)
+
     try:
         # Query for all summaries of relevant types
-        summaries = db.query(Summary).filter(
-            Summary.contract_id == contract_id,
-            Summary.summary_type.in_(['contract_overview', 'role_specific'])
-        ).order_by(Summary.created_at.desc()).all()
+        summaries = db.scalars(
+            _CONTRACT_SUMMARIES_STMT, {"contract_id": contract_id}
+        ).all()
 
         # Parse JSON content for each summary
         results = []
         for summary in summaries:
             try:
-                parsed_data = json.loads(summary.content)
+                parsed_data = _parse_summary_content(summary.id, summary.content)
                 results.append((summary, parsed_data))
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse summary {summary.id}: {str(e)}")
@@ -1297,14 +2467,16 @@ def create_qa_record(
     question: str,
     answer: str,
     referenced_clause_ids: List[int],
-    confidence: Optional[str] = None
+    confidence: Optional[str] = None,
+    commit: bool = True
 ) -> QAHistory:
     """
     Create a Q&A record from the qa_engine service.
 
     This function stores a question-answer interaction in the database, including
     the list of clause IDs that were referenced in generating the answer. The
-    referenced_clause_ids list is automatically serialized to JSON for storage.
+    referenced_clause_ids list is stored as a native integer[] column; the
+    driver sends it as an array literal, with no JSON encoding step.
 
     Args:
         db: Database session
@@ -1313,6 +2485,8 @@ def create_qa_record(
         answer: AI-generated answer (2-4 paragraphs)
         referenced_clause_ids: List of clause database IDs used to generate answer
         confidence: Optional answer confidence level (high/medium/low)
+        commit: If True (default), commit the new row. If False, only flush;
+            the caller commits.
 
     Returns:
         QAHistory: Created Q&A history object with auto-generated ID and timestamp
@@ -1329,25 +2503,17 @@ def create_qa_record(
         ... )
         >>> print(f"Q&A stored with ID {qa_record.id} at {qa_record.asked_at}")
     """
-    # Convert referenced_clause_ids list to JSON string
-    referenced_clauses_json = json.dumps(referenced_clause_ids)
-
     qa_history = QAHistory(
         contract_id=contract_id,
         question=question,
         answer=answer,
-        referenced_clauses=referenced_clauses_json,
+        referenced_clauses=list(referenced_clause_ids),
         confidence=confidence
     )
 
     db.add(qa_history)
-    try:
-        db.commit()
-        db.refresh(qa_history)  # Refresh to get auto-generated ID and timestamp
-        return qa_history
-    except Exception:
-        db.rollback()
-        raise
+    flush_pending(db, commit)  # ID and asked_at come back via INSERT ... RETURNING
+    return qa_history
 
 
 def get_qa_history_by_contract(
@@ -1377,11 +2543,7 @@ def get_qa_history_by_contract(
         ...     print(f"A: {qa.answer[:100]}...")
         ...     print(f"Asked at: {qa.asked_at}")
     """
-    return db.query(QAHistory).filter(
-        QAHistory.contract_id == contract_id
-    ).order_by(
-        QAHistory.asked_at.desc()
-    ).limit(limit).all()
+    return db.scalars(_QA_HISTORY_STMT, {"contract_id": contract_id, "limit": limit}).all()
 
 
 def get_qa_record(db: Session, qa_id: int) -> Optional[QAHistory]:
@@ -1403,36 +2565,26 @@ def get_qa_record(db: Session, qa_id: int) -> Optional[QAHistory]:
         ...     print(f"Question: {qa.question}")
         ...     print(f"Answer: {qa.answer}")
     """
-    return db.query(QAHistory).filter(QAHistory.id == qa_id).first()
+    return db.get(QAHistory, qa_id)
 
 
-def parse_referenced_clauses(referenced_clauses_json: Optional[str]) -> List[int]:
+def parse_referenced_clauses(referenced_clauses: Optional[List[int]]) -> List[int]:
     """
-    Helper function to parse JSON string back to list of clause IDs.
+    Helper function to read the list of clause IDs from a QAHistory record.
 
-    This safely parses the referenced_clauses field from QAHistory objects,
-    handling None values and JSON decode errors gracefully.
+    referenced_clauses is an integer[] column, so the driver already returns a
+    list of ints; this only maps NULL to an empty list. Kept so callers need
+    not special-case None.
 
     Args:
-        referenced_clauses_json: JSON string containing list of clause IDs
+        referenced_clauses: QAHistory.referenced_clauses value
 
     Returns:
-        List of clause IDs (empty list if None or parse error)
+        List of clause IDs (empty list if None)
 
     Example:
         >>> qa = get_qa_record(db, qa_id=1)
         >>> clause_ids = parse_referenced_clauses(qa.referenced_clauses)
         >>> print(f"Referenced clauses: {clause_ids}")
     """
-    if not referenced_clauses_json:
-        return []
-
-    try:
-        clause_ids = json.loads(referenced_clauses_json)
-        # Ensure it's a list of integers
-        if isinstance(clause_ids, list):
-            return [int(cid) for cid in clause_ids if isinstance(cid, (int, str)) and str(cid).isdigit()]
-        return []
-    except (json.JSONDecodeError, ValueError, TypeError) as e:
-        logger.exception(f"Failed to parse referenced_clauses JSON: {str(e)}")
-        return []
+    return list(referenced_clauses) if referenced_clauses else []
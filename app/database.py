@@ -12,33 +12,88 @@ Architecture:
 - get_db(): FastAPI dependency that provides sessions with automatic cleanup
 """
 
-from sqlalchemy import create_engine, Engine, text
+import logging
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from sqlalchemy import create_engine, Connection, Engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 from app.config import get_settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 
 # Database engine configuration
 settings = get_settings()
+
+# psycopg2-specific executemany tuning: batch multi-row INSERTs via
+# insertmanyvalues and route executemany UPDATE/DELETE through execute_batch
+_driver_options = {}
+if make_url(settings.database_url).get_driver_name() == "psycopg2":
+    _driver_options["executemany_mode"] = "values_plus_batch"
+    # Bound worst-case query time so a stuck statement cannot hold a pool slot
+    # indefinitely (libpq startup option, applied once per new connection)
+    if settings.db_statement_timeout_ms > 0:
+        _driver_options["connect_args"] = {
+            "options": f"-c statement_timeout={settings.db_statement_timeout_ms}"
+        }
+
+# JSON/JSONB columns (e.g. summaries.content_json) are encoded on bind and
+# decoded on fetch with orjson when installed instead of the stdlib json module
+_json_options = {}
+if orjson is not None:
+    def _orjson_serializer(value) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _json_options["json_serializer"] = _orjson_serializer
+    _json_options["json_deserializer"] = orjson.loads
+
 engine: Engine = create_engine(
     settings.database_url,
-    echo=settings.environment == "development",  # SQL query logging in development
-    pool_pre_ping=True,  # Verify connections before using them
-    pool_size=5,  # Base connection pool size
-    max_overflow=10,  # Additional connections under load
+    insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT ... VALUES batch
+    query_cache_size=1200,  # Compiled-statement LRU cache entries (default 500)
+    **_driver_options,
+    **_json_options,
+    echo=False,  # SQL logging goes through the "sqlalchemy.engine" logger (below)
+    pool_pre_ping=settings.db_pool_pre_ping,  # Verify connections before using them
+    pool_size=settings.db_pool_size,  # Base connection pool size
+    max_overflow=settings.db_max_overflow,  # Additional connections under load
+    pool_recycle=settings.db_pool_recycle,  # Replace connections before server/NAT idle timeouts
+    pool_timeout=settings.db_pool_timeout,  # Fail fast instead of queueing 30s when the pool is exhausted
+)
+
+# SQL statement logging: INFO on the standard "sqlalchemy.engine" logger in
+# development instead of echo=True (which attaches its own stdout handler).
+# No handler is added here, so output goes wherever the process's logging
+# config routes it (e.g. a file via uvicorn --log-config), or nowhere; outside
+# development the level check skips statement formatting entirely.
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if settings.environment == "development" else logging.WARNING
 )
 
 # Session factory
 SessionLocal = sessionmaker(
     autocommit=False,  # Require explicit commits
     autoflush=False,  # Control when changes are flushed
+    expire_on_commit=False,  # Keep loaded/RETURNING values after commit (no refresh SELECTs)
     bind=engine,
 )
 
 
 # Declarative base for ORM models using SQLAlchemy 2.0 style
 class Base(DeclarativeBase):
-    """Base class for all ORM models using SQLAlchemy 2.0 declarative style."""
-    pass
+    """
+    Base class for all ORM models using SQLAlchemy 2.0 declarative style.
+
+    eager_defaults makes every INSERT fetch server-generated values (e.g.
+    created_at timestamps from server_default=func.now()) through RETURNING
+    during flush, so new objects are complete without a follow-up refresh.
+    """
+    __mapper_args__ = {"eager_defaults": True}
 
 
 def get_db():
@@ -64,24 +119,72 @@ def get_db():
         db.close()
 
 
-def enable_pgvector_extension() -> None:
+# SQLSTATE codes (PostgreSQL error codes appendix) with a known setup fix
+SQLSTATE_INSUFFICIENT_PRIVILEGE = "42501"
+# Extension control file missing: 58P01 up to PostgreSQL 14, 0A000 since 15
+SQLSTATE_EXTENSION_UNAVAILABLE = ("58P01", "0A000")
+
+
+def sqlstate(error: DBAPIError) -> Optional[str]:
+    """
+    Return the SQLSTATE code of a database error, if the driver reports one.
+
+    psycopg2 exposes it as `pgcode`, psycopg 3 as `sqlstate`. Errors raised
+    by libpq before the server answers (e.g. connection refused) have none.
+
+    Args:
+        error: DBAPIError raised by SQLAlchemy
+
+    Returns:
+        Five-character SQLSTATE, or None
+    """
+    return getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
+
+
+@contextmanager
+def ddl_connection(connection: Optional[Connection] = None) -> Iterator[Connection]:
+    """
+    Yield a connection for schema setup statements.
+
+    Reuses the caller's connection (and its transaction) when one is given,
+    so several setup steps share one pooled connection and commit together;
+    otherwise checks out a connection in a transaction that commits on exit
+    and rolls back on error (engine.begin()).
+
+    Args:
+        connection: Optional connection already inside a transaction
+
+    Yields:
+        Connection to execute DDL on
+    """
+    if connection is not None:
+        yield connection
+    else:
+        with engine.begin() as connection:
+            yield connection
+
+
+def enable_pgvector_extension(connection: Optional[Connection] = None) -> None:
     """
     Enable the pgvector extension in PostgreSQL.
 
     The pgvector extension provides vector similarity search capabilities
     required for semantic search of clause embeddings.
 
+    Args:
+        connection: Optional connection to run in (the caller commits);
+                    a separate transaction is used when omitted
+
     Raises:
         Exception: If pgvector is not installed on PostgreSQL server
         Exception: If database user lacks CREATE EXTENSION privilege
     """
     try:
-        with engine.connect() as connection:
+        with ddl_connection(connection) as connection:
             connection.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-            connection.commit()
-    except Exception as e:
-        error_msg = str(e).lower()
-        if "could not open extension control file" in error_msg or "does not exist" in error_msg:
+    except DBAPIError as e:
+        code = sqlstate(e)
+        if code in SQLSTATE_EXTENSION_UNAVAILABLE:
             raise Exception(
                 "pgvector extension is not installed on PostgreSQL server.\n"
                 "Installation instructions:\n"
@@ -90,7 +193,7 @@ def enable_pgvector_extension() -> None:
                 "  Docker:         use ankane/pgvector PostgreSQL image\n"
                 "  Documentation:  https://github.com/pgvector/pgvector"
             ) from e
-        elif "permission denied" in error_msg or "must be owner" in error_msg:
+        elif code == SQLSTATE_INSUFFICIENT_PRIVILEGE:
             raise Exception(
                 "Database user lacks CREATE EXTENSION privilege.\n"
                 "To fix, run as PostgreSQL superuser:\n"
@@ -19,25 +19,106 @@ Usage:
 
 This script is safe to run multiple times (idempotent operation).
 Future schema changes should use Alembic migrations.
+
+Vector search pattern:
+    The HNSW index on clauses.embedding is only used for a flat query of the form
+        SELECT ... FROM clauses WHERE contract_id = ANY(:ids)
+        ORDER BY embedding <#> :query LIMIT :k
+    Joining other tables, or wrapping the ordering in a CTE/subquery, makes the
+    planner fall back to a sequential scan. The contract_id prefilter is served
+    by ix_clauses_contract_id (created with the table). Selective filters
+    shrink the candidate set the index returns, so raise hnsw.ef_search /
+    ivfflat.probes for them.
+
+    When a metadata filter is tight (e.g. contracts uploaded in a narrow
+    window, served by the BRIN index ix_contracts_uploaded_at_brin), it is
+    cheaper to filter first and sort the few survivors exactly. Force that
+    order with a MATERIALIZED CTE - since PostgreSQL 12 a plain CTE is
+    inlined and the planner may pick the vector index instead:
+        WITH candidates AS MATERIALIZED (
+            SELECT cl.id, cl.embedding FROM clauses cl
+            JOIN contracts c ON c.id = cl.contract_id
+            WHERE c.uploaded_at >= :since
+        )
+        SELECT id FROM candidates ORDER BY embedding <#> :query LIMIT :k
+    This never uses the vector index, so keep it for filters that leave a
+    small candidate set.
 """
 
+import math
 import re
-from sqlalchemy import text
-from app.database import engine, Base, enable_pgvector_extension
-from app.config import get_settings
-
-# Import all models to register them with Base.metadata
-from app.models import (  # noqa: F401
-    Contract,
-    Clause,
-    Entity,
-    RiskAssessment,
-    Summary,
-    QAHistory
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import DBAPIError, OperationalError
+from app.database import engine, Base, ddl_connection, enable_pgvector_extension, sqlstate
+from app.config import EMBEDDING_DIMENSIONS, get_settings
+
+# user:password@ part of a database URL, masked before printing
+_DSN_PASSWORD_RE = re.compile(r'://([^:]+):([^@]+)@')
+
+# halfvec (FP16 vectors) and its operator classes need pgvector 0.7.0+
+HALFVEC_MIN_PGVECTOR_VERSION = (0, 7, 0)
+
+# Operator class of the clause vector indexes: negative inner product (<#>).
+# Embeddings are stored unit length, where inner product ranks exactly like
+# cosine distance but skips the two norm computations per comparison
+VECTOR_INDEX_OPCLASS = "halfvec_ip_ops"
+
+# HNSW build memory: the graph build is much faster while it fits in
+# maintenance_work_mem (PostgreSQL logs "hnsw graph no longer fits" otherwise)
+VECTOR_INDEX_BUILD_MEMORY = "2GB"
+
+# Guidance for init failures, keyed by SQLSTATE (stable across server locales,
+# unlike the message text)
+_CONNECTION_HELP = (
+    "Cannot connect to PostgreSQL database",
+    [
+        "Troubleshooting:",
+        "  1. Ensure PostgreSQL is running",
+        "  2. Verify DATABASE_URL in .env file",
+        "  3. Check database exists: createdb <database_name>",
+        "  4. Test connection: psql <database_url>",
+    ],
 )
-
-
-def create_tables() -> None:
+_AUTH_HELP = ("Authentication failed", ["Check DATABASE_URL credentials in .env file"])
+_INIT_ERROR_HELP: Dict[str, Tuple[str, List[str]]] = {
+    "08001": _CONNECTION_HELP,  # sqlclient_unable_to_establish_sqlconnection
+    "08006": _CONNECTION_HELP,  # connection_failure
+    "28000": _AUTH_HELP,  # invalid_authorization_specification
+    "28P01": _AUTH_HELP,  # invalid_password
+    "3D000": (  # invalid_catalog_name
+        "Database does not exist",
+        [
+            "Create the database first:",
+            "  createdb legal_analyst",
+            "  OR: psql -U postgres -c 'CREATE DATABASE legal_analyst;'",
+        ],
+    ),
+    "42501": (  # insufficient_privilege
+        "Database user lacks the privileges needed for initialization",
+        ["Run python -m app.db_init as the database owner, or grant CREATE on the schema"],
+    ),
+}
+
+# psycopg2 raises connection-time failures (bad password, missing database)
+# without a SQLSTATE, so those are recognized from libpq's message text; any
+# other connection failure falls back to 08001
+_CONNECTION_ERROR_PATTERNS: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"authentication failed"), "28P01"),
+    (re.compile(r'database ".*" does not exist'), "3D000"),
+]
+
+
+def _connection_error_code(error: OperationalError) -> str:
+    """Map a connection error without a SQLSTATE to the closest _INIT_ERROR_HELP key."""
+    message = str(error.orig if error.orig is not None else error)
+    for pattern, code in _CONNECTION_ERROR_PATTERNS:
+        if pattern.search(message):
+            return code
+    return "08001"
+
+
+def create_tables(connection: Optional[Connection] = None) -> None:
     """
     Create all database tables defined in app/models.py.
 
@@ -49,12 +130,21 @@ def create_tables() -> None:
     - risk_assessments: Store risk analysis results
     - summaries: Store plain-language summaries
     - qa_history: Store question-answer interactions
+    - embedding_cache: Store clause embeddings by text hash
 
     This operation is idempotent - safe to run multiple times.
+
+    Args:
+        connection: Optional connection to run in (the caller commits);
+                    a separate transaction is used when omitted
     """
     try:
         print("\nCreating database tables...")
-        Base.metadata.create_all(bind=engine)
+        # Imported here, not at module level: registers the tables with
+        # Base.metadata only for callers that actually create them
+        from app import models  # noqa: F401
+        with ddl_connection(connection) as connection:
+            Base.metadata.create_all(bind=connection)
         print("✓ Database tables created successfully")
         print("\nTables created:")
         print("  - contracts")
@@ -63,30 +153,242 @@ def create_tables() -> None:
         print("  - risk_assessments")
         print("  - summaries")
         print("  - qa_history")
+        print("  - embedding_cache")
     except Exception as e:
         print(f"\n❌ ERROR creating tables: {e}")
         raise
 
 
+def _pgvector_version(connection) -> Tuple[int, ...]:
+    """
+    Return the installed pgvector extension version as a tuple of ints.
+
+    Args:
+        connection: Open SQLAlchemy connection
+
+    Returns:
+        Version tuple, e.g. (0, 7, 4); (0,) if the extension is not installed
+    """
+    version = connection.execute(
+        text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    ).scalar_one_or_none()
+    if not version:
+        return (0,)
+    return tuple(int(part) for part in re.findall(r"\d+", version))
+
+
+def _column_type(connection, table: str, column: str) -> str:
+    """
+    Return the formatted SQL type of a column, e.g. 'halfvec(768)'.
+
+    Args:
+        connection: Open SQLAlchemy connection
+        table: Table name
+        column: Column name
+
+    Returns:
+        Type as printed by format_type()
+    """
+    return connection.execute(
+        text("""
+            SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+            WHERE attrelid = CAST(:table AS regclass) AND attname = :column
+        """),
+        {"table": table, "column": column}
+    ).scalar_one()
+
+
+def convert_embedding_columns(connection: Optional[Connection] = None) -> None:
+    """
+    Bring existing embedding columns to the current storage format.
+
+    create_all() does not alter existing tables, so databases created with an
+    older layout are converted here (same steps as migrations 012 and 013):
+    - clauses.embedding becomes halfvec(EMBEDDING_DIMENSIONS)
+    - embedding_cache.embedding becomes vector(EMBEDDING_DIMENSIONS)
+
+    Longer text-embedding-3 vectors are shortened Matryoshka-style: the first
+    EMBEDDING_DIMENSIONS components are kept and re-normalized to unit length,
+    which is what the API returns when asked for fewer dimensions. Vector
+    indexes on clauses.embedding are dropped first (their operator class and
+    dimensions no longer match); create_vector_index rebuilds them afterwards.
+
+    Columns already in the target type are left alone, and nothing is
+    converted (with a warning) when the installed pgvector is older than
+    HALFVEC_MIN_PGVECTOR_VERSION.
+
+    Args:
+        connection: Optional connection to run in (the caller commits);
+                    a separate transaction is used when omitted
+
+    Raises:
+        Exception: If an ALTER TABLE fails (the transaction is rolled back)
+    """
+    clause_target = f"halfvec({EMBEDDING_DIMENSIONS})"
+    cache_target = f"vector({EMBEDDING_DIMENSIONS})"
+    with ddl_connection(connection) as connection:
+        clause_type = _column_type(connection, "clauses", "embedding")
+        cache_type = _column_type(connection, "embedding_cache", "embedding")
+        if clause_type == clause_target and cache_type == cache_target:
+            return
+
+        version = _pgvector_version(connection)
+        if version < HALFVEC_MIN_PGVECTOR_VERSION:
+            print(
+                f"\n⚠ WARNING: pgvector {'.'.join(map(str, version))} has no halfvec type; "
+                f"upgrade to 0.7.0+ (ALTER EXTENSION vector UPDATE) and re-run to convert clauses.embedding"
+            )
+            return
+
+        # Rewrites whole tables; not bounded by the app's statement_timeout
+        connection.execute(text("SET LOCAL statement_timeout = 0"))
+        if clause_type != clause_target:
+            print(f"\nConverting clauses.embedding from {clause_type} to {clause_target}...")
+            connection.execute(text("DROP INDEX IF EXISTS ix_clauses_embedding_hnsw"))
+            connection.execute(text("DROP INDEX IF EXISTS ix_clauses_embedding_ivfflat"))
+            connection.execute(text(
+                f"ALTER TABLE clauses ALTER COLUMN embedding TYPE {clause_target} "
+                f"USING l2_normalize(subvector(embedding, 1, {EMBEDDING_DIMENSIONS}))::{clause_target}"
+            ))
+        if cache_type != cache_target:
+            print(f"\nConverting embedding_cache.embedding from {cache_type} to {cache_target}...")
+            connection.execute(text(
+                f"ALTER TABLE embedding_cache ALTER COLUMN embedding TYPE {cache_target} "
+                f"USING l2_normalize(subvector(embedding, 1, {EMBEDDING_DIMENSIONS}))::{cache_target}"
+            ))
+        print(f"✓ Embedding columns converted ({clause_target} / {cache_target})")
+
+
+def configure_index_params(row_count: int) -> Dict[str, int]:
+    """
+    Choose vector index parameters for the current size of the clauses table.
+
+    HNSW parameters grow in tiers so recall holds as the graph gets larger:
+    - < 100k rows: m=16, ef_construction=64, ef_search=40 (pgvector defaults)
+    - < 1M rows:   m=24, ef_construction=100, ef_search=100
+    - otherwise:   m=32, ef_construction=128, ef_search=200
+
+    The IVFFlat fallback (used if the HNSW build fails) uses the rows / 1000
+    rule for lists, clamped to 10..1000, and probes = sqrt(lists).
+
+    Args:
+        row_count: Number of rows in clauses
+
+    Returns:
+        Dict with keys m, ef_construction, ef_search (HNSW) and lists, probes (IVFFlat)
+
+    Example:
+        >>> configure_index_params(250_000)
+        {'m': 24, 'ef_construction': 100, 'ef_search': 100, 'lists': 250, 'probes': 15}
+    """
+    if row_count < 100_000:
+        params = {"m": 16, "ef_construction": 64, "ef_search": 40}
+    elif row_count < 1_000_000:
+        params = {"m": 24, "ef_construction": 100, "ef_search": 100}
+    else:
+        params = {"m": 32, "ef_construction": 128, "ef_search": 200}
+
+    lists = max(10, min(1000, row_count // 1000))
+    params["lists"] = lists
+    params["probes"] = max(1, math.isqrt(lists))
+    return params
+
+
+def _set_database_search_param(connection, name: str, value: int) -> None:
+    """
+    Persist a query-time pgvector setting as the database default.
+
+    `ALTER DATABASE ... SET` applies to every new session, so pooled
+    connections opened afterwards search with the tuned value without a
+    per-query SET. Requires database ownership; failure only prints a warning.
+
+    Args:
+        connection: Open SQLAlchemy connection
+        name: Setting name (hnsw.ef_search or ivfflat.probes)
+        value: Integer value
+    """
+    try:
+        database = connection.execute(text("SELECT current_database()")).scalar_one()
+        quoted = connection.dialect.identifier_preparer.quote(database)
+        connection.execute(text(f"ALTER DATABASE {quoted} SET {name} = {int(value)}"))
+        connection.commit()
+        print(f"  Search setting: {name} = {value} (database default for new connections)")
+    except Exception as e:
+        connection.rollback()
+        print(f"\n⚠ WARNING: Could not set {name} = {value} as database default: {e}")
+        print(f"  Set it per session instead: SET {name} = {value};")
+
+
+def _drop_stale_vector_indexes(connection) -> None:
+    """
+    Drop vector indexes that are INVALID or use another operator class.
+
+    A failed or cancelled `CREATE INDEX CONCURRENTLY` leaves the index in the
+    catalog with pg_index.indisvalid = false: the planner ignores it but
+    writes still maintain it, and `IF NOT EXISTS` would skip the rebuild.
+    An index built with an older operator class (e.g. halfvec_cosine_ops)
+    cannot serve the `<#>` search query, so it is rebuilt as well.
+    Must be called on an autocommit connection.
+
+    Args:
+        connection: Open SQLAlchemy connection with AUTOCOMMIT isolation
+    """
+    stale = connection.execute(
+        text("""
+            SELECT c.relname, i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_opclass o ON o.oid = i.indclass[0]
+            WHERE c.relname IN ('ix_clauses_embedding_hnsw', 'ix_clauses_embedding_ivfflat')
+              AND (NOT i.indisvalid OR o.opcname <> :opclass)
+        """),
+        {"opclass": VECTOR_INDEX_OPCLASS}
+    ).all()
+    for name, valid in stale:
+        reason = f"not using {VECTOR_INDEX_OPCLASS}" if valid else "left invalid by an interrupted build"
+        print(f"  Dropping index {name} ({reason})")
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+
+
 def create_vector_index() -> None:
     """
     Create optional pgvector index on clauses.embedding for similarity search.
 
-    This creates an IVFFlat index using L2 distance (Euclidean distance) for
-    accelerating vector similarity searches. The index is optional and its
-    failure will not prevent database initialization.
+    This creates an HNSW index using inner product for accelerating vector
+    similarity searches. The index is optional and its failure will not
+    prevent database initialization.
 
     Index configuration:
-    - Index type: IVFFlat (Inverted File with Flat compression)
-    - Distance operator: vector_l2_ops (L2/Euclidean distance)
-    - Lists parameter: 100 (number of inverted lists for clustering)
-
-    The lists parameter of 100 is suitable for small to medium datasets.
-    For larger datasets (>1M rows), consider increasing this value.
-    Rule of thumb: lists = rows / 1000 (capped at a reasonable maximum).
+    - Index type: HNSW (Hierarchical Navigable Small World graph)
+    - Distance operator: VECTOR_INDEX_OPCLASS (halfvec_ip_ops, negative inner
+      product `<#>`) on the FP16 column, matching the Q&A similarity query;
+      equivalent to cosine distance because embeddings are stored unit length
+    - m / ef_construction / ef_search: sized from the current clause count by
+      configure_index_params (pgvector defaults below 100k rows)
+
+    Unlike IVFFlat, HNSW needs no training data: it can be created on an
+    empty table and keeps its recall as clauses are inserted, with no
+    periodic rebuild. The build runs with maintenance_work_mem raised to
+    VECTOR_INDEX_BUILD_MEMORY (reset afterwards) so the graph is built in memory.
+
+    The index is built with `CREATE INDEX CONCURRENTLY` on an autocommit
+    connection, so inserts and updates on clauses are not blocked while the
+    graph is built. Invalid indexes left behind by an interrupted concurrent
+    build, and indexes with an outdated operator class, are dropped first so
+    the build is retried.
+
+    Once the index exists clauses is ANALYZEd, so planning on a freshly
+    loaded database sees real row counts and uses the index.
+
+    If the HNSW build fails (e.g. the server cannot allocate the build
+    memory) an IVFFlat inner-product index is created instead, with lists sized
+    from the row count. The matching
+    query-time setting (hnsw.ef_search or ivfflat.probes) is stored as the
+    database default.
 
     This operation is idempotent - safe to run multiple times.
-    Index creation is skipped if it already exists.
+    Index creation is skipped if it already exists (re-run after large data
+    growth by dropping the index first to pick up larger parameters).
 
     Note:
         This function will not raise exceptions on failure, only print
@@ -94,25 +396,68 @@ def create_vector_index() -> None:
     """
     try:
         print("\nCreating pgvector index on clauses.embedding...")
-        with engine.connect() as connection:
-            # Create IVFFlat index with L2 distance operator
-            # Using 100 lists as a reasonable default for small-medium datasets
-            connection.execute(text("""
-                CREATE INDEX IF NOT EXISTS ix_clauses_embedding_ivfflat
-                ON clauses
-                USING ivfflat (embedding vector_l2_ops)
-                WITH (lists = 100)
-            """))
-            connection.commit()
-        print("✓ pgvector index created successfully on clauses.embedding")
-        print("  Index: ix_clauses_embedding_ivfflat (IVFFlat, L2 distance, 100 lists)")
+        # CONCURRENTLY cannot run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            clause_count = connection.execute(text("SELECT count(*) FROM clauses")).scalar_one()
+            params = configure_index_params(clause_count)
+            print(f"  Sizing index for {clause_count} clauses")
+            _drop_stale_vector_indexes(connection)
+
+            # No transaction to scope SET LOCAL to: set for the session and
+            # RESET before the connection goes back to the pool. Index builds
+            # on large tables outlast the app's statement_timeout, so it is
+            # lifted here.
+            connection.execute(text(f"SET maintenance_work_mem = '{VECTOR_INDEX_BUILD_MEMORY}'"))
+            connection.execute(text("SET statement_timeout = 0"))
+            try:
+                try:
+                    # Create HNSW index with inner product operator
+                    connection.execute(text(f"""
+                        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_clauses_embedding_hnsw
+                        ON clauses
+                        USING hnsw (embedding {VECTOR_INDEX_OPCLASS})
+                        WITH (m = {params['m']}, ef_construction = {params['ef_construction']})
+                    """))
+                    print("✓ pgvector index created successfully on clauses.embedding")
+                    print(
+                        f"  Index: ix_clauses_embedding_hnsw (HNSW, inner product, "
+                        f"m={params['m']}, ef_construction={params['ef_construction']})"
+                    )
+                    _set_database_search_param(connection, "hnsw.ef_search", params["ef_search"])
+                except DBAPIError as e:
+                    # e.g. out of memory for the graph build; a failed
+                    # concurrent build leaves an INVALID index behind
+                    print(f"  HNSW unavailable ({e.orig}), falling back to IVFFlat")
+                    _drop_stale_vector_indexes(connection)
+                    connection.execute(text(f"""
+                        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_clauses_embedding_ivfflat
+                        ON clauses
+                        USING ivfflat (embedding {VECTOR_INDEX_OPCLASS})
+                        WITH (lists = {params['lists']})
+                    """))
+                    print("✓ pgvector index created successfully on clauses.embedding")
+                    print(f"  Index: ix_clauses_embedding_ivfflat (IVFFlat, inner product, {params['lists']} lists)")
+                    _set_database_search_param(connection, "ivfflat.probes", params["probes"])
+            finally:
+                connection.execute(text("RESET maintenance_work_mem"))
+                connection.execute(text("RESET statement_timeout"))
+
+            try:
+                # A freshly loaded clauses table still has reltuples = 0, and
+                # with no statistics the planner prefers a seq scan to the
+                # new vector index
+                connection.execute(text("ANALYZE clauses"))
+                print("  Table statistics refreshed (ANALYZE clauses)")
+            except DBAPIError as e:
+                print(f"\n⚠ WARNING: Could not ANALYZE clauses: {e.orig}")
+                print("  Run ANALYZE clauses; manually after loading data.")
     except Exception as e:
         # Non-fatal error - print warning but don't raise
         print(f"\n⚠ WARNING: Could not create pgvector index: {e}")
         print("  Similarity search will still work but may be slower for large datasets.")
         print("  You can manually create the index later with:")
-        print("    CREATE INDEX ix_clauses_embedding_ivfflat ON clauses")
-        print("    USING ivfflat (embedding vector_l2_ops) WITH (lists = 100);")
+        print("    CREATE INDEX CONCURRENTLY ix_clauses_embedding_hnsw ON clauses")
+        print(f"    USING hnsw (embedding {VECTOR_INDEX_OPCLASS}) WITH (m = 16, ef_construction = 64);")
 
 
 def mask_password(database_url: str) -> str:
@@ -125,7 +470,54 @@ def mask_password(database_url: str) -> str:
     Returns:
         Database URL with password replaced by asterisks
     """
-    return re.sub(r'://([^:]+):([^@]+)@', r'://\1:****@', database_url)
+    return _DSN_PASSWORD_RE.sub(r'://\1:****@', database_url)
+
+
+def _schema_status(connection: Connection) -> Dict[str, bool]:
+    """
+    Check in one catalog query which initialization artifacts already exist.
+
+    Args:
+        connection: Open SQLAlchemy connection
+
+    Returns:
+        Dict with boolean keys:
+            - 'extension': pgvector is installed in the database
+            - 'tables': every table in Base.metadata exists
+            - 'embeddings': embedding columns have the current types
+            - 'vector_index': a valid HNSW or IVFFlat index with
+              VECTOR_INDEX_OPCLASS exists on clauses.embedding
+    """
+    from app import models  # noqa: F401  (registers tables with Base.metadata)
+    row = connection.execute(
+        text("""
+            SELECT
+                EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'vector') AS extension,
+                (SELECT bool_and(to_regclass(t) IS NOT NULL)
+                 FROM unnest(CAST(:tables AS text[])) AS t) AS tables,
+                (SELECT array_agg(format_type(atttypid, atttypmod) ORDER BY attrelid::regclass::text)
+                 FROM pg_attribute
+                 WHERE attrelid IN (to_regclass('clauses'), to_regclass('embedding_cache'))
+                   AND attname = 'embedding') = CAST(:embedding_types AS text[]) AS embeddings,
+                (SELECT EXISTS (
+                    SELECT 1 FROM pg_index i
+                    JOIN pg_opclass o ON o.oid = i.indclass[0]
+                    WHERE i.indexrelid IN (to_regclass('ix_clauses_embedding_hnsw'),
+                                           to_regclass('ix_clauses_embedding_ivfflat'))
+                      AND i.indisvalid
+                      AND o.opcname = :opclass)) AS vector_index
+        """),
+        {
+            "tables": sorted(Base.metadata.tables),
+            "opclass": VECTOR_INDEX_OPCLASS,
+            # Ordered by table name: clauses, embedding_cache
+            "embedding_types": [
+                f"halfvec({EMBEDDING_DIMENSIONS})",
+                f"vector({EMBEDDING_DIMENSIONS})",
+            ],
+        }
+    ).one()
+    return {key: bool(value) for key, value in row._mapping.items()}
 
 
 def init_database() -> None:
@@ -135,45 +527,63 @@ def init_database() -> None:
     This orchestrates the full database setup process:
     1. Enables pgvector extension for vector similarity search
     2. Creates all required tables with proper schemas and relationships
+    3. Converts embedding columns created by older versions
+    4. Creates the pgvector similarity index
+
+    Steps 1-3 run on one connection in a single transaction (together with
+    the status check), so a failure leaves no half-initialized schema; the
+    index build uses its own autocommit connection afterwards.
+
+    A single catalog query checks first which of these already exist. If the
+    database is fully initialized, one status line is printed and nothing
+    else runs (useful when called on every container start or test worker);
+    otherwise only the missing steps are executed.
 
     Raises:
         Exception: If database connection fails or setup errors occur
     """
     try:
         settings = get_settings()
-        print("=" * 60)
-        print("AI Legal Analyst - Database Initialization")
-        print("=" * 60)
-        print(f"\nDatabase: {mask_password(settings.database_url)}")
-        print("\nStarting database initialization...\n")
-
-        # Step 1: Enable pgvector extension
-        print("Enabling pgvector extension...")
-        try:
-            enable_pgvector_extension()
-            print("✓ pgvector extension enabled successfully")
-        except Exception as e:
-            error_msg = str(e)
-            if "pgvector extension is not installed" in error_msg:
-                print("\n❌ ERROR: pgvector extension is not installed on PostgreSQL server")
-                print("\nInstallation instructions:")
-                print("  macOS:          brew install pgvector")
-                print("  Ubuntu/Debian:  https://github.com/pgvector/pgvector#installation")
-                print("  Docker:         use ankane/pgvector PostgreSQL image")
-                print("  Documentation:  https://github.com/pgvector/pgvector")
-            elif "CREATE EXTENSION privilege" in error_msg:
-                print("\n❌ ERROR: Database user lacks CREATE EXTENSION privilege")
-                print("\nTo fix, run as PostgreSQL superuser:")
-                print("  psql -U postgres -d <database_name> -c 'CREATE EXTENSION vector;'")
-            else:
-                print(f"\n❌ ERROR enabling pgvector extension: {e}")
-            raise
-
-        # Step 2: Create all tables
-        create_tables()
-
-        # Step 3: Create optional pgvector index for similarity search
-        create_vector_index()
+        # Status check and steps 1-3 share one pooled connection and one
+        # transaction: they commit together, or roll back together on error
+        with engine.begin() as connection:
+            status = _schema_status(connection)
+            if all(status.values()):
+                print(f"✓ Database already initialized: {mask_password(settings.database_url)}")
+                return
+
+            print("=" * 60)
+            print("AI Legal Analyst - Database Initialization")
+            print("=" * 60)
+            print(f"\nDatabase: {mask_password(settings.database_url)}")
+            print("\nStarting database initialization...\n")
+
+            # Step 1: Enable pgvector extension
+            print("Enabling pgvector extension...")
+            try:
+                if not status["extension"]:
+                    enable_pgvector_extension(connection)
+                print("✓ pgvector extension enabled successfully")
+            except Exception as e:
+                # enable_pgvector_extension already classified the error by
+                # SQLSTATE and put the fix in the message
+                print(f"\n❌ ERROR: {e}")
+                raise
+
+            # Step 2: Create all tables
+            if not status["tables"]:
+                create_tables(connection)
+
+            # Step 3: Convert older embedding columns in place (drops the vector
+            # index, so step 4 must run afterwards)
+            if not status["embeddings"]:
+                convert_embedding_columns(connection)
+
+        # Step 4: Create optional pgvector index for similarity search, after
+        # the transaction above has committed (the concurrent build needs its
+        # own autocommit connection)
+        if not (status["vector_index"] and status["embeddings"]):
+            create_vector_index()
 
         print("\n" + "=" * 60)
         print("✓ Database initialization completed successfully!")
@@ -181,31 +591,25 @@ def init_database() -> None:
         print("\nNext steps:")
         print("  1. Verify tables: psql -d <database> -c '\\dt'")
         print("  2. Verify pgvector: psql -d <database> -c \"SELECT * FROM pg_extension WHERE extname='vector';\"")
-        print("  3. Verify index: psql -d <database> -c '\\di ix_clauses_embedding_ivfflat'")
+        print("  3. Verify index: psql -d <database> -c '\\di ix_clauses_embedding_hnsw'")
         print("  4. Start the API: python3 -m uvicorn app.main:app --reload")
         print("\n")
 
-    except Exception as e:
-        # Check for common connection errors
-        error_msg = str(e).lower()
-        if "could not connect" in error_msg or "connection refused" in error_msg:
-            print("\n❌ ERROR: Cannot connect to PostgreSQL database")
-            print("\nTroubleshooting:")
-            print("  1. Ensure PostgreSQL is running")
-            print("  2. Verify DATABASE_URL in .env file")
-            print("  3. Check database exists: createdb <database_name>")
-            print("  4. Test connection: psql <database_url>")
-        elif "does not exist" in error_msg and "database" in error_msg:
-            print("\n❌ ERROR: Database does not exist")
-            print("\nCreate the database first:")
-            print("  createdb legal_analyst")
-            print("  OR: psql -U postgres -c 'CREATE DATABASE legal_analyst;'")
-        elif "authentication failed" in error_msg or "password" in error_msg:
-            print("\n❌ ERROR: Authentication failed")
-            print("\nCheck DATABASE_URL credentials in .env file")
+    except DBAPIError as e:
+        # libpq reports connection-time failures without a SQLSTATE under psycopg2
+        code = sqlstate(e)
+        if code is None and isinstance(e, OperationalError):
+            code = _connection_error_code(e)
+        if code in _INIT_ERROR_HELP:
+            heading, hints = _INIT_ERROR_HELP[code]
+            print(f"\n❌ ERROR: {heading}")
+            print("\n" + "\n".join(hints))
         else:
-            print(f"\n❌ Unexpected error during initialization: {e}")
-
+            print(f"\n❌ Unexpected database error during initialization: {e}")
+        print("\n")
+        raise
+    except Exception as e:
+        print(f"\n❌ Unexpected error during initialization: {e}")
         print("\n")
         raise
 
@@ -17,7 +17,8 @@ Key Components:
 - Helper functions for accessing configuration data
 """
 
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
 
 
 # ============================================================================
@@ -178,7 +179,7 @@ UK_COMMON_CLAUSES: Dict[str, str] = {
 # OpenAI Prompt Templates
 # ============================================================================
 
-SYSTEM_PROMPT_TEMPLATE: str = """You are an expert UK contract law analyst with deep knowledge of English and Welsh contract law, statutes, and case law. Your task is to analyze contracts through a UK legal lens and provide comprehensive jurisdiction analysis.
+SYSTEM_PROMPT_TEMPLATE: str = f"""You are an expert UK contract law analyst with deep knowledge of English and Welsh contract law, statutes, and case law. Your task is to analyze contracts through a UK legal lens and provide comprehensive jurisdiction analysis.
 
 **Your Analysis Should:**
 
@@ -248,17 +249,17 @@ Respond with a JSON object containing:
 
 **Legal Principles Reference:**
 
-Formation: """ + UK_LEGAL_PRINCIPLES["formation"] + """
+Formation: {UK_LEGAL_PRINCIPLES['formation']}
 
-Interpretation: """ + UK_LEGAL_PRINCIPLES["interpretation"] + """
+Interpretation: {UK_LEGAL_PRINCIPLES['interpretation']}
 
-Unfair Terms: """ + UK_LEGAL_PRINCIPLES["unfair_terms"] + """
+Unfair Terms: {UK_LEGAL_PRINCIPLES['unfair_terms']}
 
-Termination: """ + UK_LEGAL_PRINCIPLES["termination"] + """
+Termination: {UK_LEGAL_PRINCIPLES['termination']}
 
-Remedies: """ + UK_LEGAL_PRINCIPLES["remedies"] + """
+Remedies: {UK_LEGAL_PRINCIPLES['remedies']}
 
-Governing Law: """ + UK_LEGAL_PRINCIPLES["governing_law"] + """
+Governing Law: {UK_LEGAL_PRINCIPLES['governing_law']}
 
 Provide accurate, practical analysis grounded in UK contract law. Your analysis is for informational purposes only and does not constitute legal advice."""
 
@@ -274,12 +275,18 @@ Provide a comprehensive jurisdiction analysis following the specified JSON forma
 # Helper Functions
 # ============================================================================
 
+# Read-only views handed out by the getters (created once, shared by all callers)
+_LEGAL_PRINCIPLES_VIEW: Mapping[str, str] = MappingProxyType(UK_LEGAL_PRINCIPLES)
+_COMMON_CLAUSES_VIEW: Mapping[str, str] = MappingProxyType(UK_COMMON_CLAUSES)
+
 def get_system_prompt() -> str:
     """
     Returns the system prompt template for OpenAI GPT-4o.
 
     This prompt instructs the AI to act as a UK contract law expert and
     provides detailed guidance on the analysis structure and output format.
+    The prompt is built once at import (a single f-string); every call
+    returns the same string object.
 
     Returns:
         str: Complete system prompt for jurisdiction analysis
@@ -300,14 +307,17 @@ def get_user_prompt(contract_text: str) -> str:
     return USER_PROMPT_TEMPLATE.format(contract_text=contract_text)
 
 
-def get_legal_principles() -> Dict[str, str]:
+def get_legal_principles() -> Mapping[str, str]:
     """
     Returns UK legal principles dictionary.
 
+    The result is a read-only view of the shared module dict, so callers can
+    use it without a defensive copy.
+
     Returns:
-        dict: UK legal principles organized by category
+        Mapping: UK legal principles organized by category (read-only)
     """
-    return UK_LEGAL_PRINCIPLES
+    return _LEGAL_PRINCIPLES_VIEW
 
 
 def get_key_statutes() -> List[Dict[str, Any]]:
@@ -320,11 +330,14 @@ def get_key_statutes() -> List[Dict[str, Any]]:
     return UK_KEY_STATUTES
 
 
-def get_common_clauses() -> Dict[str, str]:
+def get_common_clauses() -> Mapping[str, str]:
     """
     Returns common contract clauses and their UK law treatment.
 
+    The result is a read-only view of the shared module dict, so callers can
+    use it without a defensive copy.
+
     Returns:
-        dict: Common clauses with UK-specific legal considerations
+        Mapping: Common clauses with UK-specific legal considerations (read-only)
     """
-    return UK_COMMON_CLAUSES
+    return _COMMON_CLAUSES_VIEW
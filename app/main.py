@@ -1,9 +1,12 @@
 # Import FastAPI (web framework) and supporting classes
 from fastapi import FastAPI, Depends, HTTPException, status
-from pydantic import BaseModel
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, TypeAdapter
 from typing import List, Optional
+import os
 import re
 from uuid import uuid4
+from collections import Counter
 from datetime import datetime
 import logging
 
@@ -27,7 +30,7 @@ from app.schemas import (
 )
 
 # Service imports
-from app.services.entity_extractor import extract_entities
+from app.services.entity_extractor import extract_entities_async
 from app.services.jurisdiction_analyzer import analyze_jurisdiction
 from app.services.risk_analyzer import analyze_risks
 from app.services.summarizer import summarize_contract
@@ -35,7 +38,7 @@ from app.services.qa_engine import answer_question
 
 # CRUD and model imports
 from app import crud
-from app.models import Entity, Clause as ClauseModel, RiskAssessment
+from app.models import Contract, Entity, Clause as ClauseModel, RiskAssessment
 
 # Logging setup
 logger = logging.getLogger(__name__)
@@ -62,6 +65,52 @@ HEADING_RX = re.compile(r'(?m)^\s*(\d+(?:\.\d+)*)\s+([A-Z][^\n]{0,100})\s*$')
 # (to prevent splitting a single bullet point into multiple clauses).
 BULLET_JOIN_RX = re.compile(r'\n(?=[•\-–]\s)')
 
+# Average line length (chars) from which headings are found by checking each
+# line's first character before running HEADING_RX. The MULTILINE scan pays
+# per character, the pre-filter per line, so the pre-filter wins on long
+# paragraph lines (~5x at 500-char lines) and loses on short wrapped ones.
+HEADING_PREFILTER_MIN_LINE_LENGTH = 40
+
+def _iter_headings(text: str):
+    """
+    Yield HEADING_RX matches in text, like HEADING_RX.finditer(text).
+
+    Every heading's first non-space character is a digit at the start of a
+    line, so on long-lined text only such lines are tried, with
+    HEADING_RX.match(text, line_start). A match may start at an earlier
+    blank line with finditer; the clause bodies are stripped, so the
+    segmentation result is the same.
+    """
+    if len(text) < HEADING_PREFILTER_MIN_LINE_LENGTH * (text.count('\n') + 1):
+        yield from HEADING_RX.finditer(text)
+        return
+
+    offset = 0
+    previous_end = 0
+    for line in text.split('\n'):
+        if offset >= previous_end and line.lstrip()[:1].isdigit():
+            m = HEADING_RX.match(text, offset)
+            if m:
+                previous_end = m.end()
+                yield m
+        offset += len(line) + 1
+
+def _uuid4_strings(count: int) -> List[str]:
+    """
+    Return `count` random version-4 UUID strings from one os.urandom call.
+
+    Equivalent to [str(uuid4()) for _ in range(count)] without a urandom
+    call and a UUID object per ID.
+    """
+    raw = bytearray(os.urandom(16 * count))
+    ids = []
+    for offset in range(0, len(raw), 16):
+        raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40  # version 4
+        raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = raw[offset:offset + 16].hex()
+        ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return ids
+
 def segment_contract(text: str) -> List[dict]:
     """
     Splits the raw contract text into clauses based on numbered headings.
@@ -76,11 +125,29 @@ def segment_contract(text: str) -> List[dict]:
     # First: normalize bullet lists so they stay inside the same clause
     text = BULLET_JOIN_RX.sub('\n', text)
 
-    # Find all numbered headings using regex
-    matches = list(HEADING_RX.finditer(text))
+    # Stream the numbered headings: each clause is emitted as soon as the next
+    # heading (its end boundary) is found, so no list of matches is kept
+    clauses: List[dict] = []
+    previous = None  # (number, title, body start) of the clause being read
+
+    def append_clause(number: str, title: str, body: str) -> None:
+        # Create a clause dictionary and add it to the list
+        clauses.append({
+            "clause_id": None,  # random unique ID, assigned for all clauses below
+            "number": number,  # Clause number (e.g. "2.1")
+            "title": title,  # Clause title (e.g. "Termination for Convenience")
+            "text": body  # The body text of the clause (up to the next heading)
+        })
+
+    for m in _iter_headings(text):
+        if previous is not None:
+            number, title, start = previous
+            append_clause(number, title, text[start:m.start()].strip())
+        # Start of clause is right after the heading we matched
+        previous = (m.group(1).strip(), m.group(2).strip(), m.end())
 
     # If no headings are found, treat the entire document as one big clause
-    if not matches:
+    if previous is None:
         return [{
             "clause_id": str(uuid4()),
             "number": None,
@@ -88,29 +155,24 @@ def segment_contract(text: str) -> List[dict]:
             "text": text.strip()
         }]
 
-    clauses: List[dict] = []
-    for i, m in enumerate(matches):
-        # Start of clause is right after the heading we matched
-        start = m.end()
-        # End of clause is the start of the next heading, or end of document
-        end = matches[i+1].start() if i+1 < len(matches) else len(text)
-
-        # Clause number (e.g. "2.1")
-        number = m.group(1).strip()
-        # Clause title (e.g. "Termination for Convenience")
-        title = m.group(2).strip()
-        # The body text of the clause (between this heading and the next one)
-        body = text[start:end].strip()
+    # The last clause runs to the end of the document
+    number, title, start = previous
+    append_clause(number, title, text[start:].strip())
 
-        # Create a clause dictionary and add it to the list
-        clauses.append({
-            "clause_id": str(uuid4()),  # generate a random unique ID
-            "number": number,
-            "title": title,
-            "text": body
-        })
+    for clause, clause_id in zip(clauses, _uuid4_strings(len(clauses))):
+        clause["clause_id"] = clause_id
     return clauses
 
+# --------------------------
+# Response Validators
+# --------------------------
+
+# List validators compiled once: validating a whole list of ORM rows runs in a
+# single pydantic-core call, instead of one model_validate() dispatch per row
+# (faster than model_construct(), whose field copying happens in Python)
+_CLAUSE_LIST_ADAPTER = TypeAdapter(List[ClauseResponse])
+_ENTITY_LIST_ADAPTER = TypeAdapter(List[EntityResponse])
+
 # --------------------------
 # API Endpoint
 # --------------------------
@@ -127,8 +189,180 @@ def health_check():
         "version": "0.1.0"
     }
 
+def _load_processed_duplicate(db: Session, text: str) -> Optional[ContractSegmentResponse]:
+    """Build the response from an earlier completed upload of identical text, if any."""
+    existing = crud.get_completed_contract_by_hash(db, crud.contract_content_hash(text))
+    if existing is None:
+        return None
+
+    clauses = sorted(crud.get_clauses_by_contract(db, existing.id), key=lambda c: c.id)
+    entities = crud.get_entities_by_contract(db, existing.id)
+    logger.info(f"Contract text matches completed contract {existing.id}, returning stored results")
+
+    clause_responses = _CLAUSE_LIST_ADAPTER.validate_python(clauses, from_attributes=True)
+    entity_responses = _ENTITY_LIST_ADAPTER.validate_python(entities, from_attributes=True)
+    return ContractSegmentResponse(
+        contract_id=existing.id,
+        status=existing.status,
+        clauses=clause_responses,
+        entities=entity_responses,
+        message=(
+            f"Identical contract already processed as contract {existing.id}. "
+            f"Found {len(clause_responses)} clauses and {len(entity_responses)} entities."
+        )
+    )
+
+
+def _create_processing_contract(db: Session, req: ContractUploadRequest) -> Contract:
+    """Insert the contract and mark it 'processing' (steps 1-2 of upload_and_segment)."""
+    # 1. Create contract record (flush only; committed with the status update)
+    contract = crud.create_contract(
+        db,
+        title=req.title,
+        text=req.text,
+        jurisdiction=req.jurisdiction,
+        commit=False
+    )
+    logger.info(f"Created contract with ID: {contract.id}")
+
+    # 2. Update status to processing (commits the contract INSERT as well)
+    crud.update_contract_status(db, contract.id, 'processing')
+    return contract
+
+
+def _build_clause_models(text: str, contract_id: int) -> List[ClauseModel]:
+    """Segment the contract text into clause models (steps 3-4 of upload_and_segment)."""
+    # 3. Segment clauses
+    clause_dicts = segment_contract(text)
+    logger.info(f"Segmented contract into {len(clause_dicts)} clauses")
+
+    # 4. Convert clauses to SQLAlchemy models
+    clause_models = []
+    for clause_dict in clause_dicts:
+        clause_model = ClauseModel(
+            contract_id=contract_id,
+            clause_id=clause_dict["clause_id"],
+            number=clause_dict.get("number"),
+            title=clause_dict.get("title"),
+            text=clause_dict["text"]
+        )
+        clause_models.append(clause_model)
+    return clause_models
+
+
+def _finish_contract_processing(
+    db: Session,
+    req: ContractUploadRequest,
+    contract: Contract,
+    clause_models: List[ClauseModel],
+    entity_dicts: List[dict],
+    extraction_error: Optional[str]
+) -> ContractSegmentResponse:
+    """Persist clauses and entities, detect jurisdiction and build the response (steps 6-8)."""
+    # Track if entity extraction had issues
+    extraction_failed = extraction_error is not None
+
+    if extraction_failed:
+        logger.warning(f"Entity extraction failed: {extraction_error}")
+    else:
+        logger.info(f"Extracted {len(entity_dicts)} entities from contract")
+
+    entity_models = []
+    for entity_dict in entity_dicts:
+        entity_model = Entity(
+            contract_id=contract.id,
+            entity_type=entity_dict["entity_type"],  # Lowercased by the model validator
+            value=entity_dict["value"],
+            context=entity_dict.get("context"),
+            confidence=entity_dict.get("confidence", "medium")
+        )
+        entity_models.append(entity_model)
+
+    # 6. Persist clauses and entities in one transaction, then embed clauses
+    # (IDs and extracted_at are populated via RETURNING)
+    try:
+        crud.bulk_create_clauses_and_entities(db, clause_models, entity_models)
+        logger.info(
+            f"Persisted {len(clause_models)} clauses and {len(entity_models)} entities to database"
+        )
+    except crud.DuplicateClauseError as e:
+        logger.error(f"Duplicate clause detected: {e}", exc_info=True)
+        # Update contract to terminal failed state
+        try:
+            crud.update_contract_status(db, contract.id, 'failed')
+            logger.info(f"Updated contract {contract.id} status to 'failed'")
+        except Exception as status_err:
+            logger.error(f"Failed to update contract status to 'failed': {status_err}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Duplicate clause detected. Contract processing failed."
+        )
+
+    # 7. Best-effort jurisdiction detection if not provided
+    jurisdiction_failed = False
+    if req.jurisdiction is None:
+        try:
+            logger.info(f"No jurisdiction provided, attempting automatic detection for contract {contract.id}")
+            jurisdiction_data, jurisdiction_error = analyze_jurisdiction(req.text, contract.id)
+
+            if not jurisdiction_error and 'jurisdiction_code' in jurisdiction_data:
+                # Update contract jurisdiction field with normalized code
+                jurisdiction_code = jurisdiction_data['jurisdiction_code']
+                logger.info(f"Auto-detected jurisdiction for contract {contract.id}: {jurisdiction_code}")
+                # Committed together with the final status update below
+                crud.update_contract_jurisdiction(db, contract.id, jurisdiction_code, commit=False)
+            else:
+                logger.warning(f"Auto jurisdiction detection failed for contract {contract.id}: {jurisdiction_error}")
+                jurisdiction_failed = True
+        except Exception as e:
+            # Don't fail the entire upload if jurisdiction detection fails
+            logger.warning(f"Exception during auto jurisdiction detection for contract {contract.id}: {e}")
+            jurisdiction_failed = True
+
+    # 8. Update status based on extraction success
+    if extraction_failed:
+        # Set status to completed_with_warnings if extraction failed but segmentation succeeded
+        final_status = 'completed_with_warnings'
+    else:
+        final_status = 'completed'
+
+    crud.update_contract_status(
+        db,
+        contract.id,
+        final_status,
+        processed_at=datetime.utcnow()
+    )
+
+    # 8. Build response
+    # Convert SQLAlchemy models to Pydantic response models
+    clause_responses = _CLAUSE_LIST_ADAPTER.validate_python(clause_models, from_attributes=True)
+    entity_responses = _ENTITY_LIST_ADAPTER.validate_python(entity_models, from_attributes=True)
+
+    # Build message with warning if extraction failed
+    if extraction_failed:
+        message = (
+            f"Contract segmentation completed successfully. "
+            f"Found {len(clause_responses)} clauses. "
+            f"WARNING: Entity extraction failed ({extraction_error}). "
+            f"Extracted {len(entity_responses)} entities before failure."
+        )
+    else:
+        message = (
+            f"Contract processed successfully. "
+            f"Found {len(clause_responses)} clauses and {len(entity_responses)} entities."
+        )
+
+    return ContractSegmentResponse(
+        contract_id=contract.id,
+        status=final_status,
+        clauses=clause_responses,
+        entities=entity_responses,
+        message=message
+    )
+
+
 @app.post("/contracts/segment", response_model=ContractSegmentResponse)
-def upload_and_segment(
+async def upload_and_segment(
     req: ContractUploadRequest,
     db: Session = Depends(get_db)
 ) -> ContractSegmentResponse:
@@ -136,12 +370,23 @@ def upload_and_segment(
     Upload and process a contract: segment into clauses and extract entities.
 
     This endpoint:
+    0. Returns the stored results if identical text was already processed
     1. Creates a contract record in the database
     2. Segments the contract text into numbered clauses
     3. Extracts entities using OpenAI GPT-4o (parties, dates, financial terms, etc.)
     4. Persists all data to the database
     5. Returns the contract ID, clauses, and extracted entities
 
+    The endpoint is async: the entity extraction call is awaited on the event
+    loop, so no worker thread is held during the LLM round-trip. Database
+    work and segmentation use the synchronous session/driver and run in the
+    threadpool (run_in_threadpool) so they never block the loop.
+
+    Re-uploads are deduplicated by a BLAKE2b hash of the text: when a
+    contract with identical text has status 'completed', its id, clauses and
+    entities are returned and no new contract row is created. The title and
+    jurisdiction of the re-upload are ignored in that case.
+
     Args:
         req: Contract upload request with text, optional title, and jurisdiction
         db: Database session (injected)
@@ -156,152 +401,24 @@ def upload_and_segment(
     try:
         logger.info("Starting contract processing")
 
-        # 1. Create contract record
-        contract = crud.create_contract(
-            db,
-            title=req.title,
-            text=req.text,
-            jurisdiction=req.jurisdiction
-        )
-        logger.info(f"Created contract with ID: {contract.id}")
-
-        # 2. Update status to processing
-        crud.update_contract_status(db, contract.id, 'processing')
-
-        # 3. Segment clauses
-        clause_dicts = segment_contract(req.text)
-        logger.info(f"Segmented contract into {len(clause_dicts)} clauses")
-
-        # 4. Convert to SQLAlchemy models and persist
-        clause_models = []
-        for clause_dict in clause_dicts:
-            clause_model = ClauseModel(
-                contract_id=contract.id,
-                clause_id=clause_dict["clause_id"],
-                number=clause_dict.get("number"),
-                title=clause_dict.get("title"),
-                text=clause_dict["text"]
-            )
-            clause_models.append(clause_model)
-
-        # Use CRUD helper for consistent constraint handling
-        try:
-            crud.bulk_create_clauses(db, clause_models)
-            logger.info(f"Persisted {len(clause_models)} clauses to database")
-        except crud.DuplicateClauseError as e:
-            logger.error(f"Duplicate clause detected: {e}", exc_info=True)
-            # Update contract to terminal failed state
-            try:
-                crud.update_contract_status(db, contract.id, 'failed')
-                logger.info(f"Updated contract {contract.id} status to 'failed'")
-            except Exception as status_err:
-                logger.error(f"Failed to update contract status to 'failed': {status_err}", exc_info=True)
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Duplicate clause detected. Contract processing failed."
-            )
-
-        # 5. Extract entities using OpenAI
-        entity_dicts, extraction_error = extract_entities(req.text)
+        # 0. Identical text already processed: answer from the stored rows
+        duplicate = await run_in_threadpool(_load_processed_duplicate, db, req.text)
+        if duplicate is not None:
+            return duplicate
 
-        # Track if entity extraction had issues
-        extraction_failed = extraction_error is not None
+        # 1-2. Create contract record and mark it processing
+        contract = await run_in_threadpool(_create_processing_contract, db, req)
 
-        if extraction_failed:
-            logger.warning(f"Entity extraction failed: {extraction_error}")
-        else:
-            logger.info(f"Extracted {len(entity_dicts)} entities from contract")
-
-        # 6. Convert to SQLAlchemy models and persist
-        entity_models = []
-        for entity_dict in entity_dicts:
-            entity_model = Entity(
-                contract_id=contract.id,
-                entity_type=entity_dict["entity_type"].lower(),  # Normalize to lowercase
-                value=entity_dict["value"],
-                context=entity_dict.get("context"),
-                confidence=entity_dict.get("confidence", "medium")
-            )
-            entity_models.append(entity_model)
-
-        if entity_models:
-            crud.bulk_create_entities(db, entity_models)
-            # Refresh each entity to materialize auto-generated fields (id, extracted_at)
-            for entity in entity_models:
-                db.refresh(entity)
-            logger.info(f"Persisted {len(entity_models)} entities to database")
-
-        # 7. Best-effort jurisdiction detection if not provided
-        jurisdiction_failed = False
-        if req.jurisdiction is None:
-            try:
-                logger.info(f"No jurisdiction provided, attempting automatic detection for contract {contract.id}")
-                jurisdiction_data, jurisdiction_error = analyze_jurisdiction(req.text, contract.id)
-
-                if not jurisdiction_error and 'jurisdiction_code' in jurisdiction_data:
-                    # Update contract jurisdiction field with normalized code
-                    jurisdiction_code = jurisdiction_data['jurisdiction_code']
-                    logger.info(f"Auto-detected jurisdiction for contract {contract.id}: {jurisdiction_code}")
-                    crud.update_contract_jurisdiction(db, contract.id, jurisdiction_code)
-                else:
-                    logger.warning(f"Auto jurisdiction detection failed for contract {contract.id}: {jurisdiction_error}")
-                    jurisdiction_failed = True
-            except Exception as e:
-                # Don't fail the entire upload if jurisdiction detection fails
-                logger.warning(f"Exception during auto jurisdiction detection for contract {contract.id}: {e}")
-                jurisdiction_failed = True
+        # 3-4. Segment clauses into SQLAlchemy models
+        clause_models = await run_in_threadpool(_build_clause_models, req.text, contract.id)
 
-        # 8. Update status based on extraction success
-        if extraction_failed:
-            # Set status to completed_with_warnings if extraction failed but segmentation succeeded
-            final_status = 'completed_with_warnings'
-        else:
-            final_status = 'completed'
+        # 5. Extract entities using OpenAI (awaited, no thread held)
+        entity_dicts, extraction_error = await extract_entities_async(req.text)
 
-        crud.update_contract_status(
-            db,
-            contract.id,
-            final_status,
-            processed_at=datetime.utcnow()
-        )
-
-        # 8. Build response
-        # Convert SQLAlchemy models to Pydantic response models
-        clause_responses = [
-            ClauseResponse(
-                clause_id=c.clause_id,
-                number=c.number,
-                title=c.title,
-                text=c.text
-            )
-            for c in clause_models
-        ]
-
-        entity_responses = [
-            EntityResponse.model_validate(e)
-            for e in entity_models
-        ]
-
-        # Build message with warning if extraction failed
-        if extraction_failed:
-            message = (
-                f"Contract segmentation completed successfully. "
-                f"Found {len(clause_responses)} clauses. "
-                f"WARNING: Entity extraction failed ({extraction_error}). "
-                f"Extracted {len(entity_responses)} entities before failure."
-            )
-        else:
-            message = (
-                f"Contract processed successfully. "
-                f"Found {len(clause_responses)} clauses and {len(entity_responses)} entities."
-            )
-
-        return ContractSegmentResponse(
-            contract_id=contract.id,
-            status=final_status,
-            clauses=clause_responses,
-            entities=entity_responses,
-            message=message
+        # 6-8. Persist, detect jurisdiction, update status, build response
+        return await run_in_threadpool(
+            _finish_contract_processing,
+            db, req, contract, clause_models, entity_dicts, extraction_error
         )
 
     except HTTPException:
@@ -313,7 +430,7 @@ def upload_and_segment(
         # Update contract status to failed if contract was created
         if contract:
             try:
-                crud.update_contract_status(db, contract.id, 'failed')
+                await run_in_threadpool(crud.update_contract_status, db, contract.id, 'failed')
             except Exception:
                 logger.exception("Failed to update contract status")
 
@@ -350,28 +467,28 @@ def get_contract_entities(
         HTTPException: 404 if contract not found, 500 if retrieval fails
     """
     try:
-        # 1. Validate contract exists
-        contract = crud.get_contract(db, contract_id)
-        if not contract:
+        # 1. Retrieve entities (filtered or all)
+        if entity_type:
+            entities = crud.get_entities_by_type(db, contract_id, entity_type)
+        else:
+            entities = crud.get_entities_by_contract(db, contract_id)
+
+        # 2. Validate contract exists - only needed when no rows came back,
+        #    since entities reference their contract via a foreign key
+        if not entities and not crud.get_contract(db, contract_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Contract {contract_id} not found"
             )
 
-        # 2. Retrieve entities (filtered or all)
+        # 3. Get type counts - derived in memory when all entities were loaded
         if entity_type:
-            entities = crud.get_entities_by_type(db, contract_id, entity_type)
+            entity_type_counts = crud.count_entities_by_type(db, contract_id)
         else:
-            entities = crud.get_entities_by_contract(db, contract_id)
-
-        # 3. Get type counts
-        entity_type_counts = crud.count_entities_by_type(db, contract_id)
+            entity_type_counts = dict(Counter(e.entity_type for e in entities))
 
         # 4. Build response
-        entity_responses = [
-            EntityResponse.model_validate(e)
-            for e in entities
-        ]
+        entity_responses = _ENTITY_LIST_ADAPTER.validate_python(entities, from_attributes=True)
 
         return EntitiesListResponse(
             contract_id=contract_id,
@@ -458,8 +575,11 @@ def analyze_contract_jurisdiction(
             )
 
         # 3. Perform jurisdiction analysis using OpenAI
+        # Return the pooled connection while waiting on the API
+        contract_text = contract.text
+        crud.release_connection(db)
         logger.info(f"No cached analysis found, performing new analysis for contract {contract_id}")
-        analysis_data, error = analyze_jurisdiction(contract.text, contract_id)
+        analysis_data, error = analyze_jurisdiction(contract_text, contract_id)
 
         # Check if analysis failed
         if error:
@@ -479,7 +599,8 @@ def analyze_contract_jurisdiction(
         if 'jurisdiction_code' in analysis_data:
             jurisdiction_code = analysis_data['jurisdiction_code']
             logger.info(f"Updating contract {contract_id} jurisdiction to: {jurisdiction_code}")
-            crud.update_contract_jurisdiction(db, contract_id, jurisdiction_code)
+            # Committed together with the analysis record in step 5
+            crud.update_contract_jurisdiction(db, contract_id, jurisdiction_code, commit=False)
 
         # 5. Store analysis results in database
         logger.info(f"Storing jurisdiction analysis for contract {contract_id}")
@@ -605,8 +726,11 @@ def analyze_contract_risks(
         ]
 
         # 4. Perform risk analysis using OpenAI
+        # Return the pooled connection while waiting on the API
+        contract_text = contract.text
+        crud.release_connection(db)
         logger.info(f"No cached analysis found, performing new risk analysis for contract {contract_id}")
-        risk_data_list, error = analyze_risks(contract.text, contract_id, clause_dicts)
+        risk_data_list, error = analyze_risks(contract_text, contract_id, clause_dicts)
 
         # Check if analysis failed
         if error:
@@ -639,12 +763,9 @@ def analyze_contract_risks(
                 risk_models.append(risk_model)
 
             logger.info(f"Storing {len(risk_models)} risk assessments for contract {contract_id}")
+            # id and assessed_at are assigned from the executemany INSERT ... RETURNING
             crud.bulk_create_risk_assessments(db, risk_models)
 
-            # Refresh each risk assessment to materialize auto-generated fields (id, assessed_at)
-            for risk in risk_models:
-                db.refresh(risk)
-
             logger.info(f"Successfully stored {len(risk_models)} risk assessments")
 
             # Convert to response models
@@ -808,7 +929,10 @@ def summarize_contract_endpoint(
         # Perform summarization
         # Service layer will convert 'neutral' -> None and handle storage decisions
         logger.info(f"Generating new summary for contract {contract_id} (role: {role or 'neutral'})")
-        summary_data, error = summarize_contract(contract.text, contract_id, role)
+        # Return the pooled connection while waiting on the API
+        contract_text = contract.text
+        crud.release_connection(db)
+        summary_data, error = summarize_contract(contract_text, contract_id, role)
 
         # Check for errors
         if error is not None:
@@ -882,7 +1006,7 @@ def ask_contract_question(
     This endpoint enables interactive question-answering about contract content using
     semantic search with pgvector and GPT-4o-mini. The system:
     1. Generates an embedding for your question using OpenAI text-embedding-3-small
-    2. Searches for the most relevant clauses using pgvector L2 distance similarity
+    2. Searches for the most relevant clauses using pgvector inner product (cosine similarity on unit-length embeddings)
     3. Retrieves the top 5 most similar clauses as context
     4. Uses GPT-4o-mini to generate a comprehensive answer based on the context
     5. Returns the answer with clause references and confidence level
@@ -921,8 +1045,8 @@ def ask_contract_question(
     ```
 
     **How It Works:**
-    1. **Question Embedding**: Generates a 1536-dimensional vector for your question
-    2. **Semantic Search**: Uses pgvector's L2 distance to find 5 most relevant clauses
+    1. **Question Embedding**: Generates a 768-dimensional vector for your question
+    2. **Semantic Search**: Uses pgvector's inner product on unit-length embeddings (cosine similarity) to find 5 most relevant clauses
     3. **Context Building**: Formats retrieved clauses as context for the AI
     4. **Answer Generation**: GPT-4o-mini generates comprehensive answer from context
     5. **Clause Linking**: Returns database IDs of clauses used in the answer
@@ -942,8 +1066,8 @@ def ask_contract_question(
     professionals for actual legal guidance.
     """
     try:
-        # Validate contract exists
-        contract = crud.get_contract(db, contract_id)
+        # Validate contract exists (clauses loaded alongside for the embedding check)
+        contract = crud.get_contract_with_clauses(db, contract_id)
         if contract is None:
             logger.warning(f"Contract {contract_id} not found for Q&A")
             raise HTTPException(
@@ -954,8 +1078,7 @@ def ask_contract_question(
         logger.info(f"Processing Q&A request for contract {contract_id}: {req.question[:100]}...")
 
         # Check for clauses with embeddings
-        clauses = crud.get_clauses_by_contract(db, contract_id)
-        clauses_with_embeddings = [c for c in clauses if c.embedding is not None]
+        clauses_with_embeddings = [c for c in contract.clauses if c.embedding is not None]
 
         if not clauses_with_embeddings:
             logger.warning(f"No clause embeddings found for contract {contract_id}")
@@ -967,7 +1090,11 @@ def ask_contract_question(
         logger.info(f"Found {len(clauses_with_embeddings)} clauses with embeddings for contract {contract_id}")
 
         # Perform Q&A
-        qa_data, error = answer_question(db, contract_id, req.question, contract.text)
+        # Return the pooled connection while the question is embedded;
+        # answer_question releases it again after its similarity search
+        contract_text = contract.text
+        crud.release_connection(db)
+        qa_data, error = answer_question(db, contract_id, req.question, contract_text)
 
         # Check for errors
         if error is not None:
@@ -9,15 +9,23 @@ This module defines six core database tables with proper relationships:
 - Summary: Plain-language summaries from different perspectives
 - QAHistory: Question-answer interactions for contract queries
 
+EmbeddingCache is a standalone lookup table (no relationships) that stores
+clause embeddings by text hash so identical clause text is embedded only once.
+
 All models use SQLAlchemy 2.0 declarative base with proper type hints,
 relationships, and cascade deletion for data integrity.
 """
 
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import String, Text, DateTime, ForeignKey, Index, UniqueConstraint, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from pgvector.sqlalchemy import Vector
+from typing import Optional, List, Dict, Any
+from sqlalchemy import (
+    CheckConstraint, Computed, String, Text, DateTime, ForeignKey, Index, Integer, LargeBinary,
+    SmallInteger, UniqueConstraint, func
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from pgvector.sqlalchemy import HALFVEC, Vector
+from app.config import EMBEDDING_DIMENSIONS
 from app.database import Base
 
 
@@ -37,6 +45,10 @@ class Contract(Base):
         uploaded_at: Timestamp when contract was uploaded
         processed_at: Timestamp when analysis completed
         status: Processing status (pending/processing/completed/failed)
+        latest_jurisdiction_summary_id: Foreign key to the newest jurisdiction
+            analysis summary (maintained by crud.create_jurisdiction_analysis)
+        content_hash: BLAKE2b digest of the contract text, used to find an
+            earlier upload of identical text (set by crud.create_contract)
         clauses: Related clause records
         entities: Related entity records
         risk_assessments: Related risk assessment records
@@ -53,6 +65,21 @@ class Contract(Base):
     uploaded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     status: Mapped[str] = mapped_column(String(50), default="pending")
+    # Denormalized pointer so the latest jurisdiction analysis is a primary-key
+    # fetch; summaries.contract_id points back here, so the constraint is added
+    # with ALTER TABLE after both tables exist (use_alter)
+    latest_jurisdiction_summary_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey(
+            "summaries.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_contracts_latest_jurisdiction_summary"
+        ),
+        index=True
+    )
+    # Not unique: the same text may be uploaded again after a failed or
+    # partially failed run, and each upload keeps its own contract row
+    content_hash: Mapped[Optional[bytes]] = mapped_column(LargeBinary, index=True)
 
     # Relationships with cascade delete
     clauses: Mapped[List["Clause"]] = relationship(
@@ -73,7 +100,8 @@ class Contract(Base):
     summaries: Mapped[List["Summary"]] = relationship(
         back_populates="contract",
         cascade="all, delete-orphan",
-        passive_deletes=True
+        passive_deletes=True,
+        foreign_keys="Summary.contract_id"
     )
     qa_history: Mapped[List["QAHistory"]] = relationship(
         back_populates="contract",
@@ -81,6 +109,18 @@ class Contract(Base):
         passive_deletes=True
     )
 
+    # BRIN on the append-only upload timestamp: a few pages of per-range
+    # min/max summaries instead of a full btree, enough to skip most of the
+    # heap for uploaded_at range filters (crud.get_contracts)
+    __table_args__ = (
+        Index(
+            "ix_contracts_uploaded_at_brin",
+            "uploaded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
+
 
 class Clause(Base):
     """
@@ -96,7 +136,8 @@ class Clause(Base):
         number: Clause number (e.g., '2.1')
         title: Clause heading text
         text: Full clause body text
-        embedding: OpenAI embedding vector (1536 dimensions)
+        embedding: OpenAI embedding vector (EMBEDDING_DIMENSIONS, stored as halfvec:
+                   FP16 halves the heap and index bytes read per search)
         created_at: Timestamp when clause was created
         contract: Parent contract relationship
         risk_assessments: Related risk assessment records
@@ -110,7 +151,9 @@ class Clause(Base):
     number: Mapped[Optional[str]] = mapped_column(String(50))
     title: Mapped[Optional[str]] = mapped_column(String(500))
     text: Mapped[str] = mapped_column(Text)
-    embedding: Mapped[Optional[Vector]] = mapped_column(Vector(1536))  # text-embedding-3-small dimensions
+    # EMBEDDING_DIMENSIONS, FP16. Must be unit length (as returned by
+    # app.services.embeddings): similarity search orders by inner product
+    embedding: Mapped[Optional[HALFVEC]] = mapped_column(HALFVEC(EMBEDDING_DIMENSIONS))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -138,7 +181,8 @@ class Entity(Base):
     Attributes:
         id: Primary key
         contract_id: Foreign key to parent contract
-        entity_type: Entity category (party/date/financial_term/etc.)
+        entity_type: Entity category (party/date/financial_term/etc.), normalized
+            to lowercase on assignment
         value: Extracted entity value
         context: Surrounding text for context
         confidence: Extraction confidence level (high/medium/low)
@@ -159,11 +203,20 @@ class Entity(Base):
     # Relationships
     contract: Mapped["Contract"] = relationship(back_populates="entities")
 
-    # Indexes for filtered queries
+    # Indexes for filtered queries; the CHECK mirrors entity_extractor.ENTITY_TYPES
     __table_args__ = (
         Index("ix_entities_contract_id_type", "contract_id", "entity_type"),
+        CheckConstraint(
+            "entity_type IN ('party', 'date', 'financial_term', 'governing_law', 'obligation')",
+            name="ck_entities_entity_type",
+        ),
     )
 
+    @validates("entity_type")
+    def _normalize_entity_type(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Store entity_type lowercase so type filters can use direct equality."""
+        return value.lower() if value else value
+
 
 class RiskAssessment(Base):
     """
@@ -178,6 +231,8 @@ class RiskAssessment(Base):
         clause_id: Optional foreign key to specific clause
         risk_type: Risk category (termination_rights/indemnity/etc.)
         risk_level: Severity level (low/medium/high)
+        risk_level_rank: Numeric severity generated by the database from
+            risk_level (high=3, medium=2, low=1, other=0) for index-ordered reads
         description: Risk explanation
         justification: Reasoning for risk assessment
         recommendation: Suggested mitigation strategy
@@ -193,6 +248,13 @@ class RiskAssessment(Base):
     clause_id: Mapped[Optional[int]] = mapped_column(ForeignKey("clauses.id", ondelete="CASCADE"))
     risk_type: Mapped[str] = mapped_column(String(100))
     risk_level: Mapped[str] = mapped_column(String(20))
+    risk_level_rank: Mapped[int] = mapped_column(
+        SmallInteger,
+        Computed(
+            "CASE risk_level WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1 ELSE 0 END",
+            persisted=True
+        )
+    )
     description: Mapped[str] = mapped_column(Text)
     justification: Mapped[str] = mapped_column(Text)
     recommendation: Mapped[Optional[str]] = mapped_column(Text)
@@ -202,9 +264,21 @@ class RiskAssessment(Base):
     contract: Mapped["Contract"] = relationship(back_populates="risk_assessments")
     clause: Mapped[Optional["Clause"]] = relationship(back_populates="risk_assessments")
 
-    # Indexes for filtering high-risk items
+    # Indexes for filtering by level (newest first) and severity-ordered listing
+    # (the rank index returns rows already in ORDER BY rank DESC, assessed_at DESC)
     __table_args__ = (
-        Index("ix_risk_assessments_contract_risk", "contract_id", "risk_level"),
+        Index(
+            "ix_risk_assessments_contract_risk_assessed",
+            "contract_id",
+            "risk_level",
+            assessed_at.desc()
+        ),
+        Index(
+            "ix_risk_assessments_contract_rank_assessed",
+            "contract_id",
+            risk_level_rank.desc(),
+            assessed_at.desc()
+        ),
     )
 
 
@@ -220,7 +294,9 @@ class Summary(Base):
         contract_id: Foreign key to parent contract
         summary_type: Summary category (contract_overview/role_specific)
         role: Perspective (supplier/client/neutral)
-        content: Plain-language summary text
+        content: Plain-language summary text (JSON text for legacy structured rows)
+        content_json: Structured payload stored as JSONB (jurisdiction analysis);
+            when set, content is NULL
         created_at: Timestamp when summary was generated
         contract: Parent contract relationship
     """
@@ -231,15 +307,18 @@ class Summary(Base):
     contract_id: Mapped[int] = mapped_column(ForeignKey("contracts.id", ondelete="CASCADE"))
     summary_type: Mapped[str] = mapped_column(String(50))
     role: Mapped[Optional[str]] = mapped_column(String(50))
-    content: Mapped[str] = mapped_column(Text)
+    content: Mapped[Optional[str]] = mapped_column(Text)
+    content_json: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    contract: Mapped["Contract"] = relationship(back_populates="summaries")
+    contract: Mapped["Contract"] = relationship(back_populates="summaries", foreign_keys=[contract_id])
 
-    # Indexes for role-specific queries
+    # Indexes for role-specific queries and latest-summary-by-type lookups
+    # (a backward scan of the created_at column serves ORDER BY created_at DESC LIMIT 1)
     __table_args__ = (
         Index("ix_summaries_contract_role", "contract_id", "role"),
+        Index("ix_summaries_contract_type_created", "contract_id", "summary_type", "created_at"),
     )
 
 
@@ -255,7 +334,7 @@ class QAHistory(Base):
         contract_id: Foreign key to parent contract
         question: User's natural language query
         answer: AI-generated answer
-        referenced_clauses: JSON array of clause IDs used in answer
+        referenced_clauses: Array of clause IDs used in answer
         confidence: Answer confidence level
         asked_at: Timestamp when question was asked
         contract: Parent contract relationship
@@ -267,14 +346,37 @@ class QAHistory(Base):
     contract_id: Mapped[int] = mapped_column(ForeignKey("contracts.id", ondelete="CASCADE"))
     question: Mapped[str] = mapped_column(Text)
     answer: Mapped[str] = mapped_column(Text)
-    referenced_clauses: Mapped[Optional[str]] = mapped_column(Text)  # JSON string of clause IDs
+    referenced_clauses: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer))  # clause IDs
     confidence: Mapped[Optional[str]] = mapped_column(String(20))
     asked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     contract: Mapped["Contract"] = relationship(back_populates="qa_history")
 
-    # Indexes for conversation history
+    # Index for conversation history: WHERE contract_id = ? ORDER BY asked_at DESC
+    # LIMIT n is a backward scan of this index with no sort step
     __table_args__ = (
-        Index("ix_qa_history_contract_id", "contract_id"),
+        Index("ix_qa_history_contract_asked", "contract_id", "asked_at"),
     )
+
+
+class EmbeddingCache(Base):
+    """
+    Caches clause embedding vectors by a hash of the clause text.
+
+    Contracts frequently reuse boilerplate clauses verbatim; looking vectors up
+    here before calling the embeddings API avoids paying for (and waiting on)
+    the same embedding twice. Rows are never updated: identical text always
+    maps to the same vector for a given embedding model.
+
+    Attributes:
+        text_hash: BLAKE2b digest of the clause text (primary key)
+        embedding: OpenAI embedding vector (EMBEDDING_DIMENSIONS)
+        created_at: Timestamp when the vector was cached
+    """
+
+    __tablename__ = "embedding_cache"
+
+    text_hash: Mapped[bytes] = mapped_column(LargeBinary, primary_key=True)
+    embedding: Mapped[Vector] = mapped_column(Vector(EMBEDDING_DIMENSIONS))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -2,9 +2,10 @@
 Embedding Generation Service
 
 This module provides OpenAI text-embedding-3-small vector generation for semantic search
-capabilities. Embeddings are 1536-dimensional vectors used for similarity search with pgvector.
+capabilities. Embeddings are EMBEDDING_DIMENSIONS-long vectors (app.config) used for similarity
+search with pgvector.
 
-Model: text-embedding-3-small (1536 dimensions)
+Model: text-embedding-3-small, shortened to EMBEDDING_DIMENSIONS via the API `dimensions` parameter
 API: OpenAI Embeddings API
 Purpose: Generate semantic vectors for contract clauses to enable similarity-based search
 
@@ -22,6 +23,12 @@ Requirements:
     - Text input should be at least 10 characters for meaningful embeddings
     - Handles truncation automatically for very long texts (>32,000 chars)
 
+Normalization:
+    - Every returned vector has unit L2 length (normalize_embedding). Clause
+      similarity search ranks by inner product, which equals cosine similarity
+      only for unit vectors, so anything written to clauses.embedding or
+      embedding_cache must come from this module or be normalized the same way
+
 Error Handling:
     - Returns tuple (result, error_message) for clear error handling
     - On success: (embedding_vector_list, None)
@@ -30,24 +37,55 @@ Error Handling:
 Batch Processing:
     - For multiple clauses, use generate_embeddings_batch() for efficiency
     - Reduces API calls and improves performance during bulk operations
+    - Large batches are split into chunks of EMBEDDING_CHUNK_SIZE texts that are
+      requested concurrently (up to MAX_CONCURRENT_EMBEDDING_REQUESTS at a time)
 """
 
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 
+from app.config import EMBEDDING_DIMENSIONS
 from app.services.openai_client import get_openai_client
 
 # Module-level logger
 logger = logging.getLogger(__name__)
 
 # OpenAI embedding model configuration
-EMBEDDING_MODEL = "text-embedding-3-small"  # 1536 dimensions, matches Clause.embedding
-EMBEDDING_DIMENSIONS = 1536  # Expected dimensions for validation
+EMBEDDING_MODEL = "text-embedding-3-small"  # Native 1536 dimensions
+# EMBEDDING_DIMENSIONS (app.config) is requested via the API `dimensions`
+# parameter (Matryoshka truncation, returned unit-normalized): near-identical
+# retrieval quality at half the storage and index size of 1536.
 
 # Text preprocessing limits
 MIN_TEXT_LENGTH = 10  # Minimum characters for meaningful embedding
 MAX_TEXT_LENGTH = 32000  # Approximate token limit (8191 tokens ≈ 32,000 chars)
 
+# Batch request limits
+EMBEDDING_CHUNK_SIZE = 100  # Texts per embeddings API request
+MAX_CONCURRENT_EMBEDDING_REQUESTS = 4  # Chunk requests in flight at once
+
+
+def normalize_embedding(vector: List[float]) -> List[float]:
+    """
+    Scale a vector to unit L2 length.
+
+    text-embedding-3 vectors, including ones shortened with `dimensions`, are
+    already returned unit-normalized; this enforces the invariant rather than
+    trusting it, so inner-product search stays equivalent to cosine.
+
+    Args:
+        vector: Embedding vector
+
+    Returns:
+        The vector divided by its L2 norm (unchanged if the norm is 0)
+    """
+    norm = math.sqrt(math.fsum(x * x for x in vector))
+    if norm == 0.0:
+        return vector
+    return [x / norm for x in vector]
+
 
 def generate_embedding(text: str) -> Tuple[Optional[List[float]], Optional[str]]:
     """
@@ -58,7 +96,7 @@ def generate_embedding(text: str) -> Tuple[Optional[List[float]], Optional[str]]
 
     Returns:
         Tuple of (embedding_vector, error_message):
-            - On success: (list of 1536 floats, None)
+            - On success: (list of EMBEDDING_DIMENSIONS floats, unit length, None)
             - On failure: (None, error message string)
 
     Error Handling:
@@ -105,6 +143,7 @@ def generate_embedding(text: str) -> Tuple[Optional[List[float]], Optional[str]]
         response = client.embeddings.create(
             model=EMBEDDING_MODEL,
             input=text,
+            dimensions=EMBEDDING_DIMENSIONS,
             encoding_format="float"
         )
 
@@ -121,7 +160,7 @@ def generate_embedding(text: str) -> Tuple[Optional[List[float]], Optional[str]]
             return None, error_msg
 
         logger.debug(f"Successfully generated {len(embedding_vector)}-dimensional embedding")
-        return embedding_vector, None
+        return normalize_embedding(embedding_vector), None
 
     except ValueError as e:
         # Configuration errors (missing API key, etc.)
@@ -136,9 +175,39 @@ def generate_embedding(text: str) -> Tuple[Optional[List[float]], Optional[str]]
         return None, error_msg
 
 
+def _embed_chunk(client, chunk: List[str]) -> Tuple[Optional[List[List[float]]], Optional[str]]:
+    """
+    Request embeddings for one chunk of preprocessed texts.
+
+    Args:
+        client: OpenAI client instance
+        chunk: Texts already validated and truncated by the caller
+
+    Returns:
+        Tuple of (vectors in input order, None) on success, or (None, error message)
+    """
+    try:
+        response = client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=chunk,
+            dimensions=EMBEDDING_DIMENSIONS,
+            encoding_format="float"
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)], None
+    except Exception as e:
+        error_msg = f"Unexpected error generating batch embeddings: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return None, error_msg
+
+
 def generate_embeddings_batch(texts: List[str]) -> Tuple[List[Optional[List[float]]], List[Optional[str]]]:
     """
-    Generate embeddings for multiple texts in a single API call for efficiency.
+    Generate embeddings for multiple texts with as few API round-trips as possible.
+
+    Texts are sent in chunks of EMBEDDING_CHUNK_SIZE. When more than one chunk
+    is needed, the chunk requests run concurrently on a small thread pool (the
+    calls are network-bound), so wall time is roughly one request rather than
+    one per chunk. A failed chunk only marks its own texts as failed.
 
     Args:
         texts: List of text strings to generate embeddings for
@@ -193,13 +262,19 @@ def generate_embeddings_batch(texts: List[str]) -> Tuple[List[Optional[List[floa
             logger.error(error_msg)
             return [None] * len(texts), [error_msg] * len(texts)
 
-        # Call OpenAI Embeddings API with batch
-        logger.info(f"Generating embeddings for {len(valid_texts)} texts in batch")
-        response = client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=valid_texts,
-            encoding_format="float"
-        )
+        # Call OpenAI Embeddings API, one request per chunk
+        chunks = [
+            valid_texts[start:start + EMBEDDING_CHUNK_SIZE]
+            for start in range(0, len(valid_texts), EMBEDDING_CHUNK_SIZE)
+        ]
+        logger.info(f"Generating embeddings for {len(valid_texts)} texts in {len(chunks)} request(s)")
+        if len(chunks) == 1:
+            chunk_results = [_embed_chunk(client, chunks[0])]
+        else:
+            workers = min(MAX_CONCURRENT_EMBEDDING_REQUESTS, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() preserves chunk order
+                chunk_results = list(executor.map(lambda chunk: _embed_chunk(client, chunk), chunks))
 
         # Initialize result lists
         embeddings_list: List[Optional[List[float]]] = [None] * len(texts)
@@ -207,25 +282,32 @@ def generate_embeddings_batch(texts: List[str]) -> Tuple[List[Optional[List[floa
 
         # Process successful embeddings
         successful = 0
-        for i, embedding_data in enumerate(response.data):
-            original_index = valid_indices[i]
-            embedding_vector = embedding_data.embedding
-
-            # Validate dimensions
-            if len(embedding_vector) != EMBEDDING_DIMENSIONS:
-                error_msg = (
-                    f"Embedding dimension mismatch: expected {EMBEDDING_DIMENSIONS}, "
-                    f"got {len(embedding_vector)}"
-                )
-                logger.error(f"Text {original_index}: {error_msg}")
-                errors_list[original_index] = error_msg
-            else:
-                embeddings_list[original_index] = embedding_vector
-                successful += 1
+        for chunk_number, (chunk, (vectors, chunk_error)) in enumerate(zip(chunks, chunk_results)):
+            offset = chunk_number * EMBEDDING_CHUNK_SIZE
+            if chunk_error:
+                for i in range(len(chunk)):
+                    errors_list[valid_indices[offset + i]] = chunk_error
+                continue
+
+            for i, embedding_vector in enumerate(vectors):
+                original_index = valid_indices[offset + i]
+
+                # Validate dimensions
+                if len(embedding_vector) != EMBEDDING_DIMENSIONS:
+                    error_msg = (
+                        f"Embedding dimension mismatch: expected {EMBEDDING_DIMENSIONS}, "
+                        f"got {len(embedding_vector)}"
+                    )
+                    logger.error(f"Text {original_index}: {error_msg}")
+                    errors_list[original_index] = error_msg
+                else:
+                    embeddings_list[original_index] = normalize_embedding(embedding_vector)
+                    successful += 1
 
         # Mark skipped texts as failed
+        valid_index_set = set(valid_indices)
         for i in range(len(texts)):
-            if i not in valid_indices and embeddings_list[i] is None:
+            if i not in valid_index_set and embeddings_list[i] is None:
                 errors_list[i] = f"Text too short for embedding (minimum {MIN_TEXT_LENGTH} characters)"
 
         failed = len(texts) - successful
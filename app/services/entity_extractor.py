@@ -18,6 +18,9 @@ Usage:
     entities = extract_entities(contract_text)
     # Returns list of dicts with entity_type, value, context, confidence
 
+    # From async code (awaits the OpenAI call instead of blocking a thread)
+    entities = await extract_entities_async(contract_text)
+
 Requirements:
 - OPENAI_API_KEY must be set in environment variables
 - OpenAI GPT-4o access (ensure sufficient API credits)
@@ -27,7 +30,7 @@ Error handling:
 - Logs all errors for debugging and monitoring
 """
 
-from app.services.openai_client import get_openai_client
+from app.services.openai_client import get_async_openai_client, get_openai_client
 from typing import List, Dict, Any, Optional
 import json
 import logging
@@ -119,6 +122,114 @@ Guidelines:
 """
 
 
+def _build_request(contract_text: str) -> Dict[str, Any]:
+    """
+    Build the chat completion arguments for an extraction request.
+
+    Args:
+        contract_text: The full contract text to analyze
+
+    Returns:
+        Keyword arguments for client.chat.completions.create()
+    """
+    user_prompt = f"""Extract all entities from the following contract text:
+
+{contract_text}
+
+Remember to return a JSON object with an "entities" array containing all extracted entities."""
+
+    return {
+        "model": MODEL_NAME,
+        "messages": [
+            {"role": "system", "content": _build_system_prompt()},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.1,  # Low temperature for consistent, deterministic results
+        "response_format": {"type": "json_object"}  # Enforce JSON output (GPT-4o feature)
+    }
+
+
+def _validate_input(contract_text: str) -> Optional[str]:
+    """Return an error message if the text is too short to extract from, else None."""
+    if not contract_text or len(contract_text.strip()) < 50:
+        error_msg = "Contract text is empty or too short for entity extraction"
+        logger.warning(error_msg)
+        return error_msg
+    return None
+
+
+def _parse_response(response_content: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Parse and validate the model's JSON response.
+
+    Args:
+        response_content: Message content returned by the chat completion
+
+    Returns:
+        Tuple of (validated entity dictionaries, error message or None)
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    logger.debug(f"Received response from OpenAI: {response_content[:200]}...")
+
+    # Parse JSON
+    response_data = json.loads(response_content)
+
+    # Validate response structure
+    if "entities" not in response_data:
+        error_msg = "OpenAI response missing 'entities' key"
+        logger.error(error_msg)
+        return [], error_msg
+
+    entities = response_data["entities"]
+    if not isinstance(entities, list):
+        error_msg = f"OpenAI response 'entities' is not a list: {type(entities)}"
+        logger.error(error_msg)
+        return [], error_msg
+
+    # Validate and clean each entity
+    validated_entities = []
+    for entity in entities:
+        # Check required fields
+        if "entity_type" not in entity or "value" not in entity:
+            logger.warning(f"Skipping entity missing required fields: {entity}")
+            continue
+
+        # Validate entity type
+        entity_type = entity["entity_type"]
+        if entity_type not in ENTITY_TYPES:
+            logger.warning(f"Skipping entity with invalid type '{entity_type}': {entity}")
+            continue
+
+        # Default confidence if missing
+        if "confidence" not in entity or not entity["confidence"]:
+            entity["confidence"] = "medium"
+
+        # Truncate context if too long
+        if "context" in entity and entity["context"] and len(entity["context"]) > 500:
+            entity["context"] = entity["context"][:497] + "..."
+
+        validated_entities.append(entity)
+
+    logger.info(f"Successfully extracted {len(validated_entities)} entities")
+    return validated_entities, None
+
+
+def _failure_message(e: Exception) -> str:
+    """Map an extraction exception to the error message returned to callers."""
+    if isinstance(e, json.JSONDecodeError):
+        error_msg = f"Failed to parse JSON response from OpenAI: {e}"
+    elif isinstance(e, ValueError):
+        # Configuration errors (missing API key, etc.)
+        error_msg = str(e)
+    else:
+        # OpenAI API errors and any other unexpected errors
+        error_msg = f"Entity extraction failed: {type(e).__name__}: {e}"
+    logger.error(error_msg)
+    return error_msg
+
+
 def extract_entities(contract_text: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Extract entities from contract text using OpenAI GPT-4o.
@@ -144,10 +255,8 @@ def extract_entities(contract_text: str) -> tuple[List[Dict[str, Any]], Optional
             'confidence': 'high'
         }
     """
-    # Input validation
-    if not contract_text or len(contract_text.strip()) < 50:
-        error_msg = "Contract text is empty or too short for entity extraction"
-        logger.warning(error_msg)
+    error_msg = _validate_input(contract_text)
+    if error_msg:
         return [], error_msg
 
     try:
@@ -156,83 +265,41 @@ def extract_entities(contract_text: str) -> tuple[List[Dict[str, Any]], Optional
         # Get or create OpenAI client (lazy initialization)
         client = get_openai_client()
 
-        # Build user prompt
-        user_prompt = f"""Extract all entities from the following contract text:
+        # Call OpenAI API
+        completion = client.chat.completions.create(**_build_request(contract_text))
+        return _parse_response(completion.choices[0].message.content)
 
-{contract_text}
+    except Exception as e:
+        return [], _failure_message(e)
 
-Remember to return a JSON object with an "entities" array containing all extracted entities."""
 
-        # Call OpenAI API
-        completion = client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[
-                {"role": "system", "content": _build_system_prompt()},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,  # Low temperature for consistent, deterministic results
-            response_format={"type": "json_object"}  # Enforce JSON output (GPT-4o feature)
-        )
-
-        # Extract response
-        response_content = completion.choices[0].message.content
-        logger.debug(f"Received response from OpenAI: {response_content[:200]}...")
-
-        # Parse JSON
-        response_data = json.loads(response_content)
-
-        # Validate response structure
-        if "entities" not in response_data:
-            error_msg = "OpenAI response missing 'entities' key"
-            logger.error(error_msg)
-            return [], error_msg
-
-        entities = response_data["entities"]
-        if not isinstance(entities, list):
-            error_msg = f"OpenAI response 'entities' is not a list: {type(entities)}"
-            logger.error(error_msg)
-            return [], error_msg
-
-        # Validate and clean each entity
-        validated_entities = []
-        for entity in entities:
-            # Check required fields
-            if "entity_type" not in entity or "value" not in entity:
-                logger.warning(f"Skipping entity missing required fields: {entity}")
-                continue
-
-            # Validate entity type
-            entity_type = entity["entity_type"]
-            if entity_type not in ENTITY_TYPES:
-                logger.warning(f"Skipping entity with invalid type '{entity_type}': {entity}")
-                continue
-
-            # Default confidence if missing
-            if "confidence" not in entity or not entity["confidence"]:
-                entity["confidence"] = "medium"
-
-            # Truncate context if too long
-            if "context" in entity and entity["context"] and len(entity["context"]) > 500:
-                entity["context"] = entity["context"][:497] + "..."
-
-            validated_entities.append(entity)
-
-        logger.info(f"Successfully extracted {len(validated_entities)} entities")
-        return validated_entities, None
-
-    except json.JSONDecodeError as e:
-        error_msg = f"Failed to parse JSON response from OpenAI: {e}"
-        logger.error(error_msg)
-        return [], error_msg
+async def extract_entities_async(contract_text: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Extract entities like extract_entities(), awaiting the OpenAI call.
 
-    except ValueError as e:
-        # Catch configuration errors (missing API key, etc.)
-        error_msg = str(e)
-        logger.error(error_msg)
+    For async endpoints: the event loop serves other requests while the
+    completion (typically several seconds) is in flight, instead of a
+    threadpool worker blocking on it.
+
+    Args:
+        contract_text: The full contract text to analyze
+
+    Returns:
+        Same (entities, error message) tuple as extract_entities()
+
+    Example:
+        >>> entities, error = await extract_entities_async(contract_text)
+    """
+    error_msg = _validate_input(contract_text)
+    if error_msg:
         return [], error_msg
 
+    try:
+        logger.info(f"Starting entity extraction for contract (length: {len(contract_text)} chars)")
+
+        client = get_async_openai_client()
+        completion = await client.chat.completions.create(**_build_request(contract_text))
+        return _parse_response(completion.choices[0].message.content)
+
     except Exception as e:
-        # Catch OpenAI API errors and any other unexpected errors
-        error_msg = f"Entity extraction failed: {type(e).__name__}: {e}"
-        logger.error(error_msg)
-        return [], error_msg
+        return [], _failure_message(e)
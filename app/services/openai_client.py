@@ -10,6 +10,10 @@ Usage:
     client = get_openai_client()
     completion = client.chat.completions.create(...)
 
+    # In async endpoints, await the call instead of blocking a worker thread
+    client = get_async_openai_client()
+    completion = await client.chat.completions.create(...)
+
 Benefits:
 - Single source of truth for OpenAI client configuration
 - Lazy initialization to prevent import-time failures
@@ -17,7 +21,7 @@ Benefits:
 - Consistent error handling across services
 """
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from app.config import get_settings
 import logging
 import threading
@@ -25,8 +29,9 @@ import threading
 # Module-level setup
 logger = logging.getLogger(__name__)
 
-# Cache the OpenAI client to avoid recreating it on every call
+# Cache the OpenAI clients to avoid recreating them on every call
 _client_cache = None
+_async_client_cache = None
 
 # Thread-safe initialization lock
 _client_init_lock = threading.Lock()
@@ -89,3 +94,51 @@ def get_openai_client() -> OpenAI:
                     ) from e
 
     return _client_cache
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Get or create the cached asyncio OpenAI client.
+
+    Same configuration and error handling as get_openai_client(), but the
+    returned client's methods are coroutines. Awaiting a completion frees the
+    event loop (and no worker thread is held) for the whole network round-trip,
+    so async endpoints can keep many LLM calls in flight per worker.
+
+    Returns:
+        AsyncOpenAI: Configured asyncio OpenAI client instance
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not configured
+
+    Example:
+        >>> client = get_async_openai_client()
+        >>> completion = await client.chat.completions.create(
+        ...     model="gpt-4o-mini",
+        ...     messages=[{"role": "user", "content": "Hello"}]
+        ... )
+    """
+    global _async_client_cache
+
+    if _async_client_cache is None:
+        with _client_init_lock:
+            if _async_client_cache is None:
+                try:
+                    settings = get_settings()
+                    if not settings.openai_api_key:
+                        raise ValueError(
+                            "OPENAI_API_KEY is not configured. Please set the OPENAI_API_KEY "
+                            "environment variable to use AI-powered features."
+                        )
+
+                    _async_client_cache = AsyncOpenAI(api_key=settings.openai_api_key)
+                    logger.info("Async OpenAI client initialized successfully")
+
+                except Exception as e:
+                    logger.error(f"Failed to initialize async OpenAI client: {e}")
+                    raise ValueError(
+                        f"Failed to initialize OpenAI client: {e}. "
+                        "Ensure OPENAI_API_KEY is set in your environment."
+                    ) from e
+
+    return _async_client_cache
@@ -7,14 +7,15 @@ to enable natural language queries about contract content.
 
 How It Works:
     1. Generate query embedding: Convert user's question to vector using text-embedding-3-small
-    2. Semantic search: Find top 5 most similar clauses using pgvector L2 distance
+    2. Semantic search: Find top 5 most similar clauses using pgvector inner product
+       (cosine similarity, as all embeddings are unit length)
     3. Build context: Format retrieved clauses as context for AI
     4. Generate answer: Use GPT-4o-mini to generate comprehensive answer from context
     5. Link clauses: Return database IDs of clauses used in the answer
 
 Model: GPT-4o-mini with temperature 0.2
-Search: pgvector L2 distance similarity (top 5 clauses)
-Embeddings: text-embedding-3-small (1536 dimensions)
+Search: pgvector inner product on unit vectors, i.e. cosine similarity (top 5 clauses)
+Embeddings: text-embedding-3-small (EMBEDDING_DIMENSIONS, app.config)
 
 Usage Example:
     from app.services.qa_engine import answer_question
@@ -54,10 +55,13 @@ import json
 import re
 from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select
+from pgvector.sqlalchemy import HALFVEC
 
+from app.config import EMBEDDING_DIMENSIONS
 from app.services.openai_client import get_openai_client
 from app.services.embeddings import generate_embedding
+from app.crud import release_connection
 from app.models import Clause
 
 # Module-level logger
@@ -76,6 +80,21 @@ MIN_QUESTION_LENGTH = 10  # Minimum characters for a valid question (matches emb
 # Context building
 MAX_CONTEXT_LENGTH = 6000  # Maximum context length in characters (leave room for answer)
 
+# Similarity search statement, built once so each question only binds parameters.
+# Keep it a flat single-table query: a plain WHERE on clauses.contract_id plus
+# ORDER BY embedding <#> :q LIMIT k. Joins or a CTE/subquery wrapper around the
+# distance ordering stop PostgreSQL from using the vector index. For one
+# contract's clauses the planner normally picks ix_clauses_contract_id and
+# sorts the few candidates exactly; the HNSW index serves unfiltered or
+# weakly filtered searches (raise hnsw.ef_search if a selective filter
+# leaves fewer than k rows).
+_SIMILAR_CLAUSES_STMT = select(Clause).where(
+    Clause.contract_id == bindparam("contract_id"),
+    Clause.embedding.isnot(None)
+).order_by(
+    Clause.embedding.max_inner_product(bindparam("query_embedding", type_=HALFVEC(EMBEDDING_DIMENSIONS)))
+).limit(bindparam("top_k"))
+
 
 def _build_system_prompt() -> str:
     """
@@ -133,31 +152,33 @@ def _search_similar_clauses(
     top_k: int = TOP_K_CLAUSES
 ) -> List[Clause]:
     """
-    Search for most similar clauses using pgvector L2 distance.
+    Search for most similar clauses using pgvector inner product.
 
-    This performs semantic similarity search using pgvector's L2 distance operator
-    to find clauses most relevant to the user's question.
+    This performs semantic similarity search using pgvector's negative inner
+    product operator to find clauses most relevant to the user's question.
 
     Args:
         db: Database session
         contract_id: Contract database ID
-        query_embedding: Question embedding vector (1536 dimensions)
+        query_embedding: Question embedding vector (EMBEDDING_DIMENSIONS floats)
         top_k: Number of most similar clauses to retrieve (default 5)
 
     Returns:
         List of Clause objects ordered by similarity (most similar first)
 
     Note:
-        Uses pgvector's L2 distance operator (<->) for similarity search.
+        Uses pgvector's negative inner product operator (<#>), the operator
+        class of the ix_clauses_embedding_hnsw index. Stored and query
+        embeddings are unit length (app.services.embeddings normalizes them),
+        so the ranking is identical to cosine distance without the per-row
+        norm computations.
         Only returns clauses that have embeddings (embedding IS NOT NULL).
     """
-    # Query clauses with embeddings, ordered by L2 distance to query embedding
-    clauses = db.query(Clause).filter(
-        Clause.contract_id == contract_id,
-        Clause.embedding.isnot(None)
-    ).order_by(
-        Clause.embedding.l2_distance(query_embedding)
-    ).limit(top_k).all()
+    # Query clauses with embeddings, most similar (largest inner product) first
+    clauses = db.scalars(
+        _SIMILAR_CLAUSES_STMT,
+        {"contract_id": contract_id, "query_embedding": query_embedding, "top_k": top_k}
+    ).all()
 
     logger.debug(f"Found {len(clauses)} similar clauses for contract {contract_id}")
     return clauses
@@ -334,6 +355,10 @@ def answer_question(
 
         context = "\n".join(context_parts)
 
+        # Context is built from plain values; return the pooled connection
+        # before the (slow) chat completion call
+        release_connection(db)
+
         # Truncate context if too long
         if len(context) > MAX_CONTEXT_LENGTH:
             context = context[:MAX_CONTEXT_LENGTH]
@@ -423,7 +448,7 @@ Please answer the question based on the provided clauses. Return your response i
             else:
                 # Priority 3: Last fallback - use top 2-3 most similar clauses
                 fallback_count = min(3, len(similar_clauses))
-                referenced_clause_ids = [similar_clauses[i].id for i in range(fallback_count)]
+                referenced_clause_ids = [index_to_id_mapping[i] for i in range(fallback_count)]
                 logger.info(
                     f"No references found, using top {fallback_count} most similar clauses as fallback"
                 )
@@ -0,0 +1,35 @@
+-- Migration: Store jurisdiction analysis as JSONB
+-- Date: 2026-10-16
+-- Description: Adds summaries.content_json (JSONB) for structured payloads and
+--              makes summaries.content nullable
+--
+-- Background:
+-- - Jurisdiction analysis used to be serialized with indent=2 into the TEXT
+--   content column and re-parsed on every read
+-- - New code writes the analysis dict to content_json (content stays NULL);
+--   rows without content_json are still read from content, so existing data
+--   keeps working without a backfill
+--
+-- Rollback:
+--   UPDATE summaries SET content = content_json::text WHERE content IS NULL AND content_json IS NOT NULL;
+--   ALTER TABLE summaries ALTER COLUMN content SET NOT NULL;
+--   ALTER TABLE summaries DROP COLUMN content_json;
+
+BEGIN;
+
+ALTER TABLE summaries ADD COLUMN IF NOT EXISTS content_json JSONB;
+
+ALTER TABLE summaries ALTER COLUMN content DROP NOT NULL;
+
+COMMIT;
+
+-- Optional backfill (fails on the first malformed row; such rows are purged
+-- by get_jurisdiction_analysis on read, so this can be skipped safely):
+-- UPDATE summaries
+-- SET content_json = content::jsonb, content = NULL
+-- WHERE summary_type = 'jurisdiction_analysis' AND content_json IS NULL;
+
+-- Verification query (run after migration):
+-- SELECT COUNT(*) FILTER (WHERE content_json IS NOT NULL) AS jsonb_rows,
+--        COUNT(*) FILTER (WHERE content_json IS NULL) AS text_rows
+-- FROM summaries WHERE summary_type = 'jurisdiction_analysis';
@@ -0,0 +1,35 @@
+-- Migration: Constrain entity_type to the known entity categories
+-- Date: 2026-10-16
+-- Description: Adds CHECK constraint ck_entities_entity_type and refreshes
+--              planner statistics for the entities table
+--
+-- Background:
+-- - entity_extractor only persists types in ENTITY_TYPES, and Entity lowercases
+--   entity_type on write, so existing rows already satisfy the constraint once
+--   001_normalize_entity_type.sql has been applied
+-- - count_entities_by_type groups by (contract_id, entity_type), which is fully
+--   covered by ix_entities_contract_id_type; ANALYZE updates the visibility and
+--   distinct-value statistics so the planner picks an index-only scan
+--
+-- Prerequisite: 001_normalize_entity_type.sql
+--
+-- Rollback: ALTER TABLE entities DROP CONSTRAINT IF EXISTS ck_entities_entity_type;
+
+BEGIN;
+
+-- NOT VALID + VALIDATE avoids holding an ACCESS EXCLUSIVE lock during the scan
+ALTER TABLE entities
+    ADD CONSTRAINT ck_entities_entity_type
+    CHECK (entity_type IN ('party', 'date', 'financial_term', 'governing_law', 'obligation'))
+    NOT VALID;
+
+ALTER TABLE entities VALIDATE CONSTRAINT ck_entities_entity_type;
+
+COMMIT;
+
+-- Refresh statistics (also sets the visibility map used by index-only scans)
+VACUUM (ANALYZE) entities;
+
+-- Verification query (run after migration):
+-- EXPLAIN SELECT entity_type, count(*) FROM entities WHERE contract_id = 1 GROUP BY entity_type;
+-- Expected: Index Only Scan using ix_entities_contract_id_type
@@ -0,0 +1,26 @@
+-- Migration: Index summaries by (contract_id, summary_type, created_at)
+-- Date: 2026-10-16
+-- Description: Adds ix_summaries_contract_type_created for "latest summary of a
+--              type" lookups
+--
+-- Background:
+-- - get_latest_summary, get_jurisdiction_analysis and get_contract_summary run
+--   WHERE contract_id = ? AND summary_type = ? ORDER BY created_at DESC LIMIT 1
+-- - With this index PostgreSQL walks the index backwards and stops at the
+--   first row instead of sorting all of a contract's summaries
+--
+-- Rollback:
+--   DROP INDEX IF EXISTS ix_summaries_contract_type_created;
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_summaries_contract_type_created
+    ON summaries (contract_id, summary_type, created_at);
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- EXPLAIN SELECT * FROM summaries
+-- WHERE contract_id = 1 AND summary_type = 'jurisdiction_analysis'
+-- ORDER BY created_at DESC LIMIT 1;
+-- Expected: Index Scan Backward using ix_summaries_contract_type_created
@@ -0,0 +1,29 @@
+-- Migration: Add embedding_cache table
+-- Date: 2026-10-16
+-- Description: Creates embedding_cache, which maps a BLAKE2b hash of clause text
+--              to its embedding vector so repeated boilerplate clauses are not
+--              re-embedded
+--
+-- Background:
+-- - bulk_create_clauses embeds every clause through the OpenAI API
+-- - Contracts often reuse clauses verbatim; the cache is checked first and
+--   only misses are sent to the API, then stored here for next time
+-- - Requires the pgvector extension (already enabled by db_init.py)
+--
+-- Rollback:
+--   DROP TABLE IF EXISTS embedding_cache;
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    text_hash BYTEA PRIMARY KEY,
+    embedding vector(1536) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- SELECT count(*), pg_size_pretty(pg_total_relation_size('embedding_cache'))
+-- FROM embedding_cache;
+-- Expected: table exists (count is 0 until the next contract is segmented)
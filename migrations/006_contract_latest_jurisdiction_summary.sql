@@ -0,0 +1,49 @@
+-- Migration: Add contracts.latest_jurisdiction_summary_id
+-- Date: 2026-10-16
+-- Description: Denormalized pointer from each contract to its newest
+--              jurisdiction analysis summary, backfilled from existing rows
+--
+-- Background:
+-- - get_jurisdiction_analysis used to run
+--   WHERE contract_id = ? AND summary_type = 'jurisdiction_analysis'
+--   ORDER BY created_at DESC LIMIT 1 on every analyze-jurisdiction request
+-- - crud.create_jurisdiction_analysis now sets this column in the same
+--   transaction as the insert, so the read is a primary-key fetch
+-- - ON DELETE SET NULL clears the pointer when the summary is deleted; the
+--   index keeps that check cheap when summaries are deleted
+--
+-- Rollback:
+--   ALTER TABLE contracts DROP COLUMN IF EXISTS latest_jurisdiction_summary_id;
+
+BEGIN;
+
+ALTER TABLE contracts
+    ADD COLUMN IF NOT EXISTS latest_jurisdiction_summary_id INTEGER;
+
+ALTER TABLE contracts
+    ADD CONSTRAINT fk_contracts_latest_jurisdiction_summary
+    FOREIGN KEY (latest_jurisdiction_summary_id) REFERENCES summaries (id)
+    ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS ix_contracts_latest_jurisdiction_summary_id
+    ON contracts (latest_jurisdiction_summary_id);
+
+-- Backfill: newest jurisdiction analysis per contract
+UPDATE contracts c
+SET latest_jurisdiction_summary_id = s.id
+FROM (
+    SELECT DISTINCT ON (contract_id) contract_id, id
+    FROM summaries
+    WHERE summary_type = 'jurisdiction_analysis'
+    ORDER BY contract_id, created_at DESC, id DESC
+) s
+WHERE c.id = s.contract_id;
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- SELECT count(*) FROM contracts c
+-- WHERE c.latest_jurisdiction_summary_id IS NULL
+--   AND EXISTS (SELECT 1 FROM summaries s
+--               WHERE s.contract_id = c.id AND s.summary_type = 'jurisdiction_analysis');
+-- Expected: 0
@@ -0,0 +1,35 @@
+-- Migration: Add generated risk_assessments.risk_level_rank and ordering index
+-- Date: 2026-10-16
+-- Description: Adds a stored generated column mapping risk_level to a numeric
+--              severity (high=3, medium=2, low=1, other=0) and an index on
+--              (contract_id, risk_level_rank DESC, assessed_at DESC)
+--
+-- Background:
+-- - get_risk_assessments_by_contract ordered by a CASE expression on
+--   risk_level, which no index can serve, so every call sorted the rows
+-- - Ordering by the generated column lets PostgreSQL read rows from the new
+--   index already in severity/recency order
+-- - The column is computed by PostgreSQL, so existing rows are filled when it
+--   is added (this rewrites the table) and inserts need no application changes
+--
+-- Rollback:
+--   DROP INDEX IF EXISTS ix_risk_assessments_contract_rank_assessed;
+--   ALTER TABLE risk_assessments DROP COLUMN IF EXISTS risk_level_rank;
+
+BEGIN;
+
+ALTER TABLE risk_assessments
+    ADD COLUMN IF NOT EXISTS risk_level_rank SMALLINT
+    GENERATED ALWAYS AS (
+        CASE risk_level WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1 ELSE 0 END
+    ) STORED NOT NULL;
+
+CREATE INDEX IF NOT EXISTS ix_risk_assessments_contract_rank_assessed
+    ON risk_assessments (contract_id, risk_level_rank DESC, assessed_at DESC);
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- EXPLAIN SELECT * FROM risk_assessments WHERE contract_id = 1
+-- ORDER BY risk_level_rank DESC, assessed_at DESC;
+-- Expected: Index Scan using ix_risk_assessments_contract_rank_assessed (no Sort node)
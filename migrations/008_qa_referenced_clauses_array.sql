@@ -0,0 +1,36 @@
+-- Migration: Convert qa_history.referenced_clauses from JSON text to integer[]
+-- Date: 2026-10-16
+-- Description: Stores referenced clause IDs as a native PostgreSQL array so
+--              they round-trip as a Python list[int] without JSON encoding
+--
+-- Background:
+-- - create_qa_record serialized the ID list to a JSON string and
+--   parse_referenced_clauses re-parsed and validated it on every read
+-- - ALTER COLUMN ... USING cannot contain a subquery, so the values are copied
+--   into a new column, which then replaces the old one
+-- - Rows whose text is not a JSON array of integers (never written by the
+--   application) become NULL, which reads back as an empty list
+--
+-- Rollback:
+--   ALTER TABLE qa_history ALTER COLUMN referenced_clauses TYPE TEXT
+--       USING array_to_json(referenced_clauses)::text;
+
+BEGIN;
+
+ALTER TABLE qa_history ADD COLUMN referenced_clauses_ids INTEGER[];
+
+UPDATE qa_history
+SET referenced_clauses_ids = ARRAY(
+    SELECT jsonb_array_elements_text(referenced_clauses::jsonb)::integer
+)
+WHERE referenced_clauses ~ '^\s*\[[\s\d,"]*\]\s*$';
+
+ALTER TABLE qa_history DROP COLUMN referenced_clauses;
+ALTER TABLE qa_history RENAME COLUMN referenced_clauses_ids TO referenced_clauses;
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- SELECT data_type FROM information_schema.columns
+-- WHERE table_name = 'qa_history' AND column_name = 'referenced_clauses';
+-- Expected: ARRAY
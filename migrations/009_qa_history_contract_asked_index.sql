@@ -0,0 +1,31 @@
+-- Migration: Index qa_history by (contract_id, asked_at)
+-- Date: 2026-10-16
+-- Description: Replaces ix_qa_history_contract_id with a composite index that
+--              also serves the asked_at ordering of conversation history
+--
+-- Background:
+-- - get_qa_history_by_contract runs
+--   WHERE contract_id = ? ORDER BY asked_at DESC LIMIT n
+-- - With only (contract_id) indexed, PostgreSQL fetched every Q&A row for the
+--   contract and sorted them; the composite index is walked backwards and
+--   stops after n rows
+-- - The old single-column index is a prefix of the new one, so it is dropped
+-- - Summaries already have the equivalent index (migration 004)
+--
+-- Rollback:
+--   CREATE INDEX IF NOT EXISTS ix_qa_history_contract_id ON qa_history (contract_id);
+--   DROP INDEX IF EXISTS ix_qa_history_contract_asked;
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_qa_history_contract_asked
+    ON qa_history (contract_id, asked_at);
+
+DROP INDEX IF EXISTS ix_qa_history_contract_id;
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- EXPLAIN SELECT * FROM qa_history WHERE contract_id = 1
+-- ORDER BY asked_at DESC LIMIT 50;
+-- Expected: Limit -> Index Scan Backward using ix_qa_history_contract_asked
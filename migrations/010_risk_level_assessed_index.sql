@@ -0,0 +1,33 @@
+-- Migration: Index risk_assessments by (contract_id, risk_level, assessed_at DESC)
+-- Date: 2026-10-16
+-- Description: Replaces ix_risk_assessments_contract_risk with a composite
+--              index that also serves the recency ordering of level-filtered
+--              risk listings
+--
+-- Background:
+-- - get_high_risk_assessments and get_risk_assessments_by_contract(risk_level=...)
+--   run WHERE contract_id = ? AND risk_level = ? ORDER BY assessed_at DESC
+--   (the severity rank is constant within one level, so it is no longer sorted on)
+-- - With only (contract_id, risk_level) indexed, PostgreSQL fetched the matching
+--   rows and sorted them; the new index returns them already ordered
+-- - The old index is a prefix of the new one (count_risks_by_level still uses
+--   it), so it is dropped
+--
+-- Rollback:
+--   CREATE INDEX IF NOT EXISTS ix_risk_assessments_contract_risk
+--       ON risk_assessments (contract_id, risk_level);
+--   DROP INDEX IF EXISTS ix_risk_assessments_contract_risk_assessed;
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_risk_assessments_contract_risk_assessed
+    ON risk_assessments (contract_id, risk_level, assessed_at DESC);
+
+DROP INDEX IF EXISTS ix_risk_assessments_contract_risk;
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- EXPLAIN SELECT * FROM risk_assessments WHERE contract_id = 1
+-- AND risk_level = 'high' ORDER BY assessed_at DESC;
+-- Expected: Index Scan using ix_risk_assessments_contract_risk_assessed (no Sort node)
@@ -0,0 +1,40 @@
+-- Migration: Switch the clause embedding index from IVFFlat (L2) to HNSW (cosine)
+-- Date: 2026-10-16
+-- Description: Replaces ix_clauses_embedding_ivfflat with an HNSW index using
+--              vector_cosine_ops, matching the Q&A similarity query (<=>)
+--
+-- Background:
+-- - IVFFlat clusters the rows present at build time; as clauses are inserted
+--   its lists go stale and recall drops until the index is rebuilt
+-- - HNSW needs no training step and keeps recall under continuous inserts,
+--   with higher QPS at the same recall
+-- - The Q&A search now orders by cosine distance (<=>); an index only serves
+--   the operator of its operator class, so the L2 index would go unused.
+--   OpenAI embeddings are unit length, so cosine and L2 rank clauses identically
+-- - maintenance_work_mem is raised for this transaction so the graph is built
+--   in memory; lower it on small servers
+--
+-- Rollback:
+--   CREATE INDEX IF NOT EXISTS ix_clauses_embedding_ivfflat ON clauses
+--       USING ivfflat (embedding vector_l2_ops) WITH (lists = 100);
+--   DROP INDEX IF EXISTS ix_clauses_embedding_hnsw;
+--   (and revert the Q&A query to l2_distance)
+
+BEGIN;
+
+SET LOCAL maintenance_work_mem = '2GB';
+
+CREATE INDEX IF NOT EXISTS ix_clauses_embedding_hnsw
+    ON clauses
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+DROP INDEX IF EXISTS ix_clauses_embedding_ivfflat;
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- SET enable_seqscan = off;
+-- EXPLAIN SELECT id FROM clauses ORDER BY embedding <=> (SELECT embedding FROM clauses
+-- WHERE embedding IS NOT NULL LIMIT 1) LIMIT 5;
+-- Expected: Limit -> Index Scan using ix_clauses_embedding_hnsw
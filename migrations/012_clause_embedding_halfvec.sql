@@ -0,0 +1,44 @@
+-- Migration: Store clause embeddings as halfvec (FP16)
+-- Date: 2026-10-16
+-- Description: Converts clauses.embedding from vector(1536) to halfvec(1536)
+--              and rebuilds the HNSW index with halfvec_cosine_ops
+--
+-- Background:
+-- - Cold similarity searches are bound by memory bandwidth; FP16 halves the
+--   bytes per vector in the heap and in the index (6 KB -> 3 KB per clause)
+--   with negligible recall loss for 1536-dimension text embeddings
+-- - The vector_cosine_ops index does not apply to halfvec, so it is dropped
+--   before the type change and rebuilt afterwards
+-- - Requires pgvector 0.7.0+ (ALTER EXTENSION vector UPDATE on older installs)
+-- - python -m app.db_init performs the same conversion automatically
+--
+-- Rollback:
+--   DROP INDEX IF EXISTS ix_clauses_embedding_hnsw;
+--   ALTER TABLE clauses ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536);
+--   CREATE INDEX ix_clauses_embedding_hnsw ON clauses
+--       USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+--   (values keep FP16 precision after the rollback)
+
+BEGIN;
+
+SET LOCAL maintenance_work_mem = '2GB';
+
+DROP INDEX IF EXISTS ix_clauses_embedding_hnsw;
+DROP INDEX IF EXISTS ix_clauses_embedding_ivfflat;
+
+ALTER TABLE clauses
+    ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+
+CREATE INDEX ix_clauses_embedding_hnsw
+    ON clauses
+    USING hnsw (embedding halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+-- WHERE attrelid = 'clauses'::regclass AND attname = 'embedding';
+-- Expected: halfvec(1536)
+-- SELECT pg_size_pretty(pg_relation_size('ix_clauses_embedding_hnsw'));
+-- Expected: roughly half the size before the migration
@@ -0,0 +1,51 @@
+-- Migration: Shorten embeddings to 768 dimensions
+-- Date: 2026-10-16
+-- Description: Converts clauses.embedding to halfvec(768) and
+--              embedding_cache.embedding to vector(768), keeping the first
+--              768 components of each text-embedding-3-small vector and
+--              re-normalizing to unit length
+--
+-- Background:
+-- - text-embedding-3 models are trained Matryoshka-style: a prefix of the
+--   vector, re-normalized, is what the API returns for `dimensions=768`, so
+--   stored vectors stay comparable with newly generated ones
+-- - 768 dimensions keep near-identical retrieval quality while halving heap
+--   and HNSW index size again (3 KB -> 1.5 KB per clause with halfvec), and
+--   each distance computation touches half the data
+-- - The HNSW index is dimension-specific, so it is dropped and rebuilt
+-- - Requires pgvector 0.7.0+ (subvector, l2_normalize); python -m app.db_init
+--   performs the same conversion automatically
+--
+-- Rollback:
+--   Not reversible in place (the dropped components are gone). Restore from
+--   backup, or re-embed all clauses at 1536 dimensions after reverting
+--   EMBEDDING_DIMENSIONS and the column types.
+
+BEGIN;
+
+SET LOCAL maintenance_work_mem = '2GB';
+
+DROP INDEX IF EXISTS ix_clauses_embedding_hnsw;
+DROP INDEX IF EXISTS ix_clauses_embedding_ivfflat;
+
+ALTER TABLE clauses
+    ALTER COLUMN embedding TYPE halfvec(768)
+    USING l2_normalize(subvector(embedding, 1, 768))::halfvec(768);
+
+ALTER TABLE embedding_cache
+    ALTER COLUMN embedding TYPE vector(768)
+    USING l2_normalize(subvector(embedding, 1, 768))::vector(768);
+
+CREATE INDEX ix_clauses_embedding_hnsw
+    ON clauses
+    USING hnsw (embedding halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+COMMIT;
+
+-- Verification query (run after migration):
+-- SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+-- WHERE attrelid IN ('clauses'::regclass, 'embedding_cache'::regclass) AND attname = 'embedding';
+-- Expected: halfvec(768), vector(768)
+-- SELECT l2_norm(embedding::vector) FROM clauses WHERE embedding IS NOT NULL LIMIT 5;
+-- Expected: values of ~1.0
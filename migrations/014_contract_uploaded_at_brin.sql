@@ -0,0 +1,29 @@
+-- Migration: Add BRIN index on contracts.uploaded_at
+-- Date: 2026-10-16
+-- Description: Adds ix_contracts_uploaded_at_brin so upload-time range
+--              filters skip heap ranges instead of scanning every contract
+--
+-- Background:
+-- - crud.get_contracts accepts uploaded_after / uploaded_before; without an
+--   index on uploaded_at every range filter is a sequential scan
+-- - Contracts are append-only and uploaded_at is set by server_default=now(),
+--   so physical row order follows upload time: a BRIN index (per-range
+--   min/max) prunes almost as well as a btree at a tiny fraction of the size
+-- - pages_per_range = 32 keeps ranges narrow enough for day-sized windows
+-- - Built CONCURRENTLY so uploads are not blocked; CREATE INDEX CONCURRENTLY
+--   cannot run inside a transaction block, so this migration has no
+--   BEGIN/COMMIT. If it is interrupted, drop the INVALID index and re-run
+--
+-- Rollback:
+--   DROP INDEX CONCURRENTLY IF EXISTS ix_contracts_uploaded_at_brin;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_contracts_uploaded_at_brin
+    ON contracts USING brin (uploaded_at)
+    WITH (pages_per_range = 32);
+
+-- Verification query (run after migration):
+-- SELECT indexrelid::regclass, indisvalid FROM pg_index
+-- WHERE indexrelid = 'ix_contracts_uploaded_at_brin'::regclass;
+-- Expected: one row with indisvalid = true
+-- EXPLAIN SELECT * FROM contracts WHERE uploaded_at >= now() - interval '7 days';
+-- Expected (on a large table): Bitmap Index Scan on ix_contracts_uploaded_at_brin
@@ -0,0 +1,50 @@
+-- Migration: Rebuild the clause embedding index with halfvec_ip_ops (inner product)
+-- Date: 2026-10-16
+-- Description: Replaces the halfvec_cosine_ops HNSW index with one using
+--              halfvec_ip_ops, matching the Q&A similarity query (<#>)
+--
+-- Background:
+-- - Embeddings are unit length: text-embedding-3 returns normalized vectors,
+--   migration 013 re-normalized truncated ones, and app.services.embeddings
+--   now normalizes every vector it returns
+-- - For unit vectors, negative inner product ranks exactly like cosine
+--   distance, but pgvector computes only the dot product (no per-candidate
+--   norms or division) during index traversal and re-ranking
+-- - An index only serves the operator of its operator class, so the cosine
+--   index would go unused by the <#> query
+-- - The new index is built CONCURRENTLY under a temporary name, so clause
+--   inserts are not blocked and the old index serves searches until the new
+--   one is valid. CONCURRENTLY cannot run inside a transaction block, so this
+--   migration has no BEGIN/COMMIT. If it is interrupted, drop the INVALID
+--   ix_clauses_embedding_hnsw_ip and re-run
+-- - maintenance_work_mem is raised for this session so the graph is built in
+--   memory; lower it on small servers
+--
+-- Rollback:
+--   CREATE INDEX CONCURRENTLY ix_clauses_embedding_hnsw_cos ON clauses
+--       USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64);
+--   DROP INDEX CONCURRENTLY IF EXISTS ix_clauses_embedding_hnsw;
+--   ALTER INDEX ix_clauses_embedding_hnsw_cos RENAME TO ix_clauses_embedding_hnsw;
+--   (and revert the Q&A query to cosine_distance)
+
+SET maintenance_work_mem = '2GB';
+SET statement_timeout = 0;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_clauses_embedding_hnsw_ip
+    ON clauses
+    USING hnsw (embedding halfvec_ip_ops)
+    WITH (m = 16, ef_construction = 64);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_clauses_embedding_hnsw;
+DROP INDEX CONCURRENTLY IF EXISTS ix_clauses_embedding_ivfflat;
+
+ALTER INDEX ix_clauses_embedding_hnsw_ip RENAME TO ix_clauses_embedding_hnsw;
+
+RESET maintenance_work_mem;
+RESET statement_timeout;
+
+-- Verification query (run after migration):
+-- SET enable_seqscan = off;
+-- EXPLAIN SELECT id FROM clauses ORDER BY embedding <#> (SELECT embedding FROM clauses
+-- WHERE embedding IS NOT NULL LIMIT 1) LIMIT 5;
+-- Expected: Limit -> Index Scan using ix_clauses_embedding_hnsw
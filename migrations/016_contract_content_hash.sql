@@ -0,0 +1,39 @@
+-- Migration: Add contracts.content_hash
+-- Date: 2026-10-16
+-- Description: Stores a BLAKE2b digest of each contract's text so a re-upload
+--              of identical text can be answered from the stored clauses and
+--              entities instead of being segmented and extracted again
+--
+-- Background:
+-- - /contracts/segment runs segmentation and an LLM entity extraction call for
+--   every upload, even when the same document was already processed
+-- - crud.create_contract now sets content_hash (32-byte BLAKE2b digest, same
+--   scheme as embedding_cache.text_hash); crud.get_completed_contract_by_hash
+--   looks up the newest 'completed' contract with that hash
+-- - The index is not UNIQUE: failed or partially failed uploads of the same
+--   text are retried as new contracts
+-- - No backfill: PostgreSQL has no built-in BLAKE2b, so existing contracts
+--   keep NULL and are simply never matched
+-- - The column is added in a short transaction (nullable, no default, so no
+--   table rewrite); the index is then built CONCURRENTLY, which cannot run
+--   inside a transaction block. If the index build is interrupted, drop the
+--   INVALID index and re-run that statement
+--
+-- Rollback:
+--   DROP INDEX CONCURRENTLY IF EXISTS ix_contracts_content_hash;
+--   ALTER TABLE contracts DROP COLUMN IF EXISTS content_hash;
+
+BEGIN;
+
+ALTER TABLE contracts
+    ADD COLUMN IF NOT EXISTS content_hash BYTEA;
+
+COMMIT;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_contracts_content_hash
+    ON contracts (content_hash);
+
+-- Verification query (run after migration):
+-- SELECT indexrelid::regclass, indisvalid FROM pg_index
+-- WHERE indexrelid = 'ix_contracts_content_hash'::regclass;
+-- Expected: one row with indisvalid = true